@@ -1,19 +1,30 @@
 """Response‑Automation Flask app.
 Endpoints:
-  /restart-service      → restarts a demo container
-  /scale-service        → scales demo service to N replicas (best‑effort)
-  /cleanup-prometheus   → deletes TSDB blocks
+    /restart-service     -> restarts a demo service's containers, in parallel or
+                            rolling ("mode", "batch_size" in the payload)
+    /scale-service       -> scales demo service to N replicas through the Docker API
+    /cleanup-prometheus  -> deletes TSDB blocks
+    /jobs, /jobs/<id>    -> status of remediation jobs
+
+The remediation endpoints answer 202 with a job id straight away and run the
+action in the background; poll /jobs/<id> for its result. A request identical
+to one in flight shares its job, and a restart within RESTART_COOLDOWN_SECONDS
+of a successful restart of the same service is suppressed.
 """
 import os
-from typing import Tuple
+import time
+from typing import List, Tuple
 
 from flask import Flask, request, jsonify
 from rich import print
-import subprocess
 
 # Docker python SDK
 import docker
-from tenacity import retry, stop_after_attempt, wait_fixed
+
+from .container_index import ContainerIndex, own_project
+from .jobs import COALESCED, SUPPRESSED, JobQueueFull, JobRunner, JobStore
+from .restarts import MODES, RestartEngine
+from .scaling import Scaler
 
 from opentelemetry.instrumentation.flask import FlaskInstrumentor
 from opentelemetry.sdk.resources import Resource
@@ -56,40 +67,96 @@ FlaskInstrumentor().instrument_app(app)
 # -----------------------------
 
 client = docker.DockerClient(base_url="unix://var/run/docker.sock")
+# Only touch the containers of our own compose project
+COMPOSE_PROJECT = os.getenv("COMPOSE_PROJECT_NAME") or own_project(client)
+container_index = ContainerIndex(client, project=COMPOSE_PROJECT)
+container_index.start()
+restart_engine = RestartEngine(
+    max_workers=int(os.getenv("RESTART_WORKERS", "8")),
+    health_timeout=float(os.getenv("RESTART_HEALTH_TIMEOUT_SECONDS", "60")),
+)
+scaler = Scaler(client, project=COMPOSE_PROJECT, max_workers=int(os.getenv("SCALE_WORKERS", "8")))
+RESTART_MODE = os.getenv("RESTART_MODE", "parallel")
+RESTART_BATCH_SIZE = int(os.getenv("RESTART_BATCH_SIZE", "1"))
+job_store = JobStore(max_jobs=int(os.getenv("JOBS_MAX_STORED", "1000")))
+job_runner = JobRunner(
+    job_store,
+    max_workers=int(os.getenv("JOBS_WORKERS", "4")),
+    max_pending=int(os.getenv("JOBS_MAX_PENDING", "100")),
+    meter=metrics.get_meter("response-automation"),
+)
+RESTART_COOLDOWN_SECONDS = float(os.getenv("RESTART_COOLDOWN_SECONDS", "60"))
 
 # ────────────────────────────────────────────────────────────────
 # helpers
 # ────────────────────────────────────────────────────────────────
 
 def _find_containers(service_name: str):
-    """Return all containers of a compose service (name starts with service)."""
-    return [c for c in client.containers.list(all=True) if c.name.startswith(service_name)]
+    """Return all containers of a compose service (by its service label)."""
+    return container_index.lookup(service_name)
 
-@retry(stop=stop_after_attempt(5), wait=wait_fixed(2))
-def _restart_service(service: str) -> Tuple[bool, str]:
+def _restart_service(
+    service: str, mode: str = RESTART_MODE, batch_size: int = RESTART_BATCH_SIZE,
+) -> Tuple[bool, str, List[dict]]:
+    """Restart a service's containers; each container is retried on its own."""
     containers = _find_containers(service)
     if not containers:
-        return False, f"Service {service} not found"
-    for cont in containers:
-        print(f"[yellow]Restarting {cont.name}…[/]")
-        cont.restart(timeout=10)
-    return True, f"Restarted {len(containers)} container(s) for {service}"
+        return False, f"Service {service} not found", []
+    results = restart_engine.restart(containers, mode, batch_size)
+    restarted = sum(r.ok for r in results)
+    if restarted < len(results):
+        msg = f"Restarted {restarted} of {len(results)} container(s) for {service}"
+    else:
+        msg = f"Restarted {len(containers)} container(s) for {service}"
+    return restarted == len(results), msg, [r.to_dict() for r in results]
+
+
+def _scale_service(service: str, replicas: int) -> Tuple[bool, str, dict]:
+    """Scale through the Docker API by cloning or removing replicas."""
+    print(f"[cyan]Scaling {service} to {replicas} replicas...[/]")
+    try:
+        result = scaler.scale(service, replicas)
+    except LookupError as exc:
+        return False, str(exc), {}
+    if not result.created and not result.removed and result.ok:
+        msg = f"{service} already has {replicas} replica(s)"
+    elif result.ok:
+        msg = f"Scaled {service} from {result.before} to {replicas} replica(s)"
+    else:
+        msg = f"Scaling {service} to {replicas} replica(s) failed for {len(result.errors)} container(s)"
+    return result.ok, msg, result.to_dict()
+
+
+def _cleanup_prometheus() -> Tuple[bool, int]:
+    prometheus_url = os.getenv("PROMETHEUS_URL", "http://prometheus:9090")
+    import requests
+    resp = requests.post(
+        f"{prometheus_url}/api/v1/admin/tsdb/delete_series",
+        params={"match[]": "{__name__=~'.+'}"},
+    )
+    print(f"[blue]Prometheus cleanup status {resp.status_code}")
+    return resp.ok, resp.status_code
+
 
+def _submit(action: str, params: dict, fn, key=None, cooldown: float = 0.0):
+    """Queue a remediation job and answer 202 with its id.
 
-def _scale_service(service: str, replicas: int) -> Tuple[bool, str]:
-    """Best‑effort scaling using docker compose CLI.
-    Requires docker CLI & compose v2 available in the host namespace mounted
-    into this container (common when /usr/bin/docker is shared).
+    A request identical to a job in flight gets that job's id; one within
+    the cooldown after it succeeded gets 200 and that job's id.
     """
-    if replicas < 1:
-        return False, "replicas must be >= 1"
     try:
-        print(f"[cyan]Scaling {service} to {replicas} replicas…[/]")
-        # Note: docker compose v2 syntax; using subprocess as Compose is not in SDK
-        subprocess.check_call(["docker", "compose", "up", "-d", "--scale", f"{service}={replicas}"])
-        return True, "Scale command issued"
-    except subprocess.CalledProcessError as exc:
-        return False, f"Compose scale failed: {exc}"
+        job, outcome = job_runner.submit(action, params, fn, key, cooldown)
+    except JobQueueFull as exc:
+        return jsonify({"error": f"Too many remediation jobs queued: {exc}"}), 503
+    body = {"job_id": job.id, "status_url": f"/jobs/{job.id}"}
+    if outcome == SUPPRESSED:
+        body["suppressed"] = True
+        ago = time.monotonic() - job.finished_monotonic
+        body["message"] = f"{action} ran {ago:.0f}s ago, cooldown is {cooldown:g}s"
+        return jsonify(body), 200
+    if outcome == COALESCED:
+        body["coalesced"] = True
+    return jsonify(body), 202, {"Location": f"/jobs/{job.id}"}
 
 # ────────────────────────────────────────────────────────────────
 # routes
@@ -105,9 +172,25 @@ def restart_service():
     service = payload.get("component") or payload.get("service") or payload.get("service_name")
     if not service:
         return jsonify({"error": "No service name in payload"}), 400
-
-    ok, msg = _restart_service(service)
-    return jsonify({"message": msg}), 200 if ok else 500
+    mode = payload.get("mode", RESTART_MODE)
+    if mode not in MODES:
+        return jsonify({"error": f"mode must be one of {', '.join(MODES)}"}), 400
+    try:
+        batch_size = int(payload.get("batch_size", RESTART_BATCH_SIZE))
+    except (TypeError, ValueError):
+        batch_size = 0
+    if batch_size < 1:
+        return jsonify({"error": "batch_size must be an integer >= 1"}), 400
+
+    def run():
+        ok, msg, results = _restart_service(service, mode, batch_size)
+        return ok, {"message": msg, "containers": results}
+    # The key leaves out mode and batch_size on purpose: they only change how
+    # the containers are restarted, and a restart in another mode while one is
+    # in flight or cooling down would restart the same containers again
+    params = {"service": service, "mode": mode, "batch_size": batch_size}
+    return _submit(
+        "restart-service", params, run, key=("restart-service", service), cooldown=RESTART_COOLDOWN_SECONDS)
 
 @app.route("/scale-service", methods=["POST"])
 def scale_service():
@@ -116,19 +199,38 @@ def scale_service():
     replicas = int(data.get("replicas", 2))
     if not service:
         return jsonify({"error": "service field required"}), 400
-    ok, msg = _scale_service(service, replicas)
-    return jsonify({"message": msg}), 200 if ok else 500
+    if replicas < 1:
+        return jsonify({"error": "replicas must be >= 1"}), 400
+    def run():
+        ok, msg, details = _scale_service(service, replicas)
+        return ok, dict(details, message=msg)
+    params = {"service": service, "replicas": replicas}
+    return _submit("scale-service", params, run, key=("scale-service", service, replicas))
 
 @app.route("/cleanup-prometheus", methods=["POST"])
 def cleanup_prometheus():
-    prometheus_url = os.getenv("PROMETHEUS_URL", "http://prometheus:9090")
-    import requests
-    resp = requests.post(
-        f"{prometheus_url}/api/v1/admin/tsdb/delete_series",
-        params={"match[]": "{__name__=~'.+'}"},
-    )
-    print(f"[blue]Prometheus cleanup status {resp.status_code}")
-    return jsonify({"status": resp.status_code}), resp.status_code
+    def run():
+        ok, status = _cleanup_prometheus()
+        return ok, {"status": status}
+    return _submit("cleanup-prometheus", {}, run, key=("cleanup-prometheus",))
+
+@app.route("/jobs", methods=["GET"])
+def list_jobs():
+    state = request.args.get("state")
+    try:
+        limit = int(request.args.get("limit", 100))
+    except ValueError:
+        limit = -1
+    if limit < 0:
+        return jsonify({"error": "limit must be an integer >= 0"}), 400
+    return jsonify({"jobs": [job.to_dict() for job in job_store.list(state, limit)]}), 200
+
+@app.route("/jobs/<job_id>", methods=["GET"])
+def get_job(job_id):
+    job = job_store.get(job_id)
+    if job is None:
+        return jsonify({"error": f"Job {job_id} not found"}), 404
+    return jsonify(job.to_dict()), 200
 
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=5000)
\ No newline at end of file
@@ -0,0 +1,138 @@
+"""Index of the host's containers by compose service, kept current from
+the Docker events stream.
+
+Looking up a service is a dict lookup instead of listing (and inspecting)
+every container on the host. While the events stream is down the index is
+not trusted and lookups fall back to a label-filtered list call.
+
+With a compose project, only that project's containers are indexed, so a
+service of another project on the same host, with the same name, is never
+restarted or scaled by mistake.
+"""
+import socket
+import threading
+from typing import Dict, List, Optional
+
+import docker
+from docker.models.containers import Container
+from rich import print
+
+SERVICE_LABEL = "com.docker.compose.service"
+PROJECT_LABEL = "com.docker.compose.project"
+
+
+def own_project(client: docker.DockerClient) -> Optional[str]:
+    """The compose project of the container this process runs in, if any.
+
+    A container's hostname is its short id unless the compose file sets one.
+    """
+    try:
+        return client.api.inspect_container(socket.gethostname())["Config"]["Labels"].get(PROJECT_LABEL)
+    except Exception:
+        return None
+
+
+class ContainerIndex:
+    """Compose service -> containers (running or not) of that service."""
+
+    def __init__(self, client: docker.DockerClient, project: Optional[str] = None, reconnect_seconds: float = 2.0):
+        self.client = client
+        self.project = project
+        self.reconnect_seconds = reconnect_seconds
+        # service -> {container id: name}; the inner dicts are replaced, never
+        # mutated, so lookups read them without the lock
+        self._services: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stopped = threading.Event()
+        self._events = None
+        self._thread = None
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="container-index", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._events is not None:
+            self._events.close()
+
+    def wait_ready(self, timeout: float = None) -> bool:
+        return self._ready.wait(timeout)
+
+    def lookup(self, service: str) -> List[Container]:
+        """Containers of a compose service, without inspecting them."""
+        if self.ready:
+            containers = self._services.get(service)
+            if containers:
+                return [self._container(cid, name) for cid, name in containers.items()]
+        # Not synced, or a container created before its event arrived
+        return [self._container(c["Id"], c["Names"][0]) for c in self._list({SERVICE_LABEL: service})]
+
+    # -- sync ---------------------------------------------------------
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                # Subscribe before listing so that no change falls in between;
+                # replaying an event the list already reflects is harmless
+                # Label filters of the events endpoint match any of the
+                # labels, so _apply() checks the project itself
+                label = f"{PROJECT_LABEL}={self.project}" if self.project else SERVICE_LABEL
+                self._events = self.client.events(decode=True, filters={"type": "container", "label": label})
+                self._sync()
+                for event in self._events:
+                    self._apply(event)
+            except Exception as exc:
+                if not self._stopped.is_set():
+                    print(f"[red]Container index: events stream failed, resyncing: {exc}[/]")
+            finally:
+                self._ready.clear()
+                if self._events is not None:
+                    self._events.close()
+            self._stopped.wait(self.reconnect_seconds)
+
+    def _sync(self):
+        services: Dict[str, Dict[str, str]] = {}
+        for c in self._list(None):
+            services.setdefault(c["Labels"][SERVICE_LABEL], {})[c["Id"]] = c["Names"][0].lstrip("/")
+        with self._lock:
+            self._services = services
+        self._ready.set()
+        containers = sum(len(c) for c in services.values())
+        print(f"[green]Container index: {containers} containers in {len(services)} services[/]")
+
+    def _apply(self, event: dict):
+        action = event.get("Action", "")
+        actor = event.get("Actor", {})
+        cid, attributes = actor.get("ID"), actor.get("Attributes", {})
+        service = attributes.get(SERVICE_LABEL)
+        if not cid or not service or action not in ("create", "destroy", "rename"):
+            return
+        if self.project and attributes.get(PROJECT_LABEL) != self.project:
+            return
+        with self._lock:
+            containers = dict(self._services.get(service, {}))
+            if action == "destroy":
+                containers.pop(cid, None)
+            else:
+                containers[cid] = attributes.get("name", cid)
+            if containers:
+                self._services[service] = containers
+            else:
+                self._services.pop(service, None)
+
+    def _list(self, labels):
+        label_filter = [f"{k}={v}" for k, v in labels.items()] if labels else [SERVICE_LABEL]
+        # Label filters of the list endpoint must all match
+        if self.project:
+            label_filter.append(f"{PROJECT_LABEL}={self.project}")
+        # The raw list endpoint: containers.list() inspects every container
+        return self.client.api.containers(all=True, filters={"label": label_filter})
+
+    def _container(self, cid: str, name: str):
+        return self.client.containers.prepare_model({"Id": cid, "Name": "/" + name.lstrip("/")})
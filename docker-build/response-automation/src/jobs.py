@@ -0,0 +1,201 @@
+"""Remediation jobs: actions run on a bounded executor and are polled by id.
+
+The store keeps at most ``max_jobs`` jobs and evicts the ones that finished
+longest ago first; jobs that are queued or running are never evicted, and
+neither are jobs within their cooldown (see below), whose id is handed out
+to the suppressed submissions.
+
+Jobs submitted with a key are coalesced: while a job with the same key is
+queued or running, submitting another one returns that job instead, and for
+``cooldown`` seconds after it succeeded the submission is suppressed. The
+cooldown runs on the monotonic clock, so wall clock changes do not shorten
+or extend it.
+"""
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Hashable, List, Optional, Tuple
+
+from opentelemetry import context
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+# How submit() handled a job
+SUBMITTED = "submitted"
+COALESCED = "coalesced"
+SUPPRESSED = "suppressed"
+
+
+class JobQueueFull(Exception):
+    pass
+
+
+class Job:
+    __slots__ = ("id", "action", "params", "state", "result", "created", "started", "finished", "finished_monotonic")
+
+    def __init__(self, action: str, params: dict):
+        self.id = uuid.uuid4().hex
+        self.action = action
+        self.params = params
+        self.state = QUEUED
+        self.result = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.finished_monotonic = None
+
+    @property
+    def done(self) -> bool:
+        return self.state in (SUCCEEDED, FAILED)
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "action": self.action,
+            "params": self.params,
+            "state": self.state,
+            "result": self.result,
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+        }
+
+
+class JobStore:
+    def __init__(self, max_jobs: int = 1000):
+        self.max_jobs = max_jobs
+        self._jobs = OrderedDict()
+        # Ids of the finished jobs, in the order they finished
+        self._finished = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, job: Job):
+        with self._lock:
+            while len(self._jobs) >= self.max_jobs and self._finished:
+                job_id, _ = self._finished.popitem(last=False)
+                del self._jobs[job_id]
+            self._jobs[job.id] = job
+
+    def finish(self, job: Job):
+        """Make a job that is done evictable."""
+        with self._lock:
+            if job.id in self._jobs:
+                self._finished[job.id] = None
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def list(self, state: str = None, limit: int = 100) -> List[Job]:
+        """Most recent jobs first."""
+        with self._lock:
+            jobs = [j for j in reversed(self._jobs.values()) if state is None or j.state == state]
+        return jobs[:limit]
+
+
+class JobRunner:
+    """Runs actions on ``max_workers`` threads with at most ``max_pending`` jobs waiting."""
+
+    def __init__(self, store: JobStore, max_workers: int = 4, max_pending: int = 100, meter=None):
+        self.store = store
+        self.max_pending = max_pending
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._pending = 0
+        # key -> queued or running job, and key -> (last job that succeeded,
+        # end of its cooldown) in the order they succeeded
+        self._active = {}
+        self._succeeded = OrderedDict()
+        self._lock = threading.Lock()
+        self._coalesced = self._suppressed = None
+        if meter is not None:
+            self._coalesced = meter.create_counter(
+                "app_response_automation_jobs_coalesced",
+                description="Remediation requests that joined an identical job already in flight")
+            self._suppressed = meter.create_counter(
+                "app_response_automation_jobs_suppressed",
+                description="Remediation requests dropped within the cooldown after an identical job")
+
+    def submit(
+        self, action: str, params: dict, fn: Callable[[], Tuple[bool, dict]],
+        key: Hashable = None, cooldown: float = 0.0,
+    ) -> Tuple[Job, str]:
+        """Queue ``fn``, which returns (ok, result), or raise JobQueueFull.
+
+        Returns the job that handles the request and whether it was
+        SUBMITTED, COALESCED into a job in flight or SUPPRESSED by the
+        cooldown, in which case the job is the one that last succeeded.
+        """
+        with self._lock:
+            if key is not None:
+                active = self._active.get(key)
+                if active is not None:
+                    self._count(self._coalesced, action, params)
+                    return active, COALESCED
+                now = time.monotonic()
+                self._expire(now)
+                last, until = self._succeeded.get(key, (None, 0.0))
+                if last is not None and until > now:
+                    self._count(self._suppressed, action, params)
+                    return last, SUPPRESSED
+            if self._pending >= self.max_pending:
+                raise JobQueueFull(f"{self._pending} jobs already waiting")
+            self._pending += 1
+            job = Job(action, params)
+            if key is not None:
+                self._active[key] = job
+        self.store.add(job)
+        # Run in the submitting request's trace context
+        self.executor.submit(self._run, job, fn, key, cooldown, context.get_current())
+        return job, SUBMITTED
+
+    def _expire(self, now: float):
+        """Drop the succeeded jobs whose cooldown is over and make them evictable.
+
+        Only the oldest entries are checked, so with different cooldowns an
+        expired entry may stay until the ones before it expire; submit()
+        checks the end of the cooldown itself.
+        """
+        succeeded = self._succeeded
+        while succeeded:
+            key, (job, until) = next(iter(succeeded.items()))
+            if until > now:
+                break
+            del succeeded[key]
+            self.store.finish(job)
+
+    @staticmethod
+    def _count(counter, action: str, params: dict):
+        if counter is not None:
+            counter.add(1, {"action": action, "service": params.get("service", "")})
+
+    def _run(self, job: Job, fn, key, cooldown: float, ctx):
+        with self._lock:
+            self._pending -= 1
+        token = context.attach(ctx)
+        job.started = time.time()
+        job.state = RUNNING
+        try:
+            ok, job.result = fn()
+        except Exception as exc:
+            ok, job.result = False, {"error": str(exc)}
+        finally:
+            context.detach(token)
+        with self._lock:
+            job.finished = time.time()
+            job.finished_monotonic = time.monotonic()
+            job.state = SUCCEEDED if ok else FAILED
+            cooling_down = key is not None and ok and cooldown > 0
+            if key is not None:
+                del self._active[key]
+                previous = self._succeeded.pop(key, None)
+                if previous is not None:
+                    self.store.finish(previous[0])
+                if cooling_down:
+                    # Kept in the store until _expire() drops it
+                    self._succeeded[key] = (job, job.finished_monotonic + cooldown)
+        if not cooling_down:
+            self.store.finish(job)
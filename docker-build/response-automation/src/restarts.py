@@ -0,0 +1,106 @@
+"""Restart engine: restarts a service's containers in parallel, or rolls
+them in batches with a health gate in between.
+
+Each container is retried on its own, so a retry never restarts a container
+that already came back.
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import List, Optional
+
+from rich import print
+from tenacity import Retrying, stop_after_attempt, wait_fixed
+
+PARALLEL = "parallel"
+ROLLING = "rolling"
+MODES = (PARALLEL, ROLLING)
+
+
+@dataclass
+class RestartResult:
+    container: str
+    ok: bool
+    attempts: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class RestartEngine:
+    def __init__(
+        self, max_workers: int = 8, attempts: int = 5, retry_wait: float = 2.0,
+        stop_timeout: int = 10, health_timeout: float = 60.0, health_poll: float = 1.0,
+    ):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="restart")
+        self.attempts = attempts
+        self.retry_wait = retry_wait
+        self.stop_timeout = stop_timeout
+        self.health_timeout = health_timeout
+        self.health_poll = health_poll
+
+    def restart(self, containers, mode: str = PARALLEL, batch_size: int = 1) -> List[RestartResult]:
+        """Restart ``containers`` and return one result per container, in order.
+
+        ``parallel`` restarts all of them at once. ``rolling`` restarts
+        ``batch_size`` at a time and waits up to ``health_timeout`` for each
+        batch to be running, and healthy if it has a healthcheck, before the
+        next one; if a batch fails the rest are not touched.
+        """
+        if mode not in MODES:
+            raise ValueError(f'mode must be "parallel" or "rolling", got "{mode}"')
+        if mode == PARALLEL:
+            return list(self.executor.map(self._restart_one, containers))
+
+        results = []
+        batch_size = max(1, batch_size)
+        for start in range(0, len(containers), batch_size):
+            batch = containers[start:start + batch_size]
+            batch_results = list(self.executor.map(self._restart_one, batch))
+            # One deadline for the whole batch, not one per container
+            deadline = time.monotonic() + self.health_timeout
+            for cont, result in zip(batch, batch_results):
+                if result.ok and not self._wait_healthy(cont, deadline):
+                    result.ok = False
+                    result.error = f"not healthy after {self.health_timeout:g}s"
+            results.extend(batch_results)
+            if not all(r.ok for r in batch_results):
+                skipped = containers[start + batch_size:]
+                results.extend(RestartResult(c.name, False, error="skipped: an earlier batch failed") for c in skipped)
+                break
+        return results
+
+    def _restart_one(self, cont) -> RestartResult:
+        result = RestartResult(cont.name, False)
+        started = time.monotonic()
+        try:
+            retrying = Retrying(stop=stop_after_attempt(self.attempts), wait=wait_fixed(self.retry_wait), reraise=True)
+            for attempt in retrying:
+                with attempt:
+                    result.attempts = attempt.retry_state.attempt_number
+                    print(f"[yellow]Restarting {cont.name}...[/]")
+                    cont.restart(timeout=self.stop_timeout)
+            result.ok = True
+        except Exception as exc:
+            result.error = str(exc)
+        result.seconds = round(time.monotonic() - started, 3)
+        return result
+
+    def _wait_healthy(self, cont, deadline: float) -> bool:
+        """Poll ``cont`` until it is ready or the monotonic ``deadline`` passes."""
+        while True:
+            try:
+                cont.reload()
+                state = cont.attrs["State"]
+                health = state.get("Health")
+                if health is None and state.get("Running"):
+                    return True
+                if health is not None and health.get("Status") == "healthy":
+                    return True
+            except Exception as exc:
+                print(f"[red]Health check of {cont.name} failed: {exc}[/]")
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(self.health_poll)
@@ -0,0 +1,153 @@
+"""Scale a compose service with the Docker API instead of `docker compose up`.
+
+New replicas are clones of an existing one: same image, config, host config,
+labels and networks, with the next container numbers. Replicas that are not
+running are removed first, then running ones highest number first. Creating
+and removing run in parallel, and a service that already has the requested
+number of replicas is not touched.
+
+With a compose project, only that project's containers are counted, cloned
+and removed.
+"""
+import copy
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import List, Optional
+
+from rich import print
+
+from .container_index import PROJECT_LABEL, SERVICE_LABEL
+
+NUMBER_LABEL = "com.docker.compose.container-number"
+
+
+@dataclass
+class ScaleResult:
+    before: int
+    created: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+class Scaler:
+    def __init__(self, client, project: Optional[str] = None, max_workers: int = 8, stop_timeout: int = 10):
+        self.api = client.api
+        self.project = project
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scale")
+        self.stop_timeout = stop_timeout
+        # Scaling the same service twice at once would pick the same numbers
+        self._locks = defaultdict(threading.Lock)
+        self._locks_lock = threading.Lock()
+
+    def scale(self, service: str, replicas: int) -> ScaleResult:
+        """Create or remove containers of ``service`` until it has ``replicas``.
+
+        Raises LookupError if the service has no container to clone.
+        """
+        with self._locks_lock:
+            lock = self._locks[service]
+        with lock:
+            return self._scale(service, replicas)
+
+    def _scale(self, service: str, replicas: int) -> ScaleResult:
+        labels = [f"{SERVICE_LABEL}={service}"]
+        if self.project:
+            labels.append(f"{PROJECT_LABEL}={self.project}")
+        containers = self.api.containers(all=True, filters={"label": labels})
+        if not containers:
+            raise LookupError(f"Service {service} not found")
+        containers.sort(key=_number)
+        result = ScaleResult(before=len(containers))
+
+        if replicas > len(containers):
+            running = [c for c in containers if c["State"] == "running"] or containers
+            template = self.api.inspect_container(running[-1]["Id"])
+            first = _number(containers[-1]) + 1
+            numbers = range(first, first + replicas - len(containers))
+            outcomes = self.executor.map(lambda n: self._create(template, service, n), numbers)
+            for number, outcome in zip(numbers, outcomes):
+                if isinstance(outcome, Exception):
+                    result.errors.append(f"create #{number}: {outcome}")
+                else:
+                    result.created.append(outcome)
+        elif replicas < len(containers):
+            # Exited or never started replicas go before running ones
+            by_removal = sorted(containers, key=lambda c: (c["State"] == "running", -_number(c)))
+            surplus = by_removal[:len(containers) - replicas]
+            for cont, outcome in zip(surplus, self.executor.map(self._remove, surplus)):
+                name = cont["Names"][0].lstrip("/")
+                if isinstance(outcome, Exception):
+                    result.errors.append(f"remove {name}: {outcome}")
+                else:
+                    result.removed.append(name)
+        return result
+
+    def _create(self, template: dict, service: str, number: int):
+        config = copy.deepcopy(template["Config"])
+        config.pop("Hostname", None)
+        config["Labels"] = dict(config.get("Labels") or {}, **{NUMBER_LABEL: str(number)})
+        config["HostConfig"] = _host_config(template["HostConfig"])
+        project = config["Labels"].get(PROJECT_LABEL)
+        name = f"{project}-{service}-{number}" if project else f"{service}-{number}"
+        # Other network modes (host, container:...) are part of the host config
+        networks = list((template["NetworkSettings"].get("Networks") or {}).items())
+        if networks and config["HostConfig"].get("NetworkMode", "default") in (networks[0][0], "default"):
+            aliases = {network: _aliases(endpoint, template, service) for network, endpoint in networks}
+            config["NetworkingConfig"] = {"EndpointsConfig": {networks[0][0]: {"Aliases": aliases[networks[0][0]]}}}
+        else:
+            networks = []
+
+        cid = None
+        try:
+            print(f"[cyan]Creating {name}...[/]")
+            cid = self.api.create_container_from_config(config, name=name)["Id"]
+            for network, _ in networks[1:]:
+                self.api.connect_container_to_network(cid, network, aliases=aliases[network])
+            self.api.start(cid)
+            return name
+        except Exception as exc:
+            if cid is not None:
+                try:
+                    self.api.remove_container(cid, force=True)
+                except Exception:
+                    pass
+            return exc
+
+    def _remove(self, cont: dict):
+        try:
+            print(f"[cyan]Removing {cont['Names'][0].lstrip('/')}...[/]")
+            self.api.stop(cont["Id"], timeout=self.stop_timeout)
+            self.api.remove_container(cont["Id"])
+        except Exception as exc:
+            return exc
+
+
+def _number(cont: dict) -> int:
+    try:
+        return int(cont["Labels"].get(NUMBER_LABEL, 1))
+    except ValueError:
+        return 1
+
+
+def _host_config(host_config: dict) -> dict:
+    """The template's host config, with published ports on random host ports."""
+    host_config = copy.deepcopy(host_config)
+    for bindings in (host_config.get("PortBindings") or {}).values():
+        for binding in bindings or []:
+            binding["HostPort"] = ""
+    return host_config
+
+
+def _aliases(endpoint: dict, template: dict, service: str) -> List[str]:
+    """The template's aliases on a network, without the ones naming the template itself."""
+    own = {template["Id"][:12], template["Name"].lstrip("/")}
+    return [a for a in endpoint.get("Aliases") or [] if a not in own] or [service]
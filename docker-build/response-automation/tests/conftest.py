@@ -0,0 +1,6 @@
+import os
+import sys
+
+# The app is the `src` package, run as `python -m src.app` from this
+# directory's parent inside the container
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,134 @@
+import os
+import threading
+import time
+from unittest import mock
+
+import docker
+import pytest
+
+from src.jobs import FAILED, SUCCEEDED, Job, JobRunner, JobStore
+
+
+class FakeDockerApi:
+    def containers(self, all=False, filters=None):
+        return []
+
+    def inspect_container(self, cid):
+        raise docker.errors.NotFound(f"No such container: {cid}")
+
+
+class FakeEvents:
+    def __init__(self):
+        self._closed = threading.Event()
+
+    def __iter__(self):
+        self._closed.wait()
+        return iter(())
+
+    def close(self):
+        self._closed.set()
+
+
+class FakeClient:
+    """Stands in for the Docker daemon while the app module is imported."""
+
+    def __init__(self, base_url=None, **kwargs):
+        self.api = FakeDockerApi()
+
+    def events(self, decode=False, filters=None):
+        return FakeEvents()
+
+
+@pytest.fixture(scope="module")
+def app_module():
+    with mock.patch.dict(os.environ, {"OTEL_SDK_DISABLED": "true"}), mock.patch("docker.DockerClient", FakeClient):
+        from src import app
+    yield app
+    app.container_index.stop()
+
+
+@pytest.fixture
+def client(app_module):
+    return app_module.app.test_client()
+
+
+@pytest.mark.parametrize("batch_size", [0, -1, "two", None, [2]])
+def test_restart_rejects_bad_batch_sizes(client, app_module, batch_size):
+    with mock.patch.object(app_module.job_runner, "submit") as submit:
+        response = client.post("/restart-service", json={"service": "cart", "batch_size": batch_size})
+
+    assert response.status_code == 400
+    assert response.json == {"error": "batch_size must be an integer >= 1"}
+    submit.assert_not_called()
+
+
+def test_restart_accepts_a_batch_size(client, app_module):
+    with mock.patch.object(app_module, "_submit", return_value=("", 202)) as submit:
+        response = client.post("/restart-service", json={"service": "cart", "mode": "rolling", "batch_size": "3"})
+
+    assert response.status_code == 202
+    assert submit.call_args.args[1] == {"service": "cart", "mode": "rolling", "batch_size": 3}
+
+
+def test_full_job_queue_is_503(client, app_module, monkeypatch):
+    runner = JobRunner(JobStore(), max_workers=1, max_pending=0)
+    monkeypatch.setattr(app_module, "job_runner", runner)
+
+    response = client.post("/restart-service", json={"service": "cart"})
+
+    assert response.status_code == 503
+    assert response.json["error"].startswith("Too many remediation jobs queued")
+
+
+def test_jobs_are_filtered_by_state_and_limited(client, app_module, monkeypatch):
+    store = JobStore()
+    jobs = [Job("restart-service", {"service": f"s{i}"}) for i in range(4)]
+    for job, state in zip(jobs, [SUCCEEDED, FAILED, SUCCEEDED, SUCCEEDED]):
+        job.state = state
+        store.add(job)
+    monkeypatch.setattr(app_module, "job_store", store)
+
+    def ids(query):
+        return [job["id"] for job in client.get(f"/jobs{query}").json["jobs"]]
+
+    assert ids("") == [jobs[3].id, jobs[2].id, jobs[1].id, jobs[0].id]
+    assert ids("?state=succeeded") == [jobs[3].id, jobs[2].id, jobs[0].id]
+    assert ids("?state=succeeded&limit=2") == [jobs[3].id, jobs[2].id]
+    assert ids("?state=failed") == [jobs[1].id]
+    assert client.get(f"/jobs/{jobs[1].id}").json["state"] == FAILED
+    assert client.get("/jobs/unknown").status_code == 404
+
+
+@pytest.mark.parametrize("limit", ["-1", "two", "1.5", ""])
+def test_jobs_rejects_bad_limits(client, limit):
+    response = client.get(f"/jobs?limit={limit}")
+
+    assert response.status_code == 400
+    assert response.json == {"error": "limit must be an integer >= 0"}
+
+
+def test_repeated_restarts_are_coalesced_then_suppressed(client, app_module, monkeypatch):
+    monkeypatch.setattr(app_module, "job_runner", JobRunner(JobStore(), max_workers=1))
+    release = threading.Event()
+
+    def restart_service(service, mode, batch_size):
+        assert release.wait(2)
+        return True, f"Restarted 1 container(s) for {service}", []
+    monkeypatch.setattr(app_module, "_restart_service", restart_service)
+
+    first = client.post("/restart-service", json={"service": "cart"})
+    # Another mode restarts the same containers, so it joins the same job
+    joined = client.post("/restart-service", json={"service": "cart", "mode": "rolling"})
+    assert (first.status_code, joined.status_code) == (202, 202)
+    assert joined.json == dict(first.json, coalesced=True)
+
+    release.set()
+    job = app_module.job_runner.store.get(first.json["job_id"])
+    deadline = time.monotonic() + 2
+    while not job.done and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+    suppressed = client.post("/restart-service", json={"service": "cart"})
+    assert suppressed.status_code == 200
+    assert suppressed.json["job_id"] == job.id and suppressed.json["suppressed"]
+    assert suppressed.json["message"] == "restart-service ran 0s ago, cooldown is 60s"
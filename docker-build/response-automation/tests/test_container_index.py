@@ -0,0 +1,198 @@
+import queue
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.container_index import PROJECT_LABEL, SERVICE_LABEL, ContainerIndex, own_project
+
+
+class FakeEvents:
+    """A Docker events stream fed from the test; iteration blocks until an event or close()."""
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self.closed = False
+
+    def push(self, event):
+        self._queue.put(event)
+
+    def fail(self):
+        self._queue.put(RuntimeError("connection reset"))
+
+    def close(self):
+        self.closed = True
+        self._queue.put(None)
+
+    def __iter__(self):
+        while True:
+            event = self._queue.get()
+            if event is None:
+                return
+            if isinstance(event, Exception):
+                raise event
+            yield event
+
+
+class FakeDockerApi:
+    def __init__(self):
+        self.host = []
+        self.list_calls = []
+
+    def add(self, cid, service, project="demo"):
+        self.host.append({
+            "Id": cid, "Names": [f"/{project}-{service}-{cid}"],
+            "Labels": {SERVICE_LABEL: service, PROJECT_LABEL: project},
+        })
+
+    def containers(self, all=False, filters=None):
+        self.list_calls.append(filters["label"])
+        wanted = [label.partition("=") for label in filters["label"]]
+        return [c for c in self.host if _matches(c["Labels"], wanted)]
+
+    def inspect_container(self, cid):
+        if cid != "own-host":
+            raise RuntimeError(f"No such container: {cid}")
+        return {"Config": {"Labels": {PROJECT_LABEL: "demo"}}}
+
+
+def _matches(labels, wanted):
+    return all(key in labels and (not sep or labels[key] == value) for key, sep, value in wanted)
+
+
+class FakeClient:
+    def __init__(self):
+        self.api = FakeDockerApi()
+        self.streams = queue.Queue()
+        self.event_filters = []
+        self.containers = SimpleNamespace(
+            prepare_model=lambda attrs: SimpleNamespace(id=attrs["Id"], name=attrs["Name"].lstrip("/")))
+
+    def events(self, decode=False, filters=None):
+        self.event_filters.append(filters)
+        stream = FakeEvents()
+        self.streams.put(stream)
+        return stream
+
+
+def event(action, cid, service, project="demo", name=None):
+    attributes = {SERVICE_LABEL: service, PROJECT_LABEL: project, "name": name or f"{project}-{service}-{cid}"}
+    return {"Type": "container", "Action": action, "Actor": {"ID": cid, "Attributes": attributes}}
+
+
+def names(containers):
+    return sorted(c.name for c in containers)
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def client():
+    client = FakeClient()
+    client.api.add("c1", "cart")
+    client.api.add("c2", "cart")
+    client.api.add("c3", "frontend")
+    client.api.add("x1", "cart", project="other")
+    return client
+
+
+def test_sync_indexes_the_project_containers_by_service(client):
+    index = ContainerIndex(client, project="demo")
+    index._sync()
+
+    assert index.ready
+    assert {service: sorted(c) for service, c in index._services.items()} == {
+        "cart": ["c1", "c2"], "frontend": ["c3"]}
+    assert client.api.list_calls == [[SERVICE_LABEL, f"{PROJECT_LABEL}=demo"]]
+
+
+def test_lookup_reads_the_index_once_synced(client):
+    index = ContainerIndex(client, project="demo")
+    index._sync()
+    client.api.list_calls.clear()
+
+    assert names(index.lookup("cart")) == ["demo-cart-c1", "demo-cart-c2"]
+    assert client.api.list_calls == []
+
+
+def test_lookup_falls_back_to_a_filtered_list(client):
+    index = ContainerIndex(client, project="demo")
+
+    # Not synced yet
+    assert names(index.lookup("cart")) == ["demo-cart-c1", "demo-cart-c2"]
+    # Synced, but created before its event arrived
+    index._sync()
+    client.api.add("c4", "checkout")
+    assert names(index.lookup("checkout")) == ["demo-checkout-c4"]
+    assert client.api.list_calls[-1] == [f"{SERVICE_LABEL}=checkout", f"{PROJECT_LABEL}=demo"]
+
+
+def test_without_a_project_every_project_is_indexed(client):
+    index = ContainerIndex(client)
+    index._sync()
+
+    assert sorted(index._services["cart"]) == ["c1", "c2", "x1"]
+
+
+def test_apply_creates_renames_and_destroys(client):
+    index = ContainerIndex(client, project="demo")
+    index._sync()
+    before = index._services["cart"]
+
+    index._apply(event("create", "c4", "cart"))
+    index._apply(event("rename", "c1", "cart", name="demo-cart-renamed"))
+    index._apply(event("destroy", "c2", "cart"))
+    index._apply(event("destroy", "c3", "frontend"))
+
+    assert index._services == {"cart": {"c1": "demo-cart-renamed", "c4": "demo-cart-c4"}}
+    # Readers holding the old dict see it unchanged
+    assert sorted(before) == ["c1", "c2"]
+
+
+def test_apply_ignores_other_projects_and_actions(client):
+    index = ContainerIndex(client, project="demo")
+    index._sync()
+    services = dict(index._services)
+
+    index._apply(event("create", "x2", "cart", project="other"))
+    index._apply(event("start", "c4", "cart"))
+    index._apply(event("die", "c1", "cart"))
+    index._apply({"Action": "create", "Actor": {"ID": "c5", "Attributes": {}}})
+
+    assert index._services == services
+
+
+def test_events_stream_keeps_the_index_current_and_resyncs_after_a_failure(client):
+    index = ContainerIndex(client, project="demo", reconnect_seconds=0.01)
+    index.start()
+    try:
+        stream = client.streams.get(timeout=2)
+        assert index.wait_ready(2)
+        assert client.event_filters[0] == {"type": "container", "label": f"{PROJECT_LABEL}=demo"}
+
+        client.api.add("c4", "cart")
+        stream.push(event("create", "c4", "cart"))
+        wait_for(lambda: "c4" in index._services.get("cart", {}))
+
+        # Changes while the stream is down are picked up by the resync
+        client.api.host = [c for c in client.api.host if c["Id"] != "c3"]
+        stream.fail()
+        client.streams.get(timeout=2)
+        wait_for(lambda: index.ready and "frontend" not in index._services)
+        assert stream.closed
+        assert sorted(index._services["cart"]) == ["c1", "c2", "c4"]
+    finally:
+        index.stop()
+
+
+def test_own_project(client, monkeypatch):
+    monkeypatch.setattr("socket.gethostname", lambda: "own-host")
+    assert own_project(client) == "demo"
+
+    monkeypatch.setattr("socket.gethostname", lambda: "not-a-container")
+    assert own_project(client) is None
@@ -0,0 +1,239 @@
+import threading
+import time
+
+import pytest
+
+from src.jobs import (
+    COALESCED, FAILED, QUEUED, RUNNING, SUBMITTED, SUCCEEDED, SUPPRESSED, Job, JobQueueFull, JobRunner, JobStore,
+)
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+class Action:
+    """A job function that blocks until released and then returns ``outcome``."""
+
+    def __init__(self, outcome=(True, {"message": "done"})):
+        self.outcome = outcome
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self):
+        self.started.set()
+        assert self.release.wait(2)
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        return self.outcome
+
+
+@pytest.fixture
+def runner():
+    runner = JobRunner(JobStore(), max_workers=1, max_pending=2)
+    yield runner
+    runner.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def test_job_goes_from_queued_to_running_to_succeeded(runner):
+    first, second = Action(), Action()
+    job, _ = runner.submit("restart-service", {"service": "cart"}, first)
+    queued, _ = runner.submit("restart-service", {"service": "frontend"}, second)
+
+    assert first.started.wait(2)
+    assert (job.state, queued.state) == (RUNNING, QUEUED)
+    assert job.started is not None and queued.started is None
+
+    first.release.set()
+    second.release.set()
+    wait_for(lambda: queued.done)
+    assert (job.state, job.result) == (SUCCEEDED, {"message": "done"})
+    assert job.created <= job.started <= job.finished
+    assert queued.state == SUCCEEDED
+
+
+@pytest.mark.parametrize("outcome, result", [
+    ((False, {"message": "Service cart not found"}), {"message": "Service cart not found"}),
+    (RuntimeError("socket closed"), {"error": "socket closed"}),
+])
+def test_failed_jobs(runner, outcome, result):
+    action = Action(outcome)
+    action.release.set()
+    job, _ = runner.submit("restart-service", {"service": "cart"}, action)
+
+    wait_for(lambda: job.done)
+    assert (job.state, job.result) == (FAILED, result)
+
+
+def test_full_queue_raises(runner):
+    actions = [Action() for _ in range(4)]
+    runner.submit("a", {}, actions[0])
+    assert actions[0].started.wait(2)
+    runner.submit("a", {}, actions[1])
+    runner.submit("a", {}, actions[2])
+
+    with pytest.raises(JobQueueFull, match="2 jobs already waiting"):
+        runner.submit("a", {}, actions[3])
+
+    # The queue has room again once a job starts
+    actions[0].release.set()
+    assert actions[1].started.wait(2)
+    runner.submit("a", {}, actions[3])
+    for action in actions:
+        action.release.set()
+
+
+def test_store_evicts_the_jobs_that_finished_first():
+    store = JobStore(max_jobs=3)
+    jobs = [Job("a", {}) for _ in range(3)]
+    for job in jobs:
+        store.add(job)
+    store.finish(jobs[2])
+    store.finish(jobs[0])
+
+    store.add(Job("a", {}))
+    assert store.get(jobs[2].id) is None
+    assert store.get(jobs[0].id) is jobs[0]
+
+    store.add(Job("a", {}))
+    assert store.get(jobs[0].id) is None
+    # Queued and running jobs are kept even when the store is over its size
+    extra = Job("a", {})
+    store.add(extra)
+    assert len(store.list(limit=10)) == 4
+    assert store.get(jobs[1].id) is jobs[1]
+
+
+def test_runner_makes_finished_jobs_evictable():
+    store = JobStore(max_jobs=1)
+    runner = JobRunner(store, max_workers=1)
+    action = Action()
+    action.release.set()
+    job, _ = runner.submit("a", {}, action)
+    wait_for(lambda: job.done)
+
+    newer, _ = runner.submit("a", {}, action)
+    assert store.get(job.id) is None
+    assert store.get(newer.id) is newer
+    runner.executor.shutdown()
+
+
+def test_list_filters_by_state_most_recent_first():
+    store = JobStore()
+    jobs = [Job("a", {}) for _ in range(5)]
+    for job, state in zip(jobs, [SUCCEEDED, FAILED, SUCCEEDED, RUNNING, SUCCEEDED]):
+        job.state = state
+        store.add(job)
+
+    assert store.list() == jobs[::-1]
+    assert store.list(SUCCEEDED) == [jobs[4], jobs[2], jobs[0]]
+    assert store.list(SUCCEEDED, limit=2) == [jobs[4], jobs[2]]
+    assert store.list(QUEUED) == []
+
+
+class FakeCounter:
+    def __init__(self):
+        self.points = []
+
+    def add(self, amount, attributes=None):
+        self.points.append((amount, attributes))
+
+
+class FakeMeter:
+    def __init__(self):
+        self.counters = {}
+
+    def create_counter(self, name, description=""):
+        return self.counters.setdefault(name, FakeCounter())
+
+
+def restart_cart(runner, action, cooldown=0.0):
+    return runner.submit("restart-service", {"service": "cart"}, action, key=("restart", "cart"), cooldown=cooldown)
+
+
+def test_identical_requests_join_the_job_in_flight():
+    meter = FakeMeter()
+    runner = JobRunner(JobStore(), max_workers=2, meter=meter)
+    action = Action()
+    job, outcome = restart_cart(runner, action)
+    joined, joined_outcome = restart_cart(runner, Action())
+    other, other_outcome = runner.submit("restart-service", {"service": "ad"}, Action(), key=("restart", "ad"))
+
+    assert (outcome, joined_outcome, other_outcome) == (SUBMITTED, COALESCED, SUBMITTED)
+    assert joined is job and other is not job
+    assert meter.counters["app_response_automation_jobs_coalesced"].points == [
+        (1, {"action": "restart-service", "service": "cart"})]
+
+    action.release.set()
+    wait_for(lambda: job.done)
+    # Without a cooldown the next request runs again
+    again, again_outcome = restart_cart(runner, action)
+    assert again is not job and again_outcome == SUBMITTED
+    assert runner._succeeded == {}
+    runner.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def test_requests_within_the_cooldown_are_suppressed():
+    meter = FakeMeter()
+    runner = JobRunner(JobStore(), max_workers=1, meter=meter)
+    action = Action()
+    action.release.set()
+    job, _ = restart_cart(runner, action, cooldown=0.2)
+    wait_for(lambda: job.done)
+
+    last, outcome = restart_cart(runner, action, cooldown=0.2)
+    assert (last, outcome) == (job, SUPPRESSED)
+    assert len(meter.counters["app_response_automation_jobs_suppressed"].points) == 1
+
+    # Once the cooldown is over the entry is pruned and the request runs
+    time.sleep(0.25)
+    runner.submit("scale-service", {"service": "ad"}, action, key=("scale", "ad"))
+    assert ("restart", "cart") not in runner._succeeded
+    again, outcome = restart_cart(runner, action, cooldown=0.2)
+    assert again is not job and outcome == SUBMITTED
+    runner.executor.shutdown()
+
+
+def test_jobs_are_kept_in_the_store_during_their_cooldown():
+    store = JobStore(max_jobs=1)
+    runner = JobRunner(store, max_workers=1)
+    action = Action()
+    action.release.set()
+    job, _ = restart_cart(runner, action, cooldown=0.2)
+    wait_for(lambda: job.done)
+
+    other, _ = runner.submit("a", {}, action)
+    wait_for(lambda: other.done)
+    assert store.get(job.id) is job
+    assert restart_cart(runner, action, cooldown=0.2) == (job, SUPPRESSED)
+
+    # Evictable once the cooldown is over
+    time.sleep(0.25)
+    runner.submit("scale-service", {"service": "ad"}, action, key=("scale", "ad"))
+    assert store.get(job.id) is None
+    runner.executor.shutdown()
+
+
+def test_failed_jobs_start_no_cooldown(runner):
+    action = Action((False, {"message": "Service cart not found"}))
+    action.release.set()
+    job, _ = restart_cart(runner, action, cooldown=60)
+    wait_for(lambda: job.done)
+
+    again, outcome = restart_cart(runner, action, cooldown=60)
+    assert again is not job and outcome == SUBMITTED
+
+
+def test_cooldown_uses_the_monotonic_clock(runner, monkeypatch):
+    action = Action()
+    action.release.set()
+    job, _ = restart_cart(runner, action, cooldown=60)
+    wait_for(lambda: job.done)
+
+    # A wall clock jump does not end the cooldown
+    monkeypatch.setattr(time, "time", lambda: job.finished + 3600)
+    _, outcome = restart_cart(runner, action, cooldown=60)
+    assert outcome == SUPPRESSED
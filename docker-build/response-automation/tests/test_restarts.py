@@ -0,0 +1,138 @@
+import threading
+import time
+
+import pytest
+
+from src.restarts import PARALLEL, ROLLING, RestartEngine
+
+
+class FakeContainer:
+    """The subset of docker.models.containers.Container that RestartEngine uses."""
+
+    def __init__(self, name, log, failures=0, health=None):
+        self.name = name
+        self.log = log
+        self.failures = failures
+        # Health statuses reported by successive reloads; None for no healthcheck
+        self.health = list(health) if health is not None else None
+        self.restarts = 0
+        self.attrs = {}
+
+    def restart(self, timeout=None):
+        self.restarts += 1
+        self.log.append(("restart", self.name))
+        if self.restarts <= self.failures:
+            raise RuntimeError(f"cannot restart {self.name}")
+
+    def reload(self):
+        self.log.append(("reload", self.name))
+        state = {"Running": True}
+        if self.health is not None:
+            status = self.health.pop(0) if len(self.health) > 1 else self.health[0]
+            state["Health"] = {"Status": status}
+        self.attrs = {"State": state}
+
+
+@pytest.fixture
+def engine():
+    return RestartEngine(max_workers=4, attempts=3, retry_wait=0, health_timeout=0.2, health_poll=0.01)
+
+
+def containers(log, n, **kwargs):
+    return [FakeContainer(f"c{i}", log, **kwargs) for i in range(n)]
+
+
+def test_parallel_restarts_every_container_at_once(engine):
+    log = []
+    conts = containers(log, 4)
+    # Each restart waits for all four to be in progress
+    barrier = threading.Barrier(4, timeout=2)
+    for cont in conts:
+        restart = cont.restart
+        cont.restart = lambda timeout=None, restart=restart: (barrier.wait(), restart(timeout))
+
+    results = engine.restart(conts, PARALLEL)
+
+    assert [(r.container, r.ok, r.attempts) for r in results] == [(f"c{i}", True, 1) for i in range(4)]
+    # No health gate in parallel mode
+    assert not [entry for entry in log if entry[0] == "reload"]
+
+
+def test_rolling_restarts_in_batches_behind_the_health_gate(engine):
+    log = []
+    conts = containers(log, 5)
+
+    results = engine.restart(conts, ROLLING, batch_size=2)
+
+    assert all(r.ok for r in results)
+    assert [r.container for r in results] == ["c0", "c1", "c2", "c3", "c4"]
+    # Each batch is restarted only once the previous one is healthy
+    batches = [{"c0", "c1"}, {"c2", "c3"}, {"c4"}]
+    positions = {entry: i for i, entry in enumerate(log)}
+    for batch, following in zip(batches, batches[1:]):
+        last_check = max(positions[("reload", name)] for name in batch)
+        first_restart = min(positions[("restart", name)] for name in following)
+        assert last_check < first_restart
+
+
+def test_each_container_is_retried_on_its_own(engine):
+    log = []
+    flaky = FakeContainer("flaky", log, failures=2)
+    steady = FakeContainer("steady", log)
+
+    results = engine.restart([steady, flaky], PARALLEL)
+
+    assert [(r.container, r.ok, r.attempts) for r in results] == [("steady", True, 1), ("flaky", True, 3)]
+    assert steady.restarts == 1
+
+
+def test_retries_are_bounded(engine):
+    log = []
+    broken = FakeContainer("broken", log, failures=10)
+
+    [result] = engine.restart([broken], PARALLEL)
+
+    assert not result.ok
+    assert result.attempts == 3
+    assert result.error == "cannot restart broken"
+
+
+def test_health_gate_waits_for_healthy(engine):
+    log = []
+    cont = FakeContainer("c0", log, health=["starting", "starting", "healthy"])
+
+    [result] = engine.restart([cont], ROLLING)
+
+    assert result.ok
+    assert log.count(("reload", "c0")) == 3
+
+
+def test_unhealthy_batch_stops_the_rollout(engine):
+    log = []
+    conts = containers(log, 4)
+    conts[1].health = ["unhealthy"]
+
+    results = engine.restart(conts, ROLLING, batch_size=1)
+
+    assert [(r.container, r.ok) for r in results] == [("c0", True), ("c1", False), ("c2", False), ("c3", False)]
+    assert results[1].error == "not healthy after 0.2s"
+    assert results[2].error == "skipped: an earlier batch failed"
+    assert conts[2].restarts == conts[3].restarts == 0
+
+
+def test_a_batch_waits_for_health_once(engine):
+    log = []
+    conts = containers(log, 3, health=["starting"])
+
+    started = time.monotonic()
+    results = engine.restart(conts, ROLLING, batch_size=3)
+
+    # One health timeout for the batch, not one per container
+    assert time.monotonic() - started < 0.4
+    assert [r.ok for r in results] == [False, False, False]
+    assert all(log.count(("reload", c.name)) >= 1 for c in conts)
+
+
+def test_unknown_mode(engine):
+    with pytest.raises(ValueError, match='mode must be "parallel" or "rolling"'):
+        engine.restart([], "random")
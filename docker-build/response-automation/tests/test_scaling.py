@@ -0,0 +1,216 @@
+import copy
+import threading
+
+import pytest
+
+from src.container_index import SERVICE_LABEL
+from src.scaling import NUMBER_LABEL, PROJECT_LABEL, Scaler
+
+
+class FakeDockerApi:
+    """The subset of docker.APIClient that Scaler uses, over an in-memory host."""
+
+    def __init__(self):
+        self.containers_by_id = {}
+        self.calls = []
+        self.fail_create = set()
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    def add(self, service, number, state="running", project="demo", port=None):
+        cid = f"{self._next_id:064x}"
+        self._next_id += 1
+        name = f"{project}-{service}-{number}"
+        self.containers_by_id[cid] = {
+            "Id": cid,
+            "Name": "/" + name,
+            "State": {"Status": state, "Running": state == "running"},
+            "Config": {
+                "Hostname": cid[:12],
+                "Image": f"{service}:latest",
+                "Env": ["A=1"],
+                "Labels": {SERVICE_LABEL: service, PROJECT_LABEL: project, NUMBER_LABEL: str(number)},
+            },
+            "HostConfig": {
+                "NetworkMode": "demo_default",
+                "PortBindings": {"8080/tcp": [{"HostIp": "", "HostPort": port}]} if port else {},
+            },
+            "NetworkSettings": {"Networks": {
+                "demo_default": {"Aliases": [service, name, cid[:12]]},
+                "demo_backend": {"Aliases": [service]},
+            }},
+        }
+        return cid
+
+    def names(self, service, project="demo"):
+        return sorted(
+            c["Name"].lstrip("/") for c in self.containers_by_id.values()
+            if c["Config"]["Labels"][SERVICE_LABEL] == service and c["Config"]["Labels"][PROJECT_LABEL] == project)
+
+    # -- docker.APIClient ---------------------------------------------
+
+    def containers(self, all=False, filters=None):
+        self.calls.append(("containers", filters))
+        wanted = [label.split("=") for label in filters["label"]]
+        return [
+            {"Id": c["Id"], "Names": [c["Name"]], "Labels": dict(c["Config"]["Labels"]), "State": c["State"]["Status"]}
+            for c in self.containers_by_id.values() if _matches(c["Config"]["Labels"], wanted)
+        ]
+
+    def inspect_container(self, cid):
+        self.calls.append(("inspect", cid))
+        return copy.deepcopy(self.containers_by_id[cid])
+
+    def create_container_from_config(self, config, name=None):
+        self.calls.append(("create", name))
+        if name in self.fail_create:
+            raise RuntimeError("no space left on device")
+        with self._lock:
+            cid = f"{self._next_id:064x}"
+            self._next_id += 1
+        config = copy.deepcopy(config)
+        networking = config.pop("NetworkingConfig")["EndpointsConfig"]
+        self.containers_by_id[cid] = {
+            "Id": cid, "Name": "/" + name, "State": {"Status": "created", "Running": False},
+            "HostConfig": config.pop("HostConfig"), "Config": config,
+            "NetworkSettings": {"Networks": copy.deepcopy(networking)},
+        }
+        return {"Id": cid}
+
+    def connect_container_to_network(self, cid, network, aliases=None):
+        self.calls.append(("connect", network))
+        self.containers_by_id[cid]["NetworkSettings"]["Networks"][network] = {"Aliases": aliases}
+
+    def start(self, cid):
+        self.calls.append(("start", cid))
+        self.containers_by_id[cid]["State"] = {"Status": "running", "Running": True}
+
+    def stop(self, cid, timeout=None):
+        self.calls.append(("stop", cid))
+        self.containers_by_id[cid]["State"] = {"Status": "exited", "Running": False}
+
+    def remove_container(self, cid, force=False):
+        self.calls.append(("remove", cid))
+        del self.containers_by_id[cid]
+
+
+def _matches(labels, wanted):
+    return all(labels.get(key) == value for key, value in wanted)
+
+
+class FakeClient:
+    def __init__(self, api):
+        self.api = api
+
+
+@pytest.fixture
+def api():
+    return FakeDockerApi()
+
+
+@pytest.fixture
+def scaler(api):
+    return Scaler(FakeClient(api), project="demo", max_workers=4, stop_timeout=1)
+
+
+def test_scale_up_clones_a_running_replica(api, scaler):
+    template = api.add("cart", 1, port="8080")
+
+    result = scaler.scale("cart", 3)
+
+    assert result.ok
+    assert result.before == 1
+    assert sorted(result.created) == ["demo-cart-2", "demo-cart-3"]
+    assert api.names("cart") == ["demo-cart-1", "demo-cart-2", "demo-cart-3"]
+    clone = next(c for c in api.containers_by_id.values() if c["Name"] == "/demo-cart-3")
+    assert clone["State"]["Running"]
+    assert clone["Config"]["Image"] == "cart:latest"
+    assert clone["Config"]["Env"] == ["A=1"]
+    assert clone["Config"]["Labels"][NUMBER_LABEL] == "3"
+    assert "Hostname" not in clone["Config"]
+    # Published ports move to random host ports instead of clashing
+    assert clone["HostConfig"]["PortBindings"]["8080/tcp"][0]["HostPort"] == ""
+    assert api.containers_by_id[template]["HostConfig"]["PortBindings"]["8080/tcp"][0]["HostPort"] == "8080"
+    # Same networks, reachable by the service name but not by the template's own names
+    assert clone["NetworkSettings"]["Networks"] == {
+        "demo_default": {"Aliases": ["cart"]},
+        "demo_backend": {"Aliases": ["cart"]},
+    }
+
+
+def test_scale_down_removes_highest_numbers(api, scaler):
+    for number in (1, 2, 3, 4):
+        api.add("cart", number)
+
+    result = scaler.scale("cart", 2)
+
+    assert result.ok
+    assert sorted(result.removed) == ["demo-cart-3", "demo-cart-4"]
+    assert api.names("cart") == ["demo-cart-1", "demo-cart-2"]
+
+
+def test_scale_down_removes_replicas_that_are_not_running_first(api, scaler):
+    for number, state in ((1, "running"), (2, "exited"), (3, "running"), (4, "running"), (5, "created")):
+        api.add("cart", number, state=state)
+
+    result = scaler.scale("cart", 2)
+
+    assert result.ok
+    assert sorted(result.removed) == ["demo-cart-2", "demo-cart-4", "demo-cart-5"]
+    assert api.names("cart") == ["demo-cart-1", "demo-cart-3"]
+
+
+def test_other_projects_are_not_counted_or_touched(api, scaler):
+    api.add("cart", 1)
+    for number in (1, 2, 3):
+        api.add("cart", number, project="other")
+
+    result = scaler.scale("cart", 2)
+    assert result.before == 1
+    assert result.created == ["demo-cart-2"]
+
+    result = scaler.scale("cart", 1)
+    assert result.removed == ["demo-cart-2"]
+    assert api.names("cart", project="other") == ["other-cart-1", "other-cart-2", "other-cart-3"]
+    assert api.calls[0] == ("containers", {"label": [f"{SERVICE_LABEL}=cart", f"{PROJECT_LABEL}=demo"]})
+
+
+def test_scale_to_current_count_changes_nothing(api, scaler):
+    api.add("cart", 1)
+    api.add("cart", 2)
+
+    result = scaler.scale("cart", 2)
+
+    assert result.ok
+    assert result.created == result.removed == []
+    assert [call[0] for call in api.calls] == ["containers"]
+
+
+def test_scale_up_prefers_a_running_template_and_continues_numbering(api, scaler):
+    api.add("cart", 1)
+    api.add("cart", 5, state="exited")
+
+    scaler.scale("cart", 3)
+
+    inspected = [call[1] for call in api.calls if call[0] == "inspect"]
+    assert api.containers_by_id[inspected[0]]["Name"] == "/demo-cart-1"
+    assert api.names("cart") == ["demo-cart-1", "demo-cart-5", "demo-cart-6"]
+
+
+def test_failed_creates_are_reported_per_container(api, scaler):
+    api.add("cart", 1)
+    api.fail_create.add("demo-cart-3")
+
+    result = scaler.scale("cart", 3)
+
+    assert not result.ok
+    assert result.created == ["demo-cart-2"]
+    assert result.errors == ["create #3: no space left on device"]
+    assert api.names("cart") == ["demo-cart-1", "demo-cart-2"]
+
+
+def test_unknown_service_raises_lookup_error(api, scaler):
+    api.add("cart", 1)
+
+    with pytest.raises(LookupError):
+        scaler.scale("checkout", 2)
@@ -255,6 +255,70 @@ if browser_traffic_enabled:
                 except Exception as e:
                     logging.error(f"Error in add to cart task: {str(e)}")
 
+recommendation_grpc_enabled = os.environ.get("LOCUST_RECOMMENDATION_GRPC_ENABLED", "").lower() in ("true", "yes", "on")
+
+if recommendation_grpc_enabled:
+    import time
+
+    import grpc
+    import grpc.experimental.gevent as grpc_gevent
+    from locust import User
+
+    import demo_pb2
+    import demo_pb2_grpc
+
+    # Let gRPC cooperate with locust's gevent event loop
+    grpc_gevent.init_gevent()
+
+    class RecommendationGrpcUser(User):
+        """Calls the recommendation service directly over gRPC.
+
+        Compares one ListRecommendations call per product page against a
+        single ListRecommendationsBatch call for the same pages.
+        """
+        wait_time = between(1, 10)
+        pages_per_visit = 5
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.tracer = trace.get_tracer(__name__)
+            channel = grpc.insecure_channel(os.environ["RECOMMENDATION_ADDR"])
+            self.stub = demo_pb2_grpc.RecommendationServiceStub(channel)
+
+        def call(self, name, method, request):
+            start = time.perf_counter()
+            response, exception = None, None
+            try:
+                response = method(request, timeout=10)
+            except grpc.RpcError as e:
+                exception = e
+            self.environment.events.request.fire(
+                request_type="grpc",
+                name=name,
+                response_time=(time.perf_counter() - start) * 1000,
+                response_length=response.ByteSize() if response is not None else 0,
+                exception=exception,
+            )
+
+        def page_requests(self):
+            user = str(uuid.uuid1())
+            return [
+                demo_pb2.ListRecommendationsRequest(user_id=user, product_ids=[product])
+                for product in random.sample(products, self.pages_per_visit)
+            ]
+
+        @task
+        def get_recommendations_per_page(self):
+            with self.tracer.start_as_current_span("user_get_recommendations_per_page", context=Context()):
+                for request in self.page_requests():
+                    self.call("ListRecommendations", self.stub.ListRecommendations, request)
+
+        @task
+        def get_recommendations_batched(self):
+            with self.tracer.start_as_current_span("user_get_recommendations_batched", context=Context()):
+                request = demo_pb2.ListRecommendationsBatchRequest(requests=self.page_requests())
+                self.call("ListRecommendationsBatch", self.stub.ListRecommendationsBatch, request)
+
 async def add_baggage_header(route: Route, request: Request):
     existing_baggage = request.headers.get('baggage', '')
     headers = {
@@ -0,0 +1,111 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Memory allocated per ListRecommendations call.
+
+Runs get_product_list() and build_response() against an in-memory catalog
+snapshot, the way the servicer does, and reports with tracemalloc the peak
+memory one call allocates and the blocks and bytes its response keeps alive.
+
+Usage: python benchmarks/bench_allocations.py [--calls N] [--catalog N]
+"""
+
+import argparse
+import gc
+import logging
+import os
+import sys
+import tracemalloc
+
+from opentelemetry.metrics import NoOpMeter
+from opentelemetry.trace import NoOpTracer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import demo_pb2  # noqa: E402
+import recommendation_server  # noqa: E402
+from cache_leak import CacheLeak  # noqa: E402
+from catalog_cache import CatalogCache  # noqa: E402
+from logger import RequestLogger  # noqa: E402
+from metrics import init_metrics  # noqa: E402
+from span_attributes import SpanAttributePolicy  # noqa: E402
+from user_history import UserHistory  # noqa: E402
+
+
+class Flags:
+    def get_boolean_value(self, flag_name, default):
+        return False
+
+
+def set_up_server(catalog_size, personalized):
+    logger = logging.getLogger("bench")
+    logger.setLevel(logging.WARNING)
+    rec_svc_metrics = init_metrics(NoOpMeter("bench"))
+    product_ids = [f"P{i:07d}" for i in range(catalog_size)]
+    for name, value in {
+        'tracer': NoOpTracer(),
+        'rec_svc_metrics': rec_svc_metrics,
+        'catalog_cache': CatalogCache(lambda: product_ids, rec_svc_metrics, logger, ttl_seconds=3600),
+        'flag_cache': Flags(),
+        'cache_leak': CacheLeak(),
+        'span_attributes': SpanAttributePolicy(),
+        'request_logger': RequestLogger(logger),
+        'max_request_product_ids': 1000,
+        'strict_requests': False,
+        'response_cache': None,
+        'user_history': UserHistory() if personalized else None,
+    }.items():
+        setattr(recommendation_server, name, value)
+    recommendation_server.catalog_cache.get()
+    return product_ids
+
+
+def rpc(request):
+    prod_list = recommendation_server.get_product_list(request.product_ids, request.user_id)
+    return recommendation_server.build_response(prod_list)
+
+
+def bench_calls(calls, catalog_size, personalized):
+    product_ids = set_up_server(catalog_size, personalized)
+    requests = [demo_pb2.ListRecommendationsRequest(user_id=f"user-{i % 100}", product_ids=[product_ids[i]])
+                for i in range(calls)]
+    for request in requests[:100]:
+        rpc(request)
+
+    gc.collect()
+    tracemalloc.start()
+    peaks = []
+    for request in requests:
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+        rpc(request)
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+
+    before = tracemalloc.take_snapshot()
+    responses = [rpc(request) for request in requests]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = after.compare_to(before, "filename")
+    blocks = sum(stat.count_diff for stat in retained)
+    size = sum(stat.size_diff for stat in retained)
+    del responses
+    return sum(peaks) / len(peaks), blocks / calls, size / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=10_000)
+    parser.add_argument("--catalog", type=int, default=10_000, help="products in the snapshot")
+    args = parser.parse_args()
+
+    print(f"{'per call':<26} {'peak B':>8} {'kept blocks':>12} {'kept B':>8}")
+    for personalized in (False, True):
+        peak, blocks, size = bench_calls(args.calls, args.catalog, personalized)
+        name = "with user history" if personalized else "without user history"
+        print(f"{name:<26} {peak:>8.0f} {blocks:>12.1f} {size:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Build and query cost of category-based recommendations by catalog size.
+
+Products get 1 to --max-categories categories out of --categories, skewed so
+that a few categories are much more common than the rest, like a real
+catalog. Reports the time to build a CategoryIndex on a catalog refresh, its
+array memory, and the per-request latency of related() next to uniform
+ProductIndex.sample() for the same request.
+
+Usage: python benchmarks/bench_category_index.py [--categories N] [--max-categories N] [--excluded N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from category_index import CategoryIndex  # noqa: E402
+from product_index import ProductIndex  # noqa: E402
+
+CATALOG_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+
+def make_catalog(size, num_categories, max_categories, rng):
+    names = [f"category-{i}" for i in range(num_categories)]
+    weights = [1 / (i + 1) for i in range(num_categories)]
+    product_ids = tuple(f"P{i:07d}" for i in range(size))
+    categories = [tuple(dict.fromkeys(rng.choices(names, weights, k=rng.randint(1, max_categories))))
+                  for _ in range(size)]
+    return product_ids, categories
+
+
+def array_bytes(categories):
+    return sum(value.nbytes for value in vars(categories).values() if isinstance(value, np.ndarray))
+
+
+def bench(size, args, rng):
+    product_ids, categories = make_catalog(size, args.categories, args.max_categories, rng)
+    index = ProductIndex(product_ids)
+
+    start = time.perf_counter()
+    category_index = CategoryIndex(index, categories)
+    build = time.perf_counter() - start
+
+    requests = [index.positions_of(rng.sample(product_ids, args.excluded)) for _ in range(100)]
+    number = 20
+    related = min(timeit.repeat(lambda: [category_index.related(5, r) for r in requests],
+                                number=number, repeat=3)) / (number * len(requests))
+    uniform = min(timeit.repeat(lambda: [index.sample(5, r) for r in requests],
+                                number=number, repeat=3)) / (number * len(requests))
+    groups = len(category_index.member_offsets) - 1
+    return build, array_bytes(category_index), groups, related, uniform
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--categories", type=int, default=200, help="distinct categories in the catalog")
+    parser.add_argument("--max-categories", type=int, default=3, help="categories per product, at most")
+    parser.add_argument("--excluded", type=int, default=2, help="product ids per request")
+    args = parser.parse_args()
+    rng = random.Random(42)
+
+    print(f"{'catalog':>10} {'groups':>8} {'build ms':>10} {'arrays MiB':>11} "
+          f"{'related µs':>11} {'uniform µs':>11}")
+    for size in CATALOG_SIZES:
+        build, nbytes, groups, related, uniform = bench(size, args, rng)
+        print(f"{size:>10} {groups:>8} {build * 1e3:>10.1f} {nbytes / 2**20:>11.2f} "
+              f"{related * 1e6:>11.1f} {uniform * 1e6:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
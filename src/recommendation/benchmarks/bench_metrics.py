@@ -0,0 +1,72 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Measure what the request latency instruments add to one request.
+
+Records one RPC (in-flight counter plus duration) and the four stage
+histograms, the way a ListRecommendations call does, against the SDK meter
+with and without a sampled span (exemplars are only taken inside one), and
+against the no-op meter as the baseline.
+
+Usage: python benchmarks/bench_metrics.py [--number N]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+from opentelemetry.metrics import NoOpMeter
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import TracerProvider
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metrics import RpcMetrics, init_metrics  # noqa: E402
+
+STAGES = (
+    "app_recommendation_flag_evaluation_duration",
+    "app_recommendation_catalog_fetch_duration",
+    "app_recommendation_selection_duration",
+    "app_recommendation_serialization_duration",
+)
+
+
+def request(rpc, stages):
+    with rpc.call():
+        for histogram in stages:
+            histogram.record(0.00003)
+
+
+def bench(meter, number, span=None):
+    rec_svc_metrics = init_metrics(meter)
+    rpc = RpcMetrics(rec_svc_metrics, "ListRecommendations")
+    stages = [rec_svc_metrics[name] for name in STAGES]
+    if span is None:
+        return min(timeit.repeat(lambda: request(rpc, stages), number=number, repeat=5)) / number
+    with span:
+        return min(timeit.repeat(lambda: request(rpc, stages), number=number, repeat=5)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20_000, help="requests per timing run")
+    args = parser.parse_args()
+
+    tracer = TracerProvider().get_tracer("bench")
+    results = {
+        "no-op meter": bench(NoOpMeter("bench"), args.number),
+        "SDK, no span": bench(MeterProvider(metric_readers=[InMemoryMetricReader()]).get_meter("bench"), args.number),
+        "SDK, sampled span": bench(MeterProvider(metric_readers=[InMemoryMetricReader()]).get_meter("bench"),
+                                   args.number, tracer.start_as_current_span("ListRecommendations")),
+    }
+    print(f"{'meter':>18} {'µs/request':>11}")
+    for name, seconds in results.items():
+        print(f"{name:>18} {seconds * 1e6:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
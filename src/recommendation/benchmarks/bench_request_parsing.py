@@ -0,0 +1,55 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compare product_ids parsing strategies for ListRecommendations requests.
+
+Usage: python benchmarks/bench_request_parsing.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import demo_pb2  # noqa: E402
+from request_parsing import normalize_product_ids  # noqa: E402
+
+REQUEST_SIZES = (1, 10, 100, 1_000, 10_000)
+
+
+def legacy_parse(product_ids):
+    # What get_product_list did before request_parsing existed
+    return ''.join(product_ids).split(',')
+
+
+def bench(size):
+    ids = [f"P{i:09d}" for i in range(size)]
+    shapes = {
+        "repeated": demo_pb2.ListRecommendationsRequest(product_ids=ids).product_ids,
+        "comma-joined": demo_pb2.ListRecommendationsRequest(product_ids=[",".join(ids)]).product_ids,
+    }
+    number = max(10, 100_000 // size)
+    results = {}
+    for shape, product_ids in shapes.items():
+        legacy = min(timeit.repeat(lambda: legacy_parse(product_ids), number=number, repeat=3)) / number
+        normalized = min(timeit.repeat(lambda: normalize_product_ids(product_ids, max_ids=size),
+                                       number=number, repeat=3)) / number
+        capped = min(timeit.repeat(lambda: normalize_product_ids(product_ids),
+                                   number=number, repeat=3)) / number
+        results[shape] = (legacy, normalized, capped)
+    return results
+
+
+def main():
+    # "uncapped" lets every id through, "capped" uses the service default
+    print(f"{'ids':>6} {'shape':>13} {'legacy µs':>11} {'uncapped µs':>12} {'capped µs':>10}")
+    for size in REQUEST_SIZES:
+        for shape, (legacy, normalized, capped) in bench(size).items():
+            print(f"{size:>6} {shape:>13} {legacy * 1e6:>11.2f} {normalized * 1e6:>12.2f} {capped * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
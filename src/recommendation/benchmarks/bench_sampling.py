@@ -0,0 +1,63 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Compare per-request recommendation sampling strategies.
+
+Usage: python benchmarks/bench_sampling.py [--excluded N] [--k N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from product_index import ProductIndex  # noqa: E402
+
+CATALOG_SIZES = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+
+def legacy_sample(product_ids, request_product_ids, k):
+    # The set difference + random.sample path get_product_list used before
+    # the product index was introduced.
+    filtered_products = list(set(product_ids) - set(request_product_ids))
+    num_return = min(k, len(filtered_products))
+    indices = random.sample(range(len(filtered_products)), num_return)
+    return [filtered_products[i] for i in indices]
+
+
+def indexed_sample(index, request_product_ids, k):
+    return index.sample(k, index.positions_of(request_product_ids))
+
+
+def bench(size, excluded, k):
+    product_ids = tuple(f"P{i:07d}" for i in range(size))
+    index = ProductIndex(product_ids)
+    request_product_ids = random.sample(product_ids, min(excluded, size))
+
+    number = max(10, 200_000 // size)
+    legacy = min(timeit.repeat(lambda: legacy_sample(product_ids, request_product_ids, k),
+                               number=number, repeat=3)) / number
+    indexed = min(timeit.repeat(lambda: indexed_sample(index, request_product_ids, k),
+                                number=number, repeat=3)) / number
+    return legacy, indexed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--excluded", type=int, default=2, help="ids excluded per request")
+    parser.add_argument("--k", type=int, default=5, help="recommendations per request")
+    args = parser.parse_args()
+
+    print(f"{'catalog':>10} {'legacy µs':>12} {'indexed µs':>12} {'speedup':>9}")
+    for size in CATALOG_SIZES:
+        legacy, indexed = bench(size, args.excluded, args.k)
+        print(f"{size:>10} {legacy * 1e6:>12.2f} {indexed * 1e6:>12.2f} {legacy / indexed:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Measure OTLP bytes per get_product_list span under each attribute policy.
+
+Usage: python benchmarks/bench_span_attributes.py [--spans N] [--max-list-length N]
+"""
+
+import argparse
+import os
+import sys
+
+from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from span_attributes import SpanAttributePolicy  # noqa: E402
+
+# Length of the product list attribute; the largest sizes correspond to a
+# candidate list that grew with the recommendationCacheFailure leak.
+LIST_LENGTHS = (5, 100, 1_000, 10_000)
+
+
+def record_spans(attributes, list_length, num_spans):
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    tracer = provider.get_tracer("bench")
+    prod_list = [f"P{i:07d}" for i in range(list_length)]
+
+    for _ in range(num_spans):
+        with tracer.start_as_current_span("get_product_list") as span:
+            attributes(span, prod_list)
+    return exporter.get_finished_spans()
+
+
+def unbounded(span, prod_list):
+    # What get_product_list recorded before the attribute policy
+    span.set_attribute("app.recommendation.cache_enabled", True)
+    span.set_attribute("app.cache_hit", False)
+    span.set_attribute("app.products.count", len(prod_list))
+    span.set_attribute("app.filtered_products.count", len(prod_list))
+    span.set_attribute("app.filtered_products.list", prod_list)
+
+
+def with_policy(policy):
+    def attributes(span, prod_list):
+        policy.set(span, "app.recommendation.cache_enabled", True)
+        policy.set(span, "app.cache_hit", False)
+        policy.set(span, "app.products.count", len(prod_list))
+        policy.set(span, "app.filtered_products.count", len(prod_list))
+        policy.set_list(span, "app.filtered_products.list", prod_list)
+    return attributes
+
+
+def bytes_per_span(attributes, list_length, num_spans):
+    spans = record_spans(attributes, list_length, num_spans)
+    return encode_spans(spans).ByteSize() / num_spans
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--spans", type=int, default=100, help="spans encoded per measurement")
+    parser.add_argument("--max-list-length", type=int, default=10, help="cap applied by the full policy")
+    args = parser.parse_args()
+
+    policies = (
+        ("unbounded", unbounded),
+        ("full", with_policy(SpanAttributePolicy(max_list_length=args.max_list_length))),
+        ("lean", with_policy(SpanAttributePolicy(lean=True))),
+    )
+    print(f"{'list len':>10}" + "".join(f" {name + ' B':>13}" for name, _ in policies))
+    for list_length in LIST_LENGTHS:
+        sizes = [bytes_per_span(attributes, list_length, args.spans) for _, attributes in policies]
+        print(f"{list_length:>10}" + "".join(f" {size:>13.0f}" for size in sizes))
+
+
+if __name__ == "__main__":
+    main()
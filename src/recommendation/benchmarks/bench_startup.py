@@ -0,0 +1,118 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Measure time from process launch to the first successful recommendation.
+
+Starts an in-process fake product catalog, then launches
+recommendation_server.py as a subprocess several times and reports, per run,
+when the health check first said SERVING and when the first
+ListRecommendations call succeeded. flagd is not started: the server waits
+RECOMMENDATION_STARTUP_TIMEOUT_SECONDS for it and then uses default values.
+
+Usage: python benchmarks/bench_startup.py [--runs N] [--products N] [--mode thread|aio]
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from concurrent import futures
+
+import grpc
+from grpc_health.v1 import health_pb2
+from grpc_health.v1 import health_pb2_grpc
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVER_DIR)
+
+import demo_pb2  # noqa: E402
+import demo_pb2_grpc  # noqa: E402
+
+
+class FakeCatalog(demo_pb2_grpc.ProductCatalogServiceServicer):
+    def __init__(self, num_products):
+        self.response = demo_pb2.ListProductsResponse(
+            products=[demo_pb2.Product(id=f"P{i:07d}", name=f"Product {i}") for i in range(num_products)])
+
+    def ListProducts(self, request, context):
+        return self.response
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def run_once(catalog_port, mode, startup_timeout, deadline_seconds=30):
+    port = free_port()
+    env = dict(
+        os.environ,
+        OTEL_SERVICE_NAME="recommendation",
+        RECOMMENDATION_PORT=str(port),
+        RECOMMENDATION_SERVER_MODE=mode,
+        RECOMMENDATION_READINESS_CHECKS="catalog",
+        RECOMMENDATION_STARTUP_TIMEOUT_SECONDS=str(startup_timeout),
+        PRODUCT_CATALOG_ADDR=f"127.0.0.1:{catalog_port}",
+        FLAGD_HOST="127.0.0.1",
+        FLAGD_PORT=str(free_port()),
+        # Nothing listens here; exports fail quietly in the background
+        OTEL_EXPORTER_OTLP_ENDPOINT=f"http://127.0.0.1:{free_port()}",
+    )
+    launched = time.perf_counter()
+    process = subprocess.Popen([sys.executable, os.path.join(SERVER_DIR, "recommendation_server.py")],
+                               env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        # Retry connecting every few ms instead of backing off, so the
+        # measurement is not rounded up to the next reconnect attempt
+        options = [("grpc.initial_reconnect_backoff_ms", 10), ("grpc.min_reconnect_backoff_ms", 10),
+                   ("grpc.max_reconnect_backoff_ms", 10)]
+        with grpc.insecure_channel(f"127.0.0.1:{port}", options=options) as channel:
+            stub = demo_pb2_grpc.RecommendationServiceStub(channel)
+            stub.ListRecommendations(demo_pb2.ListRecommendationsRequest(user_id="bench", product_ids=["P0000000"]),
+                                     timeout=deadline_seconds, wait_for_ready=True)
+            first_rpc = time.perf_counter() - launched
+
+            health = health_pb2_grpc.HealthStub(channel)
+            for response in health.Watch(health_pb2.HealthCheckRequest(), timeout=deadline_seconds):
+                if response.status == health_pb2.HealthCheckResponse.SERVING:
+                    break
+            serving = time.perf_counter() - launched
+    finally:
+        process.terminate()
+        process.wait()
+    return first_rpc, serving
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--products", type=int, default=10_000)
+    parser.add_argument("--mode", choices=("thread", "aio"), default="thread")
+    parser.add_argument("--startup-timeout", type=float, default=0.5,
+                        help="seconds the server waits for flagd before starting with defaults")
+    args = parser.parse_args()
+
+    catalog = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    demo_pb2_grpc.add_ProductCatalogServiceServicer_to_server(FakeCatalog(args.products), catalog)
+    catalog_port = catalog.add_insecure_port("127.0.0.1:0")
+    catalog.start()
+
+    first_rpcs, servings = [], []
+    print(f"{'run':>4} {'first RPC ms':>13} {'SERVING ms':>11}")
+    for run in range(args.runs):
+        first_rpc, serving = run_once(catalog_port, args.mode, args.startup_timeout)
+        first_rpcs.append(first_rpc)
+        servings.append(serving)
+        print(f"{run:>4} {first_rpc * 1e3:>13.0f} {serving * 1e3:>11.0f}")
+    print(f"{'p50':>4} {statistics.median(first_rpcs) * 1e3:>13.0f} {statistics.median(servings) * 1e3:>11.0f}")
+    catalog.stop(None)
+
+
+if __name__ == "__main__":
+    main()
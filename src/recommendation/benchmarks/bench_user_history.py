@@ -0,0 +1,74 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Memory per user and visit() latency of the per-user history store.
+
+Fills a UserHistory with --users users (session ids like the frontend's
+UUIDs) that each viewed a few catalog products, then reports the memory
+tracemalloc attributes to the store next to the store's own estimate, and the
+latency of visit() for a known user and for a new user that forces an LRU
+eviction.
+
+Usage: python benchmarks/bench_user_history.py [--users N] [--history-length N] [--products N]
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import timeit
+import tracemalloc
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from user_history import UserHistory  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--history-length", type=int, default=8)
+    parser.add_argument("--products", type=int, default=10_000, help="catalog size")
+    parser.add_argument("--views", type=int, default=4, help="products viewed per user")
+    args = parser.parse_args()
+    rng = random.Random(42)
+
+    product_ids = [f"P{i:07d}" for i in range(args.products)]
+    user_ids = [str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(args.users)]
+    views = [rng.sample(product_ids, args.views) for _ in range(1000)]
+
+    gc.collect()
+    tracemalloc.start()
+    history = UserHistory(max_bytes=2**40, history_length=args.history_length)
+    for i, user_id in enumerate(user_ids):
+        # A request carries its own copy of the id, which the store keeps
+        user_id = "".join(user_id)
+        for product_id in views[i % len(views)]:
+            history.visit(user_id, (product_id,))
+    traced = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f"users: {len(history):,}, history length: {args.history_length}")
+    print(f"traced memory:    {traced / 2**20:8.1f} MiB ({traced / len(history):.0f} B/user)")
+    print(f"estimated memory: {history.size_bytes / 2**20:8.1f} MiB ({history.size_bytes / len(history):.0f} B/user)")
+
+    number = 200_000
+    known = [(rng.choice(user_ids), views[i % len(views)][:1]) for i in range(1000)]
+    seconds = min(timeit.repeat(lambda: [history.visit(u, p) for u, p in known],
+                                number=number // len(known), repeat=3)) / number
+    print(f"visit, known user:          {seconds * 1e9:6.0f} ns")
+
+    # Keep the store full, so that every new user evicts the least recent one
+    history.max_bytes = history.size_bytes
+    new_users = iter(str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(number * 3))
+    new = ["P0000001"]
+    seconds = min(timeit.repeat(lambda: history.visit(next(new_users), new), number=number, repeat=3)) / number
+    print(f"visit, new user (eviction): {seconds * 1e9:6.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import itertools
+import threading
+from typing import NamedTuple, Tuple
+
+from opentelemetry.metrics import Observation
+
+# Memory held per leaked product id: roughly a short str plus its list slot
+ID_BYTES = 64
+
+
+class LeakState(NamedTuple):
+    """What has leaked so far; never modified once published."""
+    num_ids: int
+    chunks: Tuple[bytes, ...]
+
+
+EMPTY = LeakState(0, ())
+
+
+class CacheLeak:
+    """Deterministic, bounded model of the recommendationCacheFailure leak.
+
+    While the flag is on, every ``miss_every``-th request is a cache miss. A
+    miss re-caches the catalog on top of what already leaked and grows the
+    leak by another ``growth_rate`` of its size, the same shape as the
+    original leak. Each miss adds at most ``max_step`` ids, though, and the
+    leak never exceeds ``max_bytes``. Every leaked id holds ``ID_BYTES`` of
+    real, touched memory, so container memory still rises, but a request
+    never costs more than one bounded allocation.
+
+    The state is an immutable LeakState published by swapping a single
+    reference, so readers never lock. Requests are numbered with an atomic
+    counter, and only misses serialize on the writer lock.
+    """
+
+    def __init__(
+        self, max_bytes: int = 300 * 2**20, max_step: int = 65536, growth_rate: float = 0.25, miss_every: int = 2,
+    ):
+        self.max_bytes = max_bytes
+        self.max_step = max_step
+        self.growth_rate = growth_rate
+        self.miss_every = miss_every
+        self._state = EMPTY
+        # next() on itertools.count is atomic, so numbering requests needs no lock
+        self._requests = itertools.count()
+        self._write_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of product ids the leaking cache holds."""
+        return self._state.num_ids
+
+    @property
+    def size_bytes(self) -> int:
+        return self._state.num_ids * ID_BYTES
+
+    def request(self, num_catalog_ids: int) -> bool:
+        """Account for one request with the flag on; returns True on a cache hit."""
+        if next(self._requests) % self.miss_every:
+            return True
+        with self._write_lock:
+            state = self._state
+            grow = min(
+                self.max_step,
+                num_catalog_ids + int(state.num_ids * self.growth_rate),
+                self.max_bytes // ID_BYTES - state.num_ids,
+            )
+            if grow > 0:
+                self._state = LeakState(state.num_ids + grow, state.chunks + (b'\x01' * (grow * ID_BYTES),))
+        return False
+
+    def reset(self):
+        """Release the leak, e.g. once the flag is turned off."""
+        with self._write_lock:
+            self._requests = itertools.count()
+            self._state = EMPTY
+
+    def observe_size(self, options):
+        """Observable gauge callback: bytes held by the leak."""
+        yield Observation(self.size_bytes)
@@ -0,0 +1,228 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import threading
+import time
+from typing import Any, Awaitable, Callable, Iterable, NamedTuple, Optional, Sequence, Tuple
+
+from circuit_breaker import CircuitBreaker, CircuitOpenError
+from product_index import ProductIndex
+
+
+class CatalogSnapshot(NamedTuple):
+    """Immutable view of the product catalog as of one ListProducts call."""
+    version: int
+    product_ids: Tuple[str, ...]
+    fetched_at: float
+    index: ProductIndex
+    # CategoryIndex over the same products, when the cache builds one
+    categories: Optional[Any] = None
+
+
+class CatalogCache:
+    """Process-wide product catalog snapshot with background TTL refresh.
+
+    Readers always get the current snapshot without blocking, except on a cold
+    start where exactly one caller fetches and the others wait for it. Once the
+    TTL expires a single background thread refreshes the snapshot; if that
+    refresh fails the stale snapshot keeps being served and the refresh is
+    retried after ``retry_seconds``.
+
+    When ``fetch_async`` is given, ``get_async`` offers the same behaviour to
+    asyncio callers, fetching on an event loop task instead of a thread. The
+    snapshot is still built on a worker thread so that the indexes do not
+    stall the loop.
+
+    An optional ``breaker`` guards the fetches. While it is open, refreshes
+    are postponed until its half-open probe is due, and a cold start raises
+    CircuitOpenError straight away instead of waiting on the catalog.
+
+    With ``category_index``, the fetch functions return (product id,
+    categories) pairs instead of product ids, and every snapshot also gets
+    ``category_index(index, categories)``, built on the refreshing thread.
+    """
+
+    def __init__(
+        self, fetch: Optional[Callable[[], Iterable[str]]], rec_svc_metrics, logger,
+        ttl_seconds: float = 30.0, max_products: int = 10000,
+        retry_seconds: float = 5.0,
+        fetch_async: Optional[Callable[[], Awaitable[Iterable[str]]]] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        category_index: Optional[Callable[[ProductIndex, Sequence[Sequence[str]]], Any]] = None,
+    ):
+        self._fetch = fetch
+        self._fetch_async = fetch_async
+        self._breaker = breaker
+        self._category_index = category_index
+        self._metrics = rec_svc_metrics
+        self._logger = logger
+        self.ttl_seconds = ttl_seconds
+        self.max_products = max_products
+        self.retry_seconds = retry_seconds
+
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._refresh_at = 0.0
+        self._version = 0
+        self._cold_lock = threading.Lock()
+        self._cold_lock_async: Optional[asyncio.Lock] = None
+        self._refresh_lock = threading.Lock()
+        self._refreshing = False
+        # The event loop only keeps weak references to its tasks
+        self._refresh_tasks = set()
+
+    def get(self) -> CatalogSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self._load_cold()
+
+        self._metrics["app_recommendation_catalog_cache_hits"].add(1)
+        if time.monotonic() >= self._refresh_at and self._start_refresh():
+            threading.Thread(target=self._background_refresh, name="catalog-refresh", daemon=True).start()
+        return snapshot
+
+    async def get_async(self) -> CatalogSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            return await self._load_cold_async()
+
+        self._metrics["app_recommendation_catalog_cache_hits"].add(1)
+        if time.monotonic() >= self._refresh_at and self._start_refresh():
+            task = asyncio.get_running_loop().create_task(self._background_refresh_async())
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_tasks.discard)
+        return snapshot
+
+    def peek(self) -> Optional[CatalogSnapshot]:
+        """Return the current snapshot, or None if the cache is still cold."""
+        return self._snapshot
+
+    def warm(self) -> bool:
+        """Whether a snapshot is loaded; if not, start loading one in the background."""
+        if self._snapshot is not None:
+            return True
+        if time.monotonic() >= self._refresh_at and self._start_refresh():
+            threading.Thread(target=self._background_refresh, name="catalog-refresh", daemon=True).start()
+        return False
+
+    def _load_cold(self) -> CatalogSnapshot:
+        with self._cold_lock:
+            snapshot = self._snapshot
+            if snapshot is not None:
+                # Another thread finished the cold fetch while we waited
+                self._metrics["app_recommendation_catalog_cache_hits"].add(1)
+                return snapshot
+            self._metrics["app_recommendation_catalog_cache_misses"].add(1)
+            return self._refresh()
+
+    async def _load_cold_async(self) -> CatalogSnapshot:
+        if self._cold_lock_async is None:
+            self._cold_lock_async = asyncio.Lock()
+        async with self._cold_lock_async:
+            snapshot = self._snapshot
+            if snapshot is not None:
+                self._metrics["app_recommendation_catalog_cache_hits"].add(1)
+                return snapshot
+            self._metrics["app_recommendation_catalog_cache_misses"].add(1)
+            return await self._refresh_async()
+
+    def _start_refresh(self) -> bool:
+        """Claim the single background refresh slot; False if already taken."""
+        with self._refresh_lock:
+            if self._refreshing:
+                return False
+            self._refreshing = True
+            return True
+
+    def _finish_refresh(self, err: Optional[Exception]):
+        if err is not None:
+            retry_seconds = self.retry_seconds
+            if self._breaker is not None:
+                retry_seconds = max(retry_seconds, self._breaker.seconds_until_probe())
+            self._refresh_at = time.monotonic() + retry_seconds
+            self._logger.warning(f"catalog refresh failed, serving stale snapshot: {err}")
+        with self._refresh_lock:
+            self._refreshing = False
+
+    def _background_refresh(self):
+        try:
+            self._refresh()
+        except Exception as err:
+            self._finish_refresh(err)
+        else:
+            self._finish_refresh(None)
+
+    async def _background_refresh_async(self):
+        try:
+            await self._refresh_async()
+        except Exception as err:
+            self._finish_refresh(err)
+        else:
+            self._finish_refresh(None)
+
+    def _refresh(self) -> CatalogSnapshot:
+        self._check_breaker()
+        start = time.monotonic()
+        try:
+            product_ids = self._fetch()
+        except Exception:
+            self._record_failure(start)
+            raise
+        return self._publish(product_ids, start)
+
+    async def _refresh_async(self) -> CatalogSnapshot:
+        self._check_breaker()
+        start = time.monotonic()
+        try:
+            product_ids = await self._fetch_async()
+        except Exception:
+            self._record_failure(start)
+            raise
+        return await asyncio.to_thread(self._publish, product_ids, start)
+
+    def _check_breaker(self):
+        if self._breaker is not None and not self._breaker.allow():
+            raise CircuitOpenError("product catalog circuit is open")
+
+    def _record_failure(self, start: float):
+        self._record_refresh(start, 'error')
+        if self._breaker is not None:
+            self._breaker.record_failure()
+
+    def _record_refresh(self, start: float, status: str):
+        self._metrics["app_recommendation_catalog_refresh_duration"].record(
+            time.monotonic() - start, {'refresh.status': status})
+
+    def _publish(self, products: Iterable, start: float) -> CatalogSnapshot:
+        if self._category_index is None:
+            product_ids = tuple(dict.fromkeys(products))
+            categories = None
+        else:
+            # The first occurrence of a product id wins, as without categories
+            by_id = {}
+            for product_id, product_categories in products:
+                by_id.setdefault(product_id, product_categories)
+            product_ids = tuple(by_id)
+            categories = tuple(by_id.values())
+        self._record_refresh(start, 'ok')
+        if self._breaker is not None:
+            self._breaker.record_success()
+
+        if len(product_ids) > self.max_products:
+            self._logger.warning(
+                f"catalog returned {len(product_ids)} products, keeping the first {self.max_products}")
+            product_ids = product_ids[:self.max_products]
+
+        index = ProductIndex(product_ids)
+        category_index = None
+        if categories is not None:
+            category_index = self._category_index(index, categories[:len(product_ids)])
+
+        now = time.monotonic()
+        self._version += 1
+        snapshot = CatalogSnapshot(self._version, product_ids, now, index, category_index)
+        self._snapshot = snapshot
+        self._refresh_at = now + self.ttl_seconds
+        return snapshot
@@ -0,0 +1,103 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import itertools
+import json
+
+import grpc
+
+import demo_pb2_grpc
+
+CATALOG_SERVICE = 'oteldemo.ProductCatalogService'
+
+
+class CatalogChannelFactory:
+    """Builds the channels recommendation uses to reach product-catalog.
+
+    The target is resolved through DNS so every replica behind the
+    product-catalog service name becomes a subchannel, and calls are spread
+    over them with the ``lb_policy`` load balancer. ``pool_size`` channels are
+    created, each with its own subchannels, so one busy HTTP/2 connection
+    does not cap throughput to a backend. Deadlines and retries of
+    UNAVAILABLE calls are applied by gRPC through the service config.
+    """
+
+    def __init__(
+        self, target: str, pool_size: int = 1, lb_policy: str = 'round_robin',
+        keepalive_seconds: float = 30.0, deadline_seconds: float = 2.0, max_attempts: int = 3,
+    ):
+        # Plain host:port addresses go through the DNS resolver rather than
+        # the default one, which would also resolve but never re-resolve on
+        # its own when replicas are added.
+        if ':///' not in target and not target.startswith(('ipv4:', 'ipv6:', 'unix:')):
+            target = f'dns:///{target}'
+        self.target = target
+        self.pool_size = pool_size
+        self.lb_policy = lb_policy
+        self.keepalive_seconds = keepalive_seconds
+        self.deadline_seconds = deadline_seconds
+        self.max_attempts = max_attempts
+
+    def service_config(self) -> str:
+        method_config = {
+            'name': [{'service': CATALOG_SERVICE}],
+            'timeout': f'{self.deadline_seconds:.3f}s',
+        }
+        if self.max_attempts > 1:
+            method_config['retryPolicy'] = {
+                'maxAttempts': self.max_attempts,
+                'initialBackoff': '0.1s',
+                'maxBackoff': '1s',
+                'backoffMultiplier': 2,
+                'retryableStatusCodes': ['UNAVAILABLE'],
+            }
+        return json.dumps({
+            'loadBalancingConfig': [{self.lb_policy: {}}],
+            'methodConfig': [method_config],
+        })
+
+    def options(self):
+        keepalive_ms = int(self.keepalive_seconds * 1000)
+        return [
+            ('grpc.service_config', self.service_config()),
+            # Ignore service configs published through DNS TXT records
+            ('grpc.service_config_disable_resolution', 1),
+            ('grpc.enable_retries', 1),
+            ('grpc.keepalive_time_ms', keepalive_ms),
+            ('grpc.keepalive_timeout_ms', min(keepalive_ms, 10000)),
+            ('grpc.keepalive_permit_without_calls', 1),
+            ('grpc.http2.max_pings_without_data', 0),
+            # Without this, channels with identical arguments share one set of
+            # subchannels process-wide and the pool would be a single connection
+            ('grpc.use_local_subchannel_pool', 1),
+        ]
+
+    def create_stubs(self):
+        options = self.options()
+        return CatalogStubs([grpc.insecure_channel(self.target, options=options) for _ in range(self.pool_size)])
+
+    def create_stubs_async(self):
+        """Like create_stubs() for grpc.aio; call from the event loop that uses them."""
+        options = self.options()
+        return CatalogStubs([grpc.aio.insecure_channel(self.target, options=options) for _ in range(self.pool_size)])
+
+
+class CatalogStubs:
+    """ProductCatalogService stubs over a pool of channels, handed out in turn."""
+
+    def __init__(self, channels):
+        self.channels = channels
+        self._stubs = itertools.cycle([demo_pb2_grpc.ProductCatalogServiceStub(channel) for channel in channels])
+
+    def next(self):
+        return next(self._stubs)
+
+    def close(self):
+        for channel in self.channels:
+            channel.close()
+
+    async def close_async(self):
+        for channel in self.channels:
+            await channel.close()
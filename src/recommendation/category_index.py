@@ -0,0 +1,191 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+from typing import AbstractSet, List, Sequence
+
+import numpy as np
+
+from product_index import ProductIndex
+
+# Score a related category contributes, relative to a category the request's
+# products have, per unit of cosine similarity
+RELATED_WEIGHT = 0.5
+# Weight of the categories of a user's earlier products, relative to the
+# categories of the request's products
+HISTORY_WEIGHT = 0.5
+
+
+class CategoryIndex:
+    """Content-based recommendations from product categories.
+
+    Built once per catalog snapshot, aligned with the positions of its
+    ProductIndex. Products with the same set of categories always score the
+    same, so they are grouped by category set and no per-request work is
+    proportional to the catalog size. All arrays are CSR style: the entries
+    of row ``r`` are ``values[offsets[r]:offsets[r + 1]]``.
+
+    * ``group_categories``: the categories of each group
+    * ``members``: the product positions of each group
+    * ``category_groups``: the inverted index, the groups of each category
+    * ``related_categories``/``related_weights``: the sparse co-category
+        similarity matrix, the cosine similarity of the product counts of
+        every two categories that share a product, without the diagonal
+
+    ``related()`` gives each category of the request's products weight 1,
+    spreads ``RELATED_WEIGHT`` times that to similar categories, scores the
+    groups of the weighted categories through the inverted index, and picks
+    products from the best groups, at random within a group.
+    """
+
+    def __init__(self, index: ProductIndex, categories: Sequence[Sequence[str]]):
+        self.index = index
+        # category name -> id, and category set as received -> group id
+        category_ids = {}
+        raw_groups = {}
+        canonical_groups = {}
+        group_rows = []
+        group_of = []
+        for product_categories in categories:
+            raw = tuple(product_categories)
+            group = raw_groups.get(raw)
+            if group is None:
+                row = tuple(sorted({category_ids.setdefault(c, len(category_ids)) for c in raw}))
+                group = canonical_groups.setdefault(row, len(canonical_groups))
+                if group == len(group_rows):
+                    group_rows.append(row)
+                raw_groups[raw] = group
+            group_of.append(group)
+
+        self.categories = tuple(category_ids)
+        num_categories = len(self.categories)
+        num_groups = len(group_rows)
+        self.group_of = np.array(group_of, dtype=np.int32)
+
+        group_lengths = np.fromiter((len(row) for row in group_rows), dtype=np.int64, count=num_groups)
+        self.group_offsets = _offsets(group_lengths)
+        self.group_categories = np.fromiter(
+            (c for row in group_rows for c in row), dtype=np.int32, count=int(group_lengths.sum()))
+        entry_groups = np.repeat(np.arange(num_groups, dtype=np.int32), group_lengths)
+
+        group_sizes = np.bincount(self.group_of, minlength=num_groups)
+        self.member_offsets = _offsets(group_sizes)
+        self.members = np.argsort(self.group_of, kind="stable").astype(np.int32)
+
+        order = np.argsort(self.group_categories, kind="stable")
+        self._category_lengths = np.bincount(self.group_categories, minlength=num_categories)
+        self.category_offsets = _offsets(self._category_lengths)
+        self.category_groups = entry_groups[order]
+
+        self._build_similarity(group_lengths, entry_groups, group_sizes, num_categories)
+
+    def _build_similarity(self, group_lengths, entry_groups, group_sizes, num_categories):
+        # Every ordered pair of categories within each group, weighted by the
+        # number of products in the group
+        pair_counts = group_lengths[entry_groups]
+        left = np.repeat(self.group_categories, pair_counts).astype(np.int64)
+        starts = np.repeat(self.group_offsets[entry_groups], pair_counts)
+        within = np.arange(len(left)) - np.repeat(np.cumsum(pair_counts) - pair_counts, pair_counts)
+        right = self.group_categories[starts + within]
+        weights = np.repeat(group_sizes[entry_groups], pair_counts)
+
+        codes, inverse = np.unique(left * num_categories + right, return_inverse=True)
+        counts = np.bincount(inverse, weights=weights)
+        rows, cols = np.divmod(codes, num_categories)
+
+        diagonal = rows == cols
+        products_per_category = np.zeros(num_categories)
+        products_per_category[rows[diagonal]] = counts[diagonal]
+        rows, cols, counts = rows[~diagonal], cols[~diagonal], counts[~diagonal]
+
+        # codes are sorted, so the pairs already are in row order
+        self.related_offsets = _offsets(np.bincount(rows, minlength=num_categories))
+        self.related_categories = cols.astype(np.int32)
+        self.related_weights = counts / np.sqrt(products_per_category[rows] * products_per_category[cols])
+        self._related_rows = rows.astype(np.int32)
+
+    def __len__(self):
+        return len(self.index)
+
+    def category_weights(self, positions: AbstractSet[int]) -> np.ndarray:
+        """Weight of every category for a request with products at ``positions``."""
+        weights = np.zeros(len(self.categories))
+        if not positions:
+            return weights
+        groups = self.group_of[np.fromiter(positions, dtype=np.int64, count=len(positions))]
+        categories = self.group_categories[_ranges(self.group_offsets, groups)]
+        weights += np.bincount(categories, minlength=len(self.categories))
+        spread = np.bincount(
+            self._related_rows, weights=self.related_weights * weights[self.related_categories],
+            minlength=len(self.categories))
+        return weights + RELATED_WEIGHT * spread
+
+    def related(self, k: int, excluded: AbstractSet[int] = frozenset(),
+                history: AbstractSet[int] = frozenset()) -> List[str]:
+        """Pick up to k product ids related to the products at ``excluded``.
+
+        The products at ``excluded`` are the request's products: they seed
+        the scores and are never returned. The user's earlier products at
+        ``history`` seed them with ``HISTORY_WEIGHT`` and are not returned
+        either. Products that share no category with them, directly or
+        through a related category, only fill up the list, at random.
+        """
+        weights = self.category_weights(excluded)
+        if history:
+            weights += HISTORY_WEIGHT * self.category_weights(history)
+            excluded = excluded | history
+        categories = np.flatnonzero(weights)
+        chosen = []
+        if len(categories):
+            entries = _ranges(self.category_offsets, categories)
+            scores = np.bincount(
+                self.category_groups[entries],
+                weights=np.repeat(weights[categories], self._category_lengths[categories]),
+                minlength=len(self.member_offsets) - 1)
+            groups = np.flatnonzero(scores)
+            # Every group has a member, and the excluded products can empty
+            # at most len(excluded) groups, so this many groups always hold k
+            # products if the candidates do
+            top = k + len(excluded)
+            if len(groups) > top:
+                groups = groups[np.argpartition(-scores[groups], top)[:top]]
+            groups = groups[np.argsort(-scores[groups], kind="stable")]
+            chosen = self._pick(groups, k, excluded)
+
+        product_ids = self.index.product_ids
+        result = [product_ids[p] for p in chosen]
+        if len(result) < k:
+            result.extend(self.index.sample(k - len(result), excluded | set(chosen)))
+        return result
+
+    def _pick(self, groups, k: int, excluded: AbstractSet[int]) -> List[int]:
+        chosen = []
+        members = self.members
+        offsets = self.member_offsets
+        for group in groups.tolist():
+            start, end = int(offsets[group]), int(offsets[group + 1])
+            # Draw enough to make up for members that are excluded
+            draws = min(end - start, k - len(chosen) + len(excluded))
+            for i in random.sample(range(start, end), draws):
+                position = int(members[i])
+                if position not in excluded:
+                    chosen.append(position)
+                    if len(chosen) == k:
+                        return chosen
+        return chosen
+
+
+def _offsets(lengths: np.ndarray) -> np.ndarray:
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def _ranges(offsets: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Indices of the entries of ``rows`` of a CSR array, concatenated."""
+    starts = offsets[rows]
+    lengths = offsets[rows + 1] - starts
+    shifts = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    return np.arange(int(lengths.sum())) + shifts
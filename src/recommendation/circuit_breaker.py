@@ -0,0 +1,74 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import time
+
+from opentelemetry.metrics import Observation
+
+CLOSED = 'closed'
+HALF_OPEN = 'half_open'
+OPEN = 'open'
+
+# Values reported by the app_recommendation_catalog_circuit_state gauge
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency while its circuit is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker around one dependency.
+
+    After ``failure_threshold`` failed calls in a row the circuit opens and
+    ``allow()`` refuses calls for ``reset_seconds``. The first call allowed
+    after that is a half-open probe: it closes the circuit if it succeeds and
+    reopens it for another ``reset_seconds`` if it fails. Only one probe is
+    let through at a time.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_seconds: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def allow(self) -> bool:
+        if self._state == CLOSED:
+            return True
+        with self._lock:
+            if self._state == OPEN and time.monotonic() >= self._opened_at + self.reset_seconds:
+                self._state = HALF_OPEN
+                return True
+            return self._state == CLOSED
+
+    def seconds_until_probe(self) -> float:
+        """Time left before a half-open probe is allowed; 0 unless open."""
+        if self._state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_seconds - time.monotonic())
+
+    def record_success(self):
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+
+    def observe_state(self, options):
+        """Observable gauge callback: 0 closed, 1 half-open, 2 open."""
+        yield Observation(STATE_VALUES[self._state])
@@ -0,0 +1,122 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import threading
+import time
+
+from opentelemetry.metrics import Observation
+from openfeature.event import ProviderEvent
+
+
+class FlagCache:
+    """Process-local cache of boolean flag values, keyed by flag name.
+
+    Values are resolved through the OpenFeature client (and therefore the
+    FlagdProvider) on first use and then served from a dict. While flagd's
+    event stream is connected, PROVIDER_CONFIGURATION_CHANGED events evict the
+    flags that changed and cached values never expire. When the stream drops
+    (PROVIDER_ERROR / PROVIDER_STALE) values are only trusted for
+    ``ttl_seconds`` until the provider reports READY again.
+
+    The recommendation flags are not targeted, so the evaluation context is
+    not part of the cache key.
+    """
+
+    def __init__(self, client, rec_svc_metrics, ttl_seconds: float = 10.0):
+        self._client = client
+        self._metrics = rec_svc_metrics
+        self.ttl_seconds = ttl_seconds
+        # flag name -> (value, monotonic time it was resolved)
+        self._values = {}
+        # Bumped on every invalidation so that a value resolved concurrently
+        # with a configuration change is not written back into the cache
+        self._generation = 0
+        self._stream_connected = False
+        self._connected = threading.Event()
+
+        client.add_handler(ProviderEvent.PROVIDER_READY, self._on_ready)
+        client.add_handler(ProviderEvent.PROVIDER_CONFIGURATION_CHANGED, self._on_configuration_changed)
+        client.add_handler(ProviderEvent.PROVIDER_ERROR, self._on_disconnected)
+        client.add_handler(ProviderEvent.PROVIDER_STALE, self._on_disconnected)
+
+    @property
+    def stream_connected(self) -> bool:
+        return self._stream_connected
+
+    def wait_connected(self, timeout: float) -> bool:
+        """Block until flagd's event stream is connected; False on timeout."""
+        return self._connected.wait(timeout)
+
+    def get_boolean_value(self, flag_name: str, default: bool) -> bool:
+        entry = self._lookup(flag_name)
+        if entry is not None:
+            return entry[0]
+        generation = self._generation
+        value = self._client.get_boolean_value(flag_name, default)
+        self._store(flag_name, value, generation)
+        return value
+
+    async def get_boolean_value_async(self, flag_name: str, default: bool) -> bool:
+        entry = self._lookup(flag_name)
+        if entry is not None:
+            return entry[0]
+        generation = self._generation
+        # The flagd provider's async resolve calls the blocking one, so the
+        # miss is resolved on a worker thread to keep the event loop free
+        value = await asyncio.to_thread(self._client.get_boolean_value, flag_name, default)
+        self._store(flag_name, value, generation)
+        return value
+
+    def invalidate(self, flag_names=None):
+        self._generation += 1
+        if flag_names is None:
+            self._values = {}
+            return
+        values = dict(self._values)
+        for flag_name in flag_names:
+            values.pop(flag_name, None)
+        self._values = values
+
+    def observe_staleness(self, options):
+        """Observable gauge callback: seconds since each cached flag was resolved."""
+        now = time.monotonic()
+        for flag_name, (_, resolved_at) in self._values.items():
+            yield Observation(now - resolved_at, {
+                'feature_flag.key': flag_name,
+                'flagd.stream.connected': self._stream_connected,
+            })
+
+    def _lookup(self, flag_name: str):
+        entry = self._values.get(flag_name)
+        if entry is None:
+            return None
+        if not self._stream_connected and time.monotonic() - entry[1] >= self.ttl_seconds:
+            return None
+        self._metrics["app_recommendation_flag_evaluations"].add(
+            1, {'feature_flag.key': flag_name, 'app.cache_hit': True})
+        return entry
+
+    def _store(self, flag_name: str, value: bool, generation: int):
+        self._metrics["app_recommendation_flag_evaluations"].add(
+            1, {'feature_flag.key': flag_name, 'app.cache_hit': False})
+        if generation != self._generation:
+            return
+        # Copy-on-write keeps lookups lock free for concurrent readers
+        values = dict(self._values)
+        values[flag_name] = (value, time.monotonic())
+        self._values = values
+
+    def _on_ready(self, details):
+        self._stream_connected = True
+        self.invalidate()
+        self._connected.set()
+
+    def _on_configuration_changed(self, details):
+        self.invalidate(details.flags_changed)
+
+    def _on_disconnected(self, details):
+        self._stream_connected = False
+        self._connected.clear()
@@ -0,0 +1,214 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import queue
+import threading
+from typing import Callable, Dict, Iterable, Tuple
+
+import grpc
+from grpc_health.v1 import health_pb2
+from grpc_health.v1 import health_pb2_grpc
+
+SERVING = health_pb2.HealthCheckResponse.SERVING
+NOT_SERVING = health_pb2.HealthCheckResponse.NOT_SERVING
+SERVICE_UNKNOWN = health_pb2.HealthCheckResponse.SERVICE_UNKNOWN
+
+
+class InFlightRequests:
+    """Counts requests being handled, to tell when the server is saturated."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        with self._lock:
+            self.count += 1
+
+    def __exit__(self, *exc_info):
+        with self._lock:
+            self.count -= 1
+
+    def saturated(self) -> bool:
+        return self.count >= self.capacity
+
+
+class HealthMonitor:
+    """Readiness of this process, derived from named dependency checks.
+
+    Every ``interval_seconds`` a background thread runs the checks (cheap,
+    in-memory predicates) and, when the overall status changes, pushes the new
+    status to every registered listener. The process is SERVING only while
+    all checks pass. After ``shutdown()`` it stays NOT_SERVING.
+    """
+
+    def __init__(self, checks: Dict[str, Callable[[], bool]], interval_seconds: float = 1.0):
+        self._checks = checks
+        self.interval_seconds = interval_seconds
+        self._status = NOT_SERVING
+        self._failing = tuple(checks)
+        self._listeners = frozenset()
+        self._shutting_down = False
+        self._stopped = threading.Event()
+        # Serializes status changes and the listener calls that report them.
+        # Removing a listener only takes _listeners_lock: a listener may block
+        # on the gRPC call it writes to while that call is being torn down.
+        self._notify_lock = threading.Lock()
+        self._listeners_lock = threading.Lock()
+
+    @property
+    def status(self):
+        return self._status
+
+    @property
+    def failing(self) -> Tuple[str, ...]:
+        """Names of the checks that failed on the last evaluation."""
+        return self._failing
+
+    def start(self):
+        self.refresh()
+        threading.Thread(target=self._run, name="health-monitor", daemon=True).start()
+
+    def shutdown(self):
+        """Report NOT_SERVING from now on, e.g. while draining on SIGTERM."""
+        self._shutting_down = True
+        self._stopped.set()
+        self.refresh()
+
+    def refresh(self):
+        failing = tuple(name for name, check in self._checks.items() if not self._passes(check))
+        status = NOT_SERVING if failing or self._shutting_down else SERVING
+        with self._notify_lock:
+            self._failing = failing
+            if status == self._status:
+                return
+            self._status = status
+            for listener in self._listeners:
+                listener(status)
+
+    def add_listener(self, listener: Callable[[int], None]):
+        """Register ``listener`` and call it right away with the current status."""
+        with self._notify_lock:
+            with self._listeners_lock:
+                self._listeners = self._listeners | {listener}
+            listener(self._status)
+
+    def remove_listener(self, listener: Callable[[int], None]):
+        with self._listeners_lock:
+            self._listeners = self._listeners - {listener}
+
+    def _run(self):
+        while not self._stopped.wait(self.interval_seconds):
+            self.refresh()
+
+    @staticmethod
+    def _passes(check) -> bool:
+        try:
+            return bool(check())
+        except Exception:
+            return False
+
+
+class HealthServicer(health_pb2_grpc.HealthServicer):
+    """grpc.health.v1 servicer for the thread pool server.
+
+    Watch streams are non-blocking: status changes are pushed through the
+    server's response callback, so an open stream does not hold a worker
+    thread. ``details`` returns extra key/value pairs sent as trailing
+    metadata on Check.
+    """
+
+    def __init__(
+        self, monitor: HealthMonitor, service_names: Iterable[str],
+        details: Callable[[], Tuple[Tuple[str, str], ...]] = tuple,
+    ):
+        self._monitor = monitor
+        self._service_names = frozenset(service_names)
+        self._details = details
+
+    def Check(self, request, context):
+        if request.service not in self._service_names:
+            context.abort(grpc.StatusCode.NOT_FOUND, f"unknown service {request.service!r}")
+        context.set_trailing_metadata(check_metadata(self._monitor, self._details))
+        return health_pb2.HealthCheckResponse(status=self._monitor.status)
+
+    def Watch(self, request, context, send_response_callback=None):
+        responses = None
+        if send_response_callback is None:
+            # Called without the non-blocking extension, e.g. through an
+            # interceptor that does not forward it: fall back to a blocking
+            # response iterator.
+            responses = queue.SimpleQueue()
+            send_response_callback = responses.put
+
+        if request.service not in self._service_names:
+            send_response_callback(health_pb2.HealthCheckResponse(status=SERVICE_UNKNOWN))
+            listener = None
+        else:
+            def listener(status):
+                send_response_callback(health_pb2.HealthCheckResponse(status=status))
+            self._monitor.add_listener(listener)
+
+        def on_close():
+            if listener is not None:
+                self._monitor.remove_listener(listener)
+            if responses is not None:
+                responses.put(None)
+        context.add_callback(on_close)
+
+        if responses is not None:
+            return iter(responses.get, None)
+        return None
+
+
+HealthServicer.Watch.experimental_non_blocking = True
+
+
+class AsyncHealthServicer(health_pb2_grpc.HealthServicer):
+    """grpc.aio flavour of HealthServicer."""
+
+    def __init__(
+        self, monitor: HealthMonitor, service_names: Iterable[str],
+        details: Callable[[], Tuple[Tuple[str, str], ...]] = tuple,
+    ):
+        self._monitor = monitor
+        self._service_names = frozenset(service_names)
+        self._details = details
+
+    async def Check(self, request, context):
+        if request.service not in self._service_names:
+            await context.abort(grpc.StatusCode.NOT_FOUND, f"unknown service {request.service!r}")
+        context.set_trailing_metadata(check_metadata(self._monitor, self._details))
+        return health_pb2.HealthCheckResponse(status=self._monitor.status)
+
+    async def Watch(self, request, context):
+        if request.service not in self._service_names:
+            yield health_pb2.HealthCheckResponse(status=SERVICE_UNKNOWN)
+            # Keep the stream open until the client goes away, as the
+            # health checking protocol asks for
+            await asyncio.Event().wait()
+
+        loop = asyncio.get_running_loop()
+        statuses = asyncio.Queue()
+
+        def listener(status):
+            # Called from the monitor thread
+            loop.call_soon_threadsafe(statuses.put_nowait, status)
+
+        self._monitor.add_listener(listener)
+        try:
+            while True:
+                yield health_pb2.HealthCheckResponse(status=await statuses.get())
+        finally:
+            self._monitor.remove_listener(listener)
+
+
+def check_metadata(monitor: HealthMonitor, details) -> Tuple[Tuple[str, str], ...]:
+    metadata = tuple(details())
+    if monitor.failing:
+        metadata += (('failing-checks', ','.join(monitor.failing)),)
+    return metadata
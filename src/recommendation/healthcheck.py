@@ -0,0 +1,39 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Container health check for the recommendation service.
+
+Opens a grpc.health.v1 Watch stream and exits 0 as soon as the service
+reports SERVING, or 1 if it does not within the timeout. A replica that is
+still warming up therefore passes on the same check once it becomes ready,
+without Docker having to retry it.
+
+Usage: python healthcheck.py [timeout seconds]
+"""
+
+import os
+import sys
+
+import grpc
+from grpc_health.v1 import health_pb2
+from grpc_health.v1 import health_pb2_grpc
+
+
+def wait_until_serving(address: str, timeout: float) -> bool:
+    with grpc.insecure_channel(address) as channel:
+        stub = health_pb2_grpc.HealthStub(channel)
+        try:
+            for response in stub.Watch(health_pb2.HealthCheckRequest(), timeout=timeout, wait_for_ready=True):
+                if response.status == health_pb2.HealthCheckResponse.SERVING:
+                    return True
+        except grpc.RpcError:
+            pass
+    return False
+
+
+if __name__ == "__main__":
+    timeout = float(sys.argv[1]) if len(sys.argv) > 1 else 5.0
+    address = f"localhost:{os.environ.get('RECOMMENDATION_PORT', 8080)}"
+    sys.exit(0 if wait_until_serving(address, timeout) else 1)
@@ -4,6 +4,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+import random
 import sys
 from pythonjsonlogger import jsonlogger
 from opentelemetry import trace
@@ -17,12 +18,41 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
         if not log_record.get('otelSpanID'):
             log_record['otelSpanID'] = trace.format_span_id(trace.get_current_span().get_span_context().span_id)
 
-def getJSONLogger(name):
+
+class RequestLogger:
+    """Logger for the per-request hot path.
+
+    Messages take %-style arguments, so nothing is formatted unless a record
+    is actually emitted. Info logs are level gated and then sampled at
+    ``sample_rate`` (0 disables them, 1 keeps all); warnings and errors are
+    always passed through.
+    """
+    __slots__ = ("logger", "sample_rate")
+
+    def __init__(self, logger, sample_rate=1.0):
+        self.logger = logger
+        self.sample_rate = sample_rate
+
+    def info(self, msg, *args):
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return
+        self.logger.info(msg, *args, stacklevel=2)
+
+    def warning(self, msg, *args, **kwargs):
+        self.logger.warning(msg, *args, stacklevel=2, **kwargs)
+
+    def error(self, msg, *args, **kwargs):
+        self.logger.error(msg, *args, stacklevel=2, **kwargs)
+
+
+def getJSONLogger(name, level=logging.INFO):
     logger = logging.getLogger(name)
     handler = logging.StreamHandler(sys.stdout)
     formatter = CustomJsonFormatter('%(asctime)s %(levelname)s [%(name)s] [%(filename)s:%(lineno)d] [trace_id=%(otelTraceID)s span_id=%(otelSpanID)s] - %(message)s')
     handler.setFormatter(formatter)
     logger.addHandler(handler)
-    logger.setLevel(logging.INFO)
+    logger.setLevel(level)
     logger.propagate = False
     return logger
@@ -3,15 +3,161 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
-def init_metrics(meter):
+import time
+
+import grpc
+
+# Bucket boundaries, in seconds, of the latency histograms. The SDK defaults
+# (0, 5, 10, ... 10000) are meant for milliseconds and would put nearly every
+# request into the first bucket.
+RPC_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+STAGE_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05, 0.25, 1, 2.5)
+FETCH_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+
+
+def init_metrics(meter, observers=None):
+    # Callbacks for observable instruments, keyed by instrument name
+    observers = observers or {}
 
     # Recommendations counter
     app_recommendations_counter = meter.create_counter(
         'app_recommendations_counter', unit='recommendations', description="Counts the total number of given recommendations"
     )
 
+    # Request latency; recorded inside the request's spans, so sampled
+    # requests attach trace-linked exemplars
+    app_recommendation_rpc_duration = meter.create_histogram(
+        'app_recommendation_rpc_duration', unit='s', description="Duration of RecommendationService calls, as seen by the handler",
+        explicit_bucket_boundaries_advisory=RPC_BUCKETS,
+    )
+    app_recommendation_requests_in_flight = meter.create_up_down_counter(
+        'app_recommendation_requests_in_flight', unit='requests', description="RecommendationService calls being handled"
+    )
+    app_recommendation_catalog_fetch_duration = meter.create_histogram(
+        'app_recommendation_catalog_fetch_duration', unit='s', description="Time a request spent getting a catalog snapshot, including waits for a refresh",
+        explicit_bucket_boundaries_advisory=STAGE_BUCKETS,
+    )
+    app_recommendation_flag_evaluation_duration = meter.create_histogram(
+        'app_recommendation_flag_evaluation_duration', unit='s', description="Time a request spent evaluating feature flags",
+        explicit_bucket_boundaries_advisory=STAGE_BUCKETS,
+    )
+    app_recommendation_selection_duration = meter.create_histogram(
+        'app_recommendation_selection_duration', unit='s', description="Time spent filtering and sampling the catalog for one recommendation list",
+        explicit_bucket_boundaries_advisory=STAGE_BUCKETS,
+    )
+    app_recommendation_serialization_duration = meter.create_histogram(
+        'app_recommendation_serialization_duration', unit='s', description="Time spent building the response message",
+        explicit_bucket_boundaries_advisory=STAGE_BUCKETS,
+    )
+
+    # Product catalog snapshot cache
+    app_recommendation_catalog_cache_hits = meter.create_counter(
+        'app_recommendation_catalog_cache_hits', unit='requests', description="Counts requests served from the cached catalog snapshot"
+    )
+    app_recommendation_catalog_cache_misses = meter.create_counter(
+        'app_recommendation_catalog_cache_misses', unit='requests', description="Counts requests that had to wait for a catalog fetch"
+    )
+    app_recommendation_catalog_refresh_duration = meter.create_histogram(
+        'app_recommendation_catalog_refresh_duration', unit='s', description="Duration of product catalog snapshot refreshes",
+        explicit_bucket_boundaries_advisory=FETCH_BUCKETS,
+    )
+    meter.create_observable_gauge(
+        'app_recommendation_catalog_circuit_state', description="State of the product catalog circuit breaker: 0 closed, 1 half-open, 2 open",
+        callbacks=observers.get('app_recommendation_catalog_circuit_state', []),
+    )
+
+    # recommendationCacheFailure leak
+    meter.create_observable_gauge(
+        'app_recommendation_cache_leak_size', unit='By', description="Memory held by the emulated recommendationCacheFailure cache leak",
+        callbacks=observers.get('app_recommendation_cache_leak_size', []),
+    )
+
+    # Per-user history
+    meter.create_observable_gauge(
+        'app_recommendation_user_history_size', unit='By', description="Estimated memory held by the per-user product history store",
+        callbacks=observers.get('app_recommendation_user_history_size', []),
+    )
+
+    # Feature flag cache
+    app_recommendation_flag_evaluations = meter.create_counter(
+        'app_recommendation_flag_evaluations', unit='evaluations', description="Counts feature flag lookups, split by whether they were served from the cache"
+    )
+    meter.create_observable_gauge(
+        'app_recommendation_flag_cache_staleness', unit='s', description="Seconds since each cached feature flag value was resolved",
+        callbacks=observers.get('app_recommendation_flag_cache_staleness', []),
+    )
+
+    # Response cache
+    app_recommendation_response_cache_requests = meter.create_counter(
+        'app_recommendation_response_cache_requests', unit='requests', description="Counts response cache lookups, split by hit or miss"
+    )
+    app_recommendation_response_cache_evictions = meter.create_counter(
+        'app_recommendation_response_cache_evictions', unit='entries', description="Counts entries evicted from the response cache"
+    )
+
+    # Startup
+    app_recommendation_startup_phase_duration = meter.create_histogram(
+        'app_recommendation_startup_phase_duration', unit='s', description="Duration of each phase of process startup"
+    )
+
     rec_svc_metrics = {
         "app_recommendations_counter": app_recommendations_counter,
+        "app_recommendation_rpc_duration": app_recommendation_rpc_duration,
+        "app_recommendation_requests_in_flight": app_recommendation_requests_in_flight,
+        "app_recommendation_catalog_fetch_duration": app_recommendation_catalog_fetch_duration,
+        "app_recommendation_flag_evaluation_duration": app_recommendation_flag_evaluation_duration,
+        "app_recommendation_selection_duration": app_recommendation_selection_duration,
+        "app_recommendation_serialization_duration": app_recommendation_serialization_duration,
+        "app_recommendation_catalog_cache_hits": app_recommendation_catalog_cache_hits,
+        "app_recommendation_catalog_cache_misses": app_recommendation_catalog_cache_misses,
+        "app_recommendation_catalog_refresh_duration": app_recommendation_catalog_refresh_duration,
+        "app_recommendation_flag_evaluations": app_recommendation_flag_evaluations,
+        "app_recommendation_response_cache_requests": app_recommendation_response_cache_requests,
+        "app_recommendation_response_cache_evictions": app_recommendation_response_cache_evictions,
+        "app_recommendation_startup_phase_duration": app_recommendation_startup_phase_duration,
     }
 
     return rec_svc_metrics
+
+
+class RpcMetrics:
+    """Latency and in-flight instruments of one RPC method.
+
+    ``call()`` returns a context manager that counts the call as in flight
+    while it runs and records its duration once it ends. Handlers set
+    ``status`` on it to the code they abort with; an exception that escapes
+    without one is recorded as UNKNOWN. Attribute dicts are built once per
+    method and status, so recording allocates nothing.
+    """
+
+    def __init__(self, rec_svc_metrics, method: str):
+        self._duration = rec_svc_metrics["app_recommendation_rpc_duration"]
+        self._in_flight = rec_svc_metrics["app_recommendation_requests_in_flight"]
+        self._method_attributes = {'rpc.method': method}
+        self._status_attributes = {
+            code: {'rpc.method': method, 'rpc.grpc.status_code': code.value[0]} for code in grpc.StatusCode
+        }
+
+    def call(self):
+        return _RpcCall(self)
+
+
+class _RpcCall:
+    __slots__ = ('_metrics', '_start', 'status')
+
+    def __init__(self, rpc_metrics: RpcMetrics):
+        self._metrics = rpc_metrics
+        self.status = grpc.StatusCode.OK
+
+    def __enter__(self):
+        self._metrics._in_flight.add(1, self._metrics._method_attributes)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        duration = time.perf_counter() - self._start
+        status = self.status
+        if exc_type is not None and status == grpc.StatusCode.OK:
+            status = grpc.StatusCode.UNKNOWN
+        self._metrics._duration.record(duration, self._metrics._status_attributes[status])
+        self._metrics._in_flight.add(-1, self._metrics._method_attributes)
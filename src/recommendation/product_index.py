@@ -0,0 +1,55 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+from typing import AbstractSet, Iterable, List, Set
+
+
+class ProductIndex:
+    """Positional index over a de-duplicated list of product ids.
+
+    Built once per catalog snapshot so that sampling k recommendations costs
+    O(k + excluded) instead of copying the whole catalog on every request.
+    """
+    __slots__ = ("product_ids", "positions")
+
+    def __init__(self, product_ids: Iterable[str]):
+        self.product_ids = tuple(dict.fromkeys(product_ids))
+        self.positions = {product_id: i for i, product_id in enumerate(self.product_ids)}
+
+    def __len__(self):
+        return len(self.product_ids)
+
+    def positions_of(self, product_ids: Iterable[str]) -> Set[int]:
+        """Return the positions of the given ids that are in the index."""
+        positions = self.positions
+        return {positions[p] for p in product_ids if p in positions}
+
+    def sample(self, k: int, excluded: AbstractSet[int] = frozenset()) -> List[str]:
+        """Pick up to k distinct product ids whose positions are not in excluded."""
+        product_ids = self.product_ids
+        n = len(product_ids)
+        k = min(k, n - len(excluded))
+        if k <= 0:
+            return []
+
+        if 2 * (k + len(excluded)) > n:
+            # Dense case: rejection sampling would retry too often, so fall
+            # back to sampling from the explicit list of candidates.
+            candidates = [p for i, p in enumerate(product_ids) if i not in excluded]
+            return random.sample(candidates, k)
+
+        # Sparse case: at least half of the draws succeed, so the expected
+        # number of draws is below 2k.
+        chosen = set()
+        result = []
+        randrange = random.randrange
+        while len(result) < k:
+            i = randrange(n)
+            if i in excluded or i in chosen:
+                continue
+            chosen.add(i)
+            result.append(product_ids[i])
+        return result
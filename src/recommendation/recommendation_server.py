@@ -5,112 +5,278 @@
 
 
 # Python
-import os
-import random
-from concurrent import futures
+# Taken before the other imports so that the startup timings can report how
+# long they took
+import time
+module_loaded_ns = time.time_ns()
+
+import asyncio  # noqa: E402
+import os  # noqa: E402
+import signal  # noqa: E402
+from concurrent import futures  # noqa: E402
 
 # Pip
-import grpc
-from opentelemetry import trace, metrics
-from opentelemetry._logs import set_logger_provider
-from opentelemetry.exporter.otlp.proto.grpc._log_exporter import (
-    OTLPLogExporter,
-)
-from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
-from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
-from opentelemetry.sdk.resources import Resource
+import grpc  # noqa: E402
+from opentelemetry import trace, metrics  # noqa: E402
 
-from openfeature import api
-from openfeature.contrib.provider.flagd import FlagdProvider
+from openfeature import api  # noqa: E402
+from openfeature.contrib.provider.flagd import FlagdProvider  # noqa: E402
 
-from openfeature.contrib.hook.opentelemetry import TracingHook
+from openfeature.contrib.hook.opentelemetry import TracingHook  # noqa: E402
 
 # Local
-import logging
-import demo_pb2
-import demo_pb2_grpc
-from grpc_health.v1 import health_pb2
-from grpc_health.v1 import health_pb2_grpc
-
-from metrics import (
+import logging  # noqa: E402
+import demo_pb2  # noqa: E402
+import demo_pb2_grpc  # noqa: E402
+from grpc_health.v1 import health_pb2_grpc  # noqa: E402
+
+from logger import RequestLogger, getJSONLogger  # noqa: E402
+from metrics import (  # noqa: E402
+    RpcMetrics,
     init_metrics
 )
+from cache_leak import CacheLeak  # noqa: E402
+from catalog_cache import CatalogCache  # noqa: E402
+from catalog_channel import CatalogChannelFactory  # noqa: E402
+from circuit_breaker import CircuitBreaker, CircuitOpenError  # noqa: E402
+from flag_cache import FlagCache  # noqa: E402
+from health import AsyncHealthServicer, HealthMonitor, HealthServicer, InFlightRequests  # noqa: E402
+from request_parsing import InvalidRequestError, check_batch_size, normalize_product_ids  # noqa: E402
+from span_attributes import SpanAttributePolicy  # noqa: E402
+from startup import StartupTimer, process_start_ns  # noqa: E402
 
-cached_ids = []
-first_run = True
+# Optional, created in main() when RECOMMENDATION_RESPONSE_CACHE_TTL_SECONDS > 0
+response_cache = None
 
-class RecommendationService(demo_pb2_grpc.RecommendationServiceServicer):
-    def ListRecommendations(self, request, context):
-        prod_list = get_product_list(request.product_ids)
-        span = trace.get_current_span()
-        span.set_attribute("app.products_recommended.count", len(prod_list))
-        logger.info(f"Receive ListRecommendations for product ids:{prod_list}")
+# Optional, created in main() when RECOMMENDATION_USER_HISTORY_MAX_MB > 0
+user_history = None
 
-        # build and return response
-        response = demo_pb2.ListRecommendationsResponse()
-        response.product_ids.extend(prod_list)
+# Set in main() from RECOMMENDATION_ENGINE; recorded as recommendation.type
+recommendation_type = 'catalog'
+recommendation_attributes = {'recommendation.type': recommendation_type}
 
-        # Collect metrics for this service
-        rec_svc_metrics["app_recommendations_counter"].add(len(prod_list), {'recommendation.type': 'catalog'})
+# Set by run_worker() when running under supervisor.py
+worker_id = None
+workers_ready = None
 
-        return response
+# Names health checks can ask about; '' is the server as a whole
+HEALTH_SERVICE_NAMES = ('', 'oteldemo.RecommendationService')
 
-    def Check(self, request, context):
-        return health_pb2.HealthCheckResponse(
-            status=health_pb2.HealthCheckResponse.SERVING)
+# Recommendations taken from the user's history by the catalog engine
+HISTORY_SLOTS = 2
 
-    def Watch(self, request, context):
-        return health_pb2.HealthCheckResponse(
-            status=health_pb2.HealthCheckResponse.UNIMPLEMENTED)
+# Flags resolved during startup so the first requests hit a warm flag cache
+PREFETCH_FLAGS = ('recommendationCacheFailure',)
 
 
-def get_product_list(request_product_ids):
-    global first_run
-    global cached_ids
-    with tracer.start_as_current_span("get_product_list") as span:
-        max_responses = 5
-
-        # Formulate the list of characters to list of strings
-        request_product_ids_str = ''.join(request_product_ids)
-        request_product_ids = request_product_ids_str.split(',')
-
-        # Feature flag scenario - Cache Leak
-        if check_feature_flag("recommendationCacheFailure"):
-            span.set_attribute("app.recommendation.cache_enabled", True)
-            if random.random() < 0.5 or first_run:
-                first_run = False
-                span.set_attribute("app.cache_hit", False)
-                logger.info("get_product_list: cache miss")
-                cat_response = product_catalog_stub.ListProducts(demo_pb2.Empty())
-                response_ids = [x.id for x in cat_response.products]
-                cached_ids = cached_ids + response_ids
-                cached_ids = cached_ids + cached_ids[:len(cached_ids) // 4]
-                product_ids = cached_ids
-            else:
-                span.set_attribute("app.cache_hit", True)
-                logger.info("get_product_list: cache hit")
-                product_ids = cached_ids
-        else:
-            span.set_attribute("app.recommendation.cache_enabled", False)
-            cat_response = product_catalog_stub.ListProducts(demo_pb2.Empty())
-            product_ids = [x.id for x in cat_response.products]
-
-        span.set_attribute("app.products.count", len(product_ids))
-
-        # Create a filtered list of products excluding the products received as input
-        filtered_products = list(set(product_ids) - set(request_product_ids))
-        num_products = len(filtered_products)
-        span.set_attribute("app.filtered_products.count", num_products)
-        num_return = min(max_responses, num_products)
+class RecommendationService(demo_pb2_grpc.RecommendationServiceServicer):
+    def __init__(self, in_flight):
+        self._in_flight = in_flight
+        self._list_metrics = RpcMetrics(rec_svc_metrics, 'ListRecommendations')
+        self._batch_metrics = RpcMetrics(rec_svc_metrics, 'ListRecommendationsBatch')
 
-        # Sample list of indicies to return
-        indices = random.sample(range(num_products), num_return)
-        # Fetch product ids from indices
-        prod_list = [filtered_products[i] for i in indices]
+    def ListRecommendations(self, request, context):
+        with self._in_flight, self._list_metrics.call() as call:
+            try:
+                prod_list = get_product_list(request.product_ids, request.user_id)
+            except InvalidRequestError as err:
+                call.status = grpc.StatusCode.INVALID_ARGUMENT
+                context.abort(call.status, str(err))
+            except CircuitOpenError as err:
+                call.status = grpc.StatusCode.UNAVAILABLE
+                context.abort(call.status, str(err))
+            return build_response(prod_list)
+
+    def ListRecommendationsBatch(self, request, context):
+        with self._in_flight, self._batch_metrics.call() as call:
+            try:
+                prod_lists = get_product_lists(
+                    [r.product_ids for r in request.requests], [r.user_id for r in request.requests])
+            except InvalidRequestError as err:
+                call.status = grpc.StatusCode.INVALID_ARGUMENT
+                context.abort(call.status, str(err))
+            except CircuitOpenError as err:
+                call.status = grpc.StatusCode.UNAVAILABLE
+                context.abort(call.status, str(err))
+            return build_batch_response(prod_lists)
+
+
+class AsyncRecommendationService(demo_pb2_grpc.RecommendationServiceServicer):
+    """grpc.aio flavour of RecommendationService.
+
+    In-flight ListRecommendations calls are bounded by a semaphore rather than
+    by the size of a thread pool, so slow catalog or flagd calls only hold a
+    coroutine instead of a worker thread.
+    """
+
+    def __init__(self, in_flight):
+        self._semaphore = asyncio.Semaphore(in_flight.capacity)
+        self._in_flight = in_flight
+        self._list_metrics = RpcMetrics(rec_svc_metrics, 'ListRecommendations')
+        self._batch_metrics = RpcMetrics(rec_svc_metrics, 'ListRecommendationsBatch')
+
+    async def ListRecommendations(self, request, context):
+        # Timed from before the semaphore, so waiting for a slot counts too
+        with self._list_metrics.call() as call:
+            async with self._semaphore:
+                with self._in_flight:
+                    try:
+                        prod_list = await get_product_list_async(request.product_ids, request.user_id)
+                    except InvalidRequestError as err:
+                        call.status = grpc.StatusCode.INVALID_ARGUMENT
+                        await context.abort(call.status, str(err))
+                    except CircuitOpenError as err:
+                        call.status = grpc.StatusCode.UNAVAILABLE
+                        await context.abort(call.status, str(err))
+            return build_response(prod_list)
+
+    async def ListRecommendationsBatch(self, request, context):
+        with self._batch_metrics.call() as call:
+            async with self._semaphore:
+                with self._in_flight:
+                    try:
+                        prod_lists = await get_product_lists_async(
+                            [r.product_ids for r in request.requests], [r.user_id for r in request.requests])
+                    except InvalidRequestError as err:
+                        call.status = grpc.StatusCode.INVALID_ARGUMENT
+                        await context.abort(call.status, str(err))
+                    except CircuitOpenError as err:
+                        call.status = grpc.StatusCode.UNAVAILABLE
+                        await context.abort(call.status, str(err))
+            return build_batch_response(prod_lists)
+
+
+def build_response(prod_list):
+    start = time.perf_counter()
+    span = trace.get_current_span()
+    span_attributes.set(span, "app.products_recommended.count", len(prod_list))
+    request_logger.info("Receive ListRecommendations for product ids:%s", prod_list)
+
+    # build and return response
+    response = demo_pb2.ListRecommendationsResponse()
+    response.product_ids.extend(prod_list)
+
+    # Collect metrics for this service
+    rec_svc_metrics["app_recommendations_counter"].add(len(prod_list), recommendation_attributes)
+    rec_svc_metrics["app_recommendation_serialization_duration"].record(time.perf_counter() - start)
+
+    return response
+
+
+def build_batch_response(prod_lists):
+    start = time.perf_counter()
+    span = trace.get_current_span()
+    num_recommended = sum(len(prod_list) for prod_list in prod_lists)
+    span_attributes.set(span, "app.recommendation.batch_size", len(prod_lists))
+    span_attributes.set(span, "app.products_recommended.count", num_recommended)
+    request_logger.info("Receive ListRecommendationsBatch for %d requests", len(prod_lists))
+
+    response = demo_pb2.ListRecommendationsBatchResponse()
+    for prod_list in prod_lists:
+        response.responses.add().product_ids.extend(prod_list)
+
+    rec_svc_metrics["app_recommendations_counter"].add(num_recommended, recommendation_attributes)
+    rec_svc_metrics["app_recommendation_serialization_duration"].record(time.perf_counter() - start)
+
+    return response
+
+
+def get_product_list(request_product_ids, user_id=''):
+    with tracer.start_as_current_span("get_product_list") as span:
+        cache_failure = check_feature_flag("recommendationCacheFailure")
+        return select_products(span, request_product_ids, cache_failure, get_catalog_snapshot(), user_id)
 
-        span.set_attribute("app.filtered_products.list", prod_list)
 
-        return prod_list
+async def get_product_list_async(request_product_ids, user_id=''):
+    with tracer.start_as_current_span("get_product_list") as span:
+        cache_failure = await check_feature_flag_async("recommendationCacheFailure")
+        snapshot = await get_catalog_snapshot_async()
+        return select_products(span, request_product_ids, cache_failure, snapshot, user_id)
+
+
+def get_product_lists(requests_product_ids, user_ids):
+    # One flag evaluation and one catalog snapshot for the whole batch
+    with tracer.start_as_current_span("get_product_lists") as span:
+        span_attributes.set(span, "app.recommendation.batch_size", len(requests_product_ids))
+        check_batch_size(len(requests_product_ids), max_batch_requests)
+        cache_failure = check_feature_flag("recommendationCacheFailure")
+        snapshot = get_catalog_snapshot()
+        return [select_products(span, ids, cache_failure, snapshot, user_id)
+                for ids, user_id in zip(requests_product_ids, user_ids)]
+
+
+async def get_product_lists_async(requests_product_ids, user_ids):
+    with tracer.start_as_current_span("get_product_lists") as span:
+        span_attributes.set(span, "app.recommendation.batch_size", len(requests_product_ids))
+        check_batch_size(len(requests_product_ids), max_batch_requests)
+        cache_failure = await check_feature_flag_async("recommendationCacheFailure")
+        snapshot = await get_catalog_snapshot_async()
+        return [select_products(span, ids, cache_failure, snapshot, user_id)
+                for ids, user_id in zip(requests_product_ids, user_ids)]
+
+
+def select_products(span, request_product_ids, cache_failure, snapshot, user_id=''):
+    """Pick recommendations from a catalog snapshot; shared by both server modes."""
+    start = time.perf_counter()
+    max_responses = 5
+
+    request_product_ids = normalize_product_ids(
+        request_product_ids, max_ids=max_request_product_ids, strict=strict_requests)
+
+    index = snapshot.index
+
+    # Feature flag scenario - Cache Leak
+    if cache_failure:
+        span_attributes.set(span, "app.recommendation.cache_enabled", True)
+        cache_hit = cache_leak.request(len(index))
+        span_attributes.set(span, "app.cache_hit", cache_hit)
+        request_logger.info("get_product_list: cache %s", "hit" if cache_hit else "miss")
+        span_attributes.set(span, "app.products.count", len(cache_leak))
+    else:
+        if len(cache_leak):
+            cache_leak.reset()
+        span_attributes.set(span, "app.recommendation.cache_enabled", False)
+        span_attributes.set(span, "app.products.count", len(index))
+
+    # Sample products excluding the products received as input
+    excluded = index.positions_of(request_product_ids)
+    num_products = len(index) - len(excluded)
+    span_attributes.set(span, "app.filtered_products.count", num_products)
+
+    history = ()
+    if user_history is not None:
+        positions = index.positions
+        # In request order, so the last product is the most recent one
+        history = user_history.visit(user_id, [p for p in request_product_ids if p in positions])
+        history = [p for p in history if p in positions and positions[p] not in excluded]
+        span_attributes.set(span, "app.user_history.count", len(history))
+
+    # Personalized lists depend on more than the excluded products
+    if response_cache is not None and not cache_failure and not history:
+        prod_list = response_cache.get(snapshot.version, excluded, lambda: recommend(snapshot, max_responses, excluded))
+    else:
+        prod_list = recommend(snapshot, max_responses, excluded, history)
+
+    span_attributes.set_list(span, "app.filtered_products.list", prod_list)
+    rec_svc_metrics["app_recommendation_selection_duration"].record(time.perf_counter() - start)
+
+    return prod_list
+
+
+def recommend(snapshot, k, excluded, history=()):
+    """k products for a request whose products are at the ``excluded`` positions.
+
+    ``history`` lists the user's earlier products, most recent first, that
+    are in the catalog and not in the request.
+    """
+    index = snapshot.index
+    if snapshot.categories is not None:
+        return snapshot.categories.related(k, excluded, index.positions_of(history))
+    # Without categories, the bias is to lead with recently viewed products
+    recent = list(history[:HISTORY_SLOTS])
+    if not recent:
+        return index.sample(k, excluded)
+    return recent + index.sample(k - len(recent), excluded | index.positions_of(recent))
 
 
 def must_map_env(key: str):
@@ -120,23 +286,159 @@ def must_map_env(key: str):
     return value
 
 
+def fetch_catalog_product_ids():
+    cat_response = catalog_stubs.next().ListProducts(demo_pb2.Empty())
+    return [x.id for x in cat_response.products]
+
+
+async def fetch_catalog_product_ids_async():
+    cat_response = await catalog_stubs_async.next().ListProducts(demo_pb2.Empty())
+    return [x.id for x in cat_response.products]
+
+
+def fetch_catalog_products():
+    cat_response = catalog_stubs.next().ListProducts(demo_pb2.Empty())
+    return [(x.id, tuple(x.categories)) for x in cat_response.products]
+
+
+async def fetch_catalog_products_async():
+    cat_response = await catalog_stubs_async.next().ListProducts(demo_pb2.Empty())
+    return [(x.id, tuple(x.categories)) for x in cat_response.products]
+
+
+def get_catalog_snapshot():
+    start = time.perf_counter()
+    snapshot = catalog_cache.get()
+    rec_svc_metrics["app_recommendation_catalog_fetch_duration"].record(time.perf_counter() - start)
+    return snapshot
+
+
+async def get_catalog_snapshot_async():
+    start = time.perf_counter()
+    snapshot = await catalog_cache.get_async()
+    rec_svc_metrics["app_recommendation_catalog_fetch_duration"].record(time.perf_counter() - start)
+    return snapshot
+
+
 def check_feature_flag(flag_name: str):
-    # Initialize OpenFeature
-    client = api.get_client()
-    return client.get_boolean_value("recommendationCacheFailure", False)
+    start = time.perf_counter()
+    value = flag_cache.get_boolean_value(flag_name, False)
+    rec_svc_metrics["app_recommendation_flag_evaluation_duration"].record(time.perf_counter() - start)
+    return value
 
 
-if __name__ == "__main__":
-    service_name = must_map_env('OTEL_SERVICE_NAME')
-    api.set_provider(FlagdProvider(host=os.environ.get('FLAGD_HOST', 'flagd'), port=os.environ.get('FLAGD_PORT', 8013)))
-    api.add_hooks([TracingHook()])
+async def check_feature_flag_async(flag_name: str):
+    start = time.perf_counter()
+    value = await flag_cache.get_boolean_value_async(flag_name, False)
+    rec_svc_metrics["app_recommendation_flag_evaluation_duration"].record(time.perf_counter() - start)
+    return value
+
+
+def is_ready():
+    """True once every worker sharing the port has started serving."""
+    return workers_ready is None or all(workers_ready)
 
-    # Initialize Traces and Metrics
-    tracer = trace.get_tracer_provider().get_tracer(service_name)
-    meter = metrics.get_meter_provider().get_meter(service_name)
-    rec_svc_metrics = init_metrics(meter)
 
-    # Initialize Logs
+def create_health_monitor(in_flight):
+    """Readiness from the checks named in RECOMMENDATION_READINESS_CHECKS."""
+    checks = {
+        # A warm catalog cache; with the circuit breaker open, requests are
+        # only answered while there is a previous snapshot to serve them from
+        'catalog': catalog_cache.warm,
+        'flagd': lambda: flag_cache.stream_connected,
+        'saturation': lambda: not in_flight.saturated(),
+    }
+    unknown = set(readiness_checks) - set(checks)
+    if unknown:
+        raise Exception(f'RECOMMENDATION_READINESS_CHECKS has unknown checks {sorted(unknown)}')
+    enabled = {'workers': is_ready}
+    enabled.update((name, checks[name]) for name in readiness_checks)
+    return HealthMonitor(enabled, interval_seconds=health_interval_seconds)
+
+
+def health_details():
+    return (('catalog-circuit-state', catalog_breaker.state),)
+
+
+def mark_ready():
+    if workers_ready is not None:
+        workers_ready[worker_id] = 1
+
+
+def serve(port, max_workers, server_options=None):
+    server_start_ns = time.time_ns()
+
+    # Create gRPC server
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers), options=server_options)
+
+    # Add class to gRPC server
+    in_flight = InFlightRequests(max_workers)
+    health_monitor = create_health_monitor(in_flight)
+    demo_pb2_grpc.add_RecommendationServiceServicer_to_server(RecommendationService(in_flight), server)
+    health_pb2_grpc.add_HealthServicer_to_server(
+        HealthServicer(health_monitor, HEALTH_SERVICE_NAMES, details=health_details), server)
+
+    # Report NOT_SERVING and drain in-flight requests on SIGTERM instead of
+    # dropping them
+    def stop(*_):
+        health_monitor.shutdown()
+        server.stop(shutdown_grace_seconds)
+    signal.signal(signal.SIGTERM, stop)
+
+    # Start server
+    server.add_insecure_port(f'[::]:{port}')
+    server.start()
+    startup.mark('server', server_start_ns)
+    mark_ready()
+    health_monitor.start()
+    logger.info(f'Recommendation service started, listening on port {port}')
+    finish_startup()
+    server.wait_for_termination()
+
+
+async def serve_aio(port, catalog_channels, max_concurrency, server_options=None):
+    global catalog_stubs_async
+    server_start_ns = time.time_ns()
+    # grpc.aio channels must be created on the event loop that uses them
+    catalog_stubs_async = catalog_channels.create_stubs_async()
+
+    server = grpc.aio.server(options=server_options)
+    in_flight = InFlightRequests(max_concurrency)
+    health_monitor = create_health_monitor(in_flight)
+    demo_pb2_grpc.add_RecommendationServiceServicer_to_server(AsyncRecommendationService(in_flight), server)
+    health_pb2_grpc.add_HealthServicer_to_server(
+        AsyncHealthServicer(health_monitor, HEALTH_SERVICE_NAMES, details=health_details), server)
+
+    loop = asyncio.get_running_loop()
+    # The event loop only keeps weak references to its tasks
+    stop_tasks = set()
+
+    def stop():
+        health_monitor.shutdown()
+        task = loop.create_task(server.stop(shutdown_grace_seconds))
+        stop_tasks.add(task)
+        task.add_done_callback(stop_tasks.discard)
+    loop.add_signal_handler(signal.SIGTERM, stop)
+
+    server.add_insecure_port(f'[::]:{port}')
+    await server.start()
+    startup.mark('server', server_start_ns)
+    mark_ready()
+    health_monitor.start()
+    logger.info(f'Recommendation service (aio) started, listening on port {port}')
+    finish_startup()
+    await server.wait_for_termination()
+    await catalog_stubs_async.close_async()
+
+
+def init_log_export():
+    """Export the main logger's records over OTLP; deferred until after startup."""
+    from opentelemetry._logs import set_logger_provider
+    from opentelemetry.exporter.otlp.proto.grpc._log_exporter import OTLPLogExporter
+    from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
+    from opentelemetry.sdk._logs.export import BatchLogRecordProcessor
+    from opentelemetry.sdk.resources import Resource
+
     logger_provider = LoggerProvider(
         resource=Resource.create(
             {
@@ -149,25 +451,176 @@ if __name__ == "__main__":
     logger_provider.add_log_record_processor(BatchLogRecordProcessor(log_exporter))
     handler = LoggingHandler(level=logging.NOTSET, logger_provider=logger_provider)
 
-    # Attach OTLP handler to logger
-    logger = logging.getLogger('main')
+    # Attach OTLP handler to logger, replacing the startup stdout handler so
+    # that each record is only handled once
+    for stdout_handler in list(logger.handlers):
+        logger.removeHandler(stdout_handler)
     logger.addHandler(handler)
 
-    catalog_addr = must_map_env('PRODUCT_CATALOG_ADDR')
-    pc_channel = grpc.insecure_channel(catalog_addr)
-    product_catalog_stub = demo_pb2_grpc.ProductCatalogServiceStub(pc_channel)
 
-    # Create gRPC server
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+def prefetch_flags(timeout_seconds):
+    if not flag_cache.wait_connected(timeout_seconds):
+        # Resolving now would only wait out the provider's deadline per flag
+        logger.warning(f'flagd not connected after {timeout_seconds}s, flags resolve on first use')
+        return
+    for flag_name in PREFETCH_FLAGS:
+        check_feature_flag(flag_name)
 
-    # Add class to gRPC server
-    service = RecommendationService()
-    demo_pb2_grpc.add_RecommendationServiceServicer_to_server(service, server)
-    health_pb2_grpc.add_HealthServicer_to_server(service, server)
 
-    # Start server
+def prefetch_catalog():
+    try:
+        catalog_cache.get()
+    except Exception as err:
+        # The catalog readiness check keeps retrying in the background
+        logger.warning(f'catalog prefetch failed, starting cold: {err}')
+
+
+def finish_startup():
+    """Runs once the server accepts requests: deferred setup, then timings."""
+    with startup.phase('logs'):
+        init_log_export()
+    startup.report(tracer, rec_svc_metrics['app_recommendation_startup_phase_duration'])
+
+
+def main(server_options=None):
+    global tracer, rec_svc_metrics, logger, request_logger, catalog_stubs, catalog_cache, catalog_breaker, flag_cache
+    global shutdown_grace_seconds
+    global max_request_product_ids, max_batch_requests, strict_requests, response_cache, span_attributes
+    global readiness_checks, health_interval_seconds, cache_leak, service_name, startup
+    global recommendation_type, recommendation_attributes, user_history
+
+    # The OS start time has coarse resolution; never let it come after the imports began
+    startup = StartupTimer(min(process_start_ns(), module_loaded_ns))
+    startup.mark('interpreter', startup.started_ns, module_loaded_ns)
+    startup.mark('imports', module_loaded_ns)
+    startup_timeout_seconds = float(os.environ.get('RECOMMENDATION_STARTUP_TIMEOUT_SECONDS', 10))
+
+    service_name = must_map_env('OTEL_SERVICE_NAME')
+
+    with startup.phase('telemetry'):
+        # Initialize Traces and Metrics
+        tracer = trace.get_tracer_provider().get_tracer(service_name)
+        meter = metrics.get_meter_provider().get_meter(service_name)
+        rec_svc_metrics = init_metrics(meter, observers={
+            'app_recommendation_flag_cache_staleness': [lambda options: flag_cache.observe_staleness(options)],
+            'app_recommendation_catalog_circuit_state': [lambda options: catalog_breaker.observe_state(options)],
+            'app_recommendation_cache_leak_size': [lambda options: cache_leak.observe_size(options)],
+            'app_recommendation_user_history_size': [
+                lambda options: user_history.observe_size(options) if user_history is not None else ()],
+        })
+
+        # Logs go to stdout until init_log_export() adds the OTLP handler
+        logger = getJSONLogger('main', level=os.environ.get('RECOMMENDATION_LOG_LEVEL', 'INFO').upper())
+        request_logger = RequestLogger(logger, sample_rate=float(os.environ.get('RECOMMENDATION_LOG_SAMPLE_RATE', 1.0)))
+
+    with startup.phase('flagd'):
+        # Initialize OpenFeature
+        api.set_provider(
+            FlagdProvider(host=os.environ.get('FLAGD_HOST', 'flagd'), port=os.environ.get('FLAGD_PORT', 8013)))
+        api.add_hooks([TracingHook()])
+        flag_cache = FlagCache(
+            api.get_client(), rec_svc_metrics,
+            ttl_seconds=float(os.environ.get('RECOMMENDATION_FLAG_CACHE_TTL_SECONDS', 10)),
+        )
+        prefetch_flags(startup_timeout_seconds)
+
+    with startup.phase('catalog'):
+        catalog_channels = CatalogChannelFactory(
+            must_map_env('PRODUCT_CATALOG_ADDR'),
+            pool_size=int(os.environ.get('RECOMMENDATION_CATALOG_CHANNEL_POOL_SIZE', 1)),
+            lb_policy=os.environ.get('RECOMMENDATION_CATALOG_LB_POLICY', 'round_robin'),
+            keepalive_seconds=float(os.environ.get('RECOMMENDATION_CATALOG_KEEPALIVE_SECONDS', 30)),
+            deadline_seconds=float(os.environ.get('RECOMMENDATION_CATALOG_DEADLINE_SECONDS', 2)),
+            max_attempts=int(os.environ.get('RECOMMENDATION_CATALOG_MAX_ATTEMPTS', 3)),
+        )
+        catalog_stubs = catalog_channels.create_stubs()
+        catalog_breaker = CircuitBreaker(
+            failure_threshold=int(os.environ.get('RECOMMENDATION_CATALOG_BREAKER_FAILURES', 3)),
+            reset_seconds=float(os.environ.get('RECOMMENDATION_CATALOG_BREAKER_RESET_SECONDS', 30)),
+        )
+        recommendation_type = os.environ.get('RECOMMENDATION_ENGINE', 'catalog')
+        if recommendation_type == 'catalog':
+            fetch, fetch_async, category_index = fetch_catalog_product_ids, fetch_catalog_product_ids_async, None
+        elif recommendation_type == 'category':
+            # numpy is only imported when categories are used
+            from category_index import CategoryIndex
+            fetch, fetch_async, category_index = fetch_catalog_products, fetch_catalog_products_async, CategoryIndex
+        else:
+            raise Exception(f'RECOMMENDATION_ENGINE must be "catalog" or "category", got "{recommendation_type}"')
+        recommendation_attributes = {'recommendation.type': recommendation_type}
+        catalog_cache = CatalogCache(
+            fetch, rec_svc_metrics, logger,
+            ttl_seconds=float(os.environ.get('RECOMMENDATION_CATALOG_TTL_SECONDS', 30)),
+            max_products=int(os.environ.get('RECOMMENDATION_CATALOG_MAX_PRODUCTS', 10000)),
+            fetch_async=fetch_async,
+            breaker=catalog_breaker,
+            category_index=category_index,
+        )
+        prefetch_catalog()
+
+    response_cache_ttl_seconds = float(os.environ.get('RECOMMENDATION_RESPONSE_CACHE_TTL_SECONDS', 0))
+    if response_cache_ttl_seconds > 0:
+        from response_cache import ResponseCache
+        response_cache = ResponseCache(
+            rec_svc_metrics,
+            max_entries=int(os.environ.get('RECOMMENDATION_RESPONSE_CACHE_MAX_ENTRIES', 1024)),
+            ttl_seconds=response_cache_ttl_seconds,
+            pool_size=int(os.environ.get('RECOMMENDATION_RESPONSE_CACHE_POOL_SIZE', 4)),
+        )
+    user_history_max_mb = float(os.environ.get('RECOMMENDATION_USER_HISTORY_MAX_MB', 0))
+    if user_history_max_mb > 0:
+        from user_history import UserHistory
+        user_history = UserHistory(
+            max_bytes=int(user_history_max_mb * 2**20),
+            history_length=int(os.environ.get('RECOMMENDATION_USER_HISTORY_LENGTH', 8)),
+        )
+
+    cache_leak = CacheLeak(
+        max_bytes=int(float(os.environ.get('RECOMMENDATION_CACHE_LEAK_MAX_MB', 300)) * 2**20),
+        max_step=int(os.environ.get('RECOMMENDATION_CACHE_LEAK_MAX_STEP', 65536)),
+        growth_rate=float(os.environ.get('RECOMMENDATION_CACHE_LEAK_GROWTH_RATE', 0.25)),
+        miss_every=int(os.environ.get('RECOMMENDATION_CACHE_LEAK_MISS_EVERY', 2)),
+    )
+    shutdown_grace_seconds = float(os.environ.get('RECOMMENDATION_SHUTDOWN_GRACE_SECONDS', 10))
+    max_request_product_ids = int(os.environ.get('RECOMMENDATION_MAX_REQUEST_PRODUCT_IDS', 1000))
+    max_batch_requests = int(os.environ.get('RECOMMENDATION_MAX_BATCH_REQUESTS', 100))
+    strict_requests = os.environ.get('RECOMMENDATION_STRICT_REQUESTS', 'false').lower() == 'true'
+    span_attributes_mode = os.environ.get('RECOMMENDATION_SPAN_ATTRIBUTES', 'full')
+    if span_attributes_mode not in ('full', 'lean'):
+        raise Exception(f'RECOMMENDATION_SPAN_ATTRIBUTES must be "full" or "lean", got "{span_attributes_mode}"')
+    span_attributes = SpanAttributePolicy(
+        lean=span_attributes_mode == 'lean',
+        max_list_length=int(os.environ.get('RECOMMENDATION_SPAN_MAX_LIST_LENGTH', 10)),
+    )
+
+    # saturation is opt-in: the compose healthcheck watches readiness, and a
+    # service that is merely busy must not be marked unhealthy
+    readiness_checks = [c for c in os.environ.get('RECOMMENDATION_READINESS_CHECKS', 'catalog,flagd').split(',') if c]
+    health_interval_seconds = float(os.environ.get('RECOMMENDATION_HEALTH_INTERVAL_SECONDS', 1))
+
     port = must_map_env('RECOMMENDATION_PORT')
-    server.add_insecure_port(f'[::]:{port}')
-    server.start()
-    logger.info(f'Recommendation service started, listening on port {port}')
-    server.wait_for_termination()
+    server_mode = os.environ.get('RECOMMENDATION_SERVER_MODE', 'thread')
+    if server_mode == 'aio':
+        max_concurrency = int(os.environ.get('RECOMMENDATION_MAX_CONCURRENCY', 100))
+        asyncio.run(serve_aio(port, catalog_channels, max_concurrency, server_options))
+    elif server_mode == 'thread':
+        max_workers = int(os.environ.get('RECOMMENDATION_MAX_WORKERS', 10))
+        serve(port, max_workers, server_options)
+    else:
+        raise Exception(f'RECOMMENDATION_SERVER_MODE must be "thread" or "aio", got "{server_mode}"')
+
+    # Stop the flagd event stream before the interpreter tears down the
+    # OpenFeature event executor
+    api.shutdown()
+
+
+def run_worker(index, ready_flags):
+    """Entry point of a supervisor.py worker process."""
+    global worker_id, workers_ready
+    worker_id = index
+    workers_ready = ready_flags
+    main(server_options=[('grpc.so_reuseport', 1)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import List, Sequence
+
+
+class InvalidRequestError(ValueError):
+    """Raised for requests that are answered with INVALID_ARGUMENT."""
+
+
+class InvalidProductIdsError(InvalidRequestError):
+    """Raised in strict mode when a request's product_ids are malformed."""
+
+
+def check_batch_size(num_requests: int, max_requests: int):
+    """Reject a ListRecommendationsBatch call with more than ``max_requests`` sub-requests."""
+    if num_requests > max_requests:
+        raise InvalidRequestError(f"at most {max_requests} requests are accepted per batch, got {num_requests}")
+
+
+def normalize_product_ids(product_ids: Sequence[str], max_ids: int = 1000, strict: bool = False) -> List[str]:
+    """Turn ListRecommendationsRequest.product_ids into a flat list of ids.
+
+    Accepts the proper repeated-field form (``["A", "B"]``) as well as the two
+    legacy shapes older clients send: comma-joined ids (``["A,B"]``) and a
+    comma-joined string that was spread into one character per element
+    (``["A", ",", "B"]``), recognized by its ``","`` elements. Ids are
+    stripped of surrounding whitespace and empty ids are dropped.
+
+    At most ``max_ids`` ids are returned. In strict mode, exceeding the limit
+    or sending empty or whitespace-padded ids raises InvalidProductIdsError
+    instead of being silently repaired.
+    """
+    if not product_ids:
+        return []
+
+    # Single-character ids are valid ids ("A", "B"); only a "," element
+    # tells a string spread into characters apart
+    if len(product_ids) > 1 and len(product_ids[0]) == 1 and ',' in product_ids and max(map(len, product_ids)) == 1:
+        if strict:
+            raise InvalidProductIdsError("product_ids must be sent as a repeated field of ids")
+        return _parse_characters(product_ids, max_ids)
+
+    # Fast paths: only look at one element more than the cap and check the
+    # ids all at once on their comma-joined string, which keeps the work in C.
+    # Empty and whitespace-only ids take the slow path, which drops them.
+    ids = product_ids[:max_ids + 1]
+    joined = ','.join(ids)
+    # Unless an id contains a comma, the joined string has one per separator
+    separate = '' not in ids and joined.count(',') == len(ids) - 1
+    if joined.split(None, 1) == [joined]:
+        # No whitespace to strip
+        if separate:
+            return _cap(ids, max_ids, strict)
+        parts = joined.split(',', max_ids + 1)
+        if '' not in parts:
+            return _cap(parts[:max_ids + 1], max_ids, strict)
+    elif separate:
+        stripped = list(map(str.strip, ids))
+        if stripped == ids:
+            return _cap(ids, max_ids, strict)
+        if strict:
+            raise InvalidProductIdsError("product ids must not contain whitespace")
+        if '' not in stripped:
+            return _cap(stripped, max_ids, strict)
+
+    result = []
+    for product_id in product_ids:
+        remainder = product_id
+        while remainder is not None:
+            # Never split more of a huge comma-joined string than the cap needs
+            room = max_ids - len(result) + 1
+            raw = remainder.split(',', room)
+            remainder = raw.pop() if len(raw) > room else None
+            parts = list(map(str.strip, raw))
+            if strict and ('' in parts or parts != raw):
+                raise InvalidProductIdsError(f"malformed product ids {product_id!r}")
+            result.extend(filter(None, parts))
+            if len(result) > max_ids:
+                return _cap(result, max_ids, strict)
+    return result
+
+
+def _cap(ids: List[str], max_ids: int, strict: bool) -> List[str]:
+    if len(ids) > max_ids:
+        if strict:
+            raise InvalidProductIdsError(f"at most {max_ids} product ids are accepted")
+        del ids[max_ids:]
+    return ids
+
+
+def _parse_characters(characters: Sequence[str], max_ids: int) -> List[str]:
+    result = []
+    start = 0
+    for i, character in enumerate(characters):
+        if character != ',':
+            continue
+        _append_id(result, characters, start, i)
+        if len(result) == max_ids:
+            return result
+        start = i + 1
+    _append_id(result, characters, start, len(characters))
+    return result
+
+
+def _append_id(result: List[str], characters: Sequence[str], start: int, end: int):
+    product_id = ''.join(characters[start:end]).strip()
+    if product_id:
+        result.append(product_id)
@@ -0,0 +1,54 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import AbstractSet, Callable, Sequence, Tuple
+
+
+class ResponseCache:
+    """Short-lived LRU of recommendation lists keyed by exclusion set.
+
+    Entries are keyed by the catalog snapshot version and the excluded product
+    positions, so a catalog refresh never serves lists built from an older
+    snapshot. Each entry holds ``pool_size`` independently sampled lists and a
+    hit returns one of them at random: ``pool_size=1`` gives every caller the
+    same list until the entry expires, larger pools keep responses varied.
+    """
+
+    def __init__(self, rec_svc_metrics, max_entries: int = 1024, ttl_seconds: float = 5.0, pool_size: int = 4):
+        self._metrics = rec_svc_metrics
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.pool_size = pool_size
+        # (snapshot version, excluded positions) -> (expires at, pool of lists)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, version: int, excluded: AbstractSet[int],
+            compute: Callable[[], Sequence[str]]) -> Tuple[str, ...]:
+        key = (version, frozenset(excluded))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._metrics["app_recommendation_response_cache_requests"].add(1, {'app.cache_hit': True})
+                return random.choice(entry[1])
+
+        self._metrics["app_recommendation_response_cache_requests"].add(1, {'app.cache_hit': False})
+        pool = tuple(tuple(compute()) for _ in range(self.pool_size))
+        with self._lock:
+            self._entries[key] = (now + self.ttl_seconds, pool)
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        if evicted:
+            self._metrics["app_recommendation_response_cache_evictions"].add(evicted)
+        return random.choice(pool)
@@ -0,0 +1,33 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+from typing import Sequence
+
+
+class SpanAttributePolicy:
+    """Decides which per-request attributes end up on recommendation spans.
+
+    Nothing is built for spans that are not recording (unsampled or no-op
+    tracer). List-valued attributes are capped at ``max_list_length`` items so
+    a large candidate set cannot bloat span payloads; in ``lean`` mode they are
+    dropped entirely and only the scalar counts and flags are recorded.
+    """
+
+    __slots__ = ('lean', 'max_list_length')
+
+    def __init__(self, lean: bool = False, max_list_length: int = 10):
+        self.lean = lean
+        self.max_list_length = max_list_length
+
+    def set(self, span, key: str, value):
+        if span.is_recording():
+            span.set_attribute(key, value)
+
+    def set_list(self, span, key: str, values: Sequence[str]):
+        if self.lean or not span.is_recording():
+            return
+        if len(values) > self.max_list_length:
+            values = values[:self.max_list_length]
+        span.set_attribute(key, values)
@@ -0,0 +1,53 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import time
+from contextlib import contextmanager
+
+
+class StartupTimer:
+    """Wall-clock timings of the phases of process startup.
+
+    Phases are collected before telemetry is set up and reported afterwards
+    by ``report()``: as events on one ``startup`` span that is backdated to
+    the process start, and as points of a phase duration histogram.
+    """
+
+    def __init__(self, started_ns: int = None):
+        self.started_ns = started_ns if started_ns is not None else process_start_ns()
+        # (phase name, start, end) in nanoseconds since the epoch
+        self.phases = []
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.time_ns()
+        try:
+            yield
+        finally:
+            self.phases.append((name, start, time.time_ns()))
+
+    def mark(self, name: str, start_ns: int, end_ns: int = None):
+        """Record a phase that was timed elsewhere, e.g. before this object existed."""
+        self.phases.append((name, start_ns, end_ns if end_ns is not None else time.time_ns()))
+
+    def report(self, tracer, histogram):
+        span = tracer.start_span('startup', start_time=self.started_ns)
+        end_ns = self.started_ns
+        for name, start, end in self.phases:
+            duration = (end - start) / 1e9
+            span.add_event(
+                f'startup.{name}', {'startup.phase': name, 'startup.phase.duration': duration}, timestamp=end)
+            histogram.record(duration, {'startup.phase': name})
+            end_ns = max(end_ns, end)
+        span.end(end_time=end_ns)
+
+
+def process_start_ns() -> int:
+    """When the OS started this process, falling back to now."""
+    try:
+        import psutil
+        return int(psutil.Process().create_time() * 1e9)
+    except Exception:
+        return time.time_ns()
@@ -0,0 +1,137 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Pre-fork supervisor for the recommendation service.
+
+Starts RECOMMENDATION_WORKERS copies of recommendation_server.py that all
+bind RECOMMENDATION_PORT through SO_REUSEPORT, so the kernel spreads
+connections across cores. Crashed workers are restarted; SIGTERM is
+forwarded so every worker drains its in-flight requests before exiting.
+"""
+
+# Python
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from multiprocessing.connection import wait
+
+# Local
+from logger import getJSONLogger
+import recommendation_server
+
+logger = getJSONLogger('supervisor')
+
+RESTART_BACKOFF_SECONDS = 1.0
+# Time on top of the shutdown grace period for a worker's interpreter to exit
+EXIT_GRACE_SECONDS = 5.0
+
+
+class Supervisor:
+    def __init__(
+        self, num_workers: int, shutdown_grace_seconds: float,
+        target=recommendation_server.run_worker, restart_backoff_seconds: float = RESTART_BACKOFF_SECONDS,
+    ):
+        # spawn rather than fork: every worker builds its own gRPC runtime,
+        # OTel providers and catalog cache from scratch.
+        self._ctx = multiprocessing.get_context('spawn')
+        # One flag per worker, set by the worker once it serves and read by
+        # every worker's health check
+        self._ready = self._ctx.Array('b', num_workers, lock=False)
+        self._workers = [None] * num_workers
+        self._stopping = False
+        self._resource_attributes = os.environ.get('OTEL_RESOURCE_ATTRIBUTES', '')
+        self._target = target
+        self.shutdown_grace_seconds = shutdown_grace_seconds
+        self.restart_backoff_seconds = restart_backoff_seconds
+
+    @property
+    def ready(self) -> bool:
+        """Whether every worker reported ready, as the workers' health checks see it."""
+        return all(self._ready)
+
+    @property
+    def workers(self):
+        return list(self._workers)
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+
+        self.start()
+        while not self._stopping:
+            self.restart_exited(timeout=1.0)
+        self.drain()
+
+    def start(self):
+        for index in range(len(self._workers)):
+            self._start_worker(index)
+
+    def stop(self):
+        self._stopping = True
+
+    def restart_exited(self, timeout: float):
+        """Wait up to ``timeout`` for workers to exit and restart them.
+
+        A worker that exited is marked not ready until its replacement
+        reports ready. Returns the indexes of the restarted workers.
+        """
+        sentinels = {worker.sentinel: index for index, worker in enumerate(self._workers)}
+        restarted = []
+        for sentinel in wait(list(sentinels), timeout=timeout):
+            if self._stopping:
+                break
+            index = sentinels[sentinel]
+            self._ready[index] = 0
+            self._workers[index].join()
+            logger.warning(f'worker {index} exited with code {self._workers[index].exitcode}, restarting')
+            time.sleep(self.restart_backoff_seconds)
+            self._start_worker(index)
+            restarted.append(index)
+        return restarted
+
+    def _handle_stop(self, signum, frame):
+        self.stop()
+
+    def _start_worker(self, index: int):
+        self._ready[index] = 0
+        # Give each worker its own service.instance.id so their metric streams
+        # do not overwrite each other. The environment is copied at spawn time.
+        attributes = [a for a in self._resource_attributes.split(',') if a]
+        if not any(a.startswith('service.instance.id=') for a in attributes):
+            attributes.append(f'service.instance.id={socket.gethostname()}-{index}')
+        os.environ['OTEL_RESOURCE_ATTRIBUTES'] = ','.join(attributes)
+
+        worker = self._ctx.Process(
+            target=self._target, args=(index, self._ready),
+            name=f'recommendation-worker-{index}')
+        worker.start()
+        self._workers[index] = worker
+        logger.info(f'started worker {index} (pid {worker.pid})')
+
+    def drain(self):
+        """Send SIGTERM to every worker, then kill the ones that outlive the grace period."""
+        logger.info('stopping workers')
+        for worker in self._workers:
+            if worker.is_alive():
+                worker.terminate()
+
+        # Workers stop their gRPC server with this grace period; allow a little
+        # extra for interpreter shutdown before killing stragglers.
+        deadline = time.monotonic() + self.shutdown_grace_seconds + EXIT_GRACE_SECONDS
+        for index, worker in enumerate(self._workers):
+            worker.join(max(0.0, deadline - time.monotonic()))
+            if worker.is_alive():
+                logger.warning(f'worker {index} did not stop in time, killing it')
+                worker.kill()
+                worker.join()
+            self._ready[index] = 0
+
+
+if __name__ == "__main__":
+    num_workers = int(os.environ.get('RECOMMENDATION_WORKERS', os.cpu_count() or 1))
+    shutdown_grace_seconds = float(os.environ.get('RECOMMENDATION_SHUTDOWN_GRACE_SECONDS', 10))
+    Supervisor(num_workers, shutdown_grace_seconds).run()
@@ -0,0 +1,25 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+import os
+import sys
+
+import pytest
+from opentelemetry.metrics import NoOpMeter
+
+# The service modules live next to this directory and are imported flat,
+# the same way recommendation_server.py imports them inside the container.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metrics import init_metrics  # noqa: E402
+
+
+@pytest.fixture
+def rec_svc_metrics():
+    return init_metrics(NoOpMeter("recommendation-test"))
+
+
+@pytest.fixture
+def logger():
+    return logging.getLogger("recommendation-test")
@@ -0,0 +1,37 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+from cache_leak import ID_BYTES, CacheLeak
+
+
+def test_growth_is_deterministic():
+    leak = CacheLeak(growth_rate=0.25, miss_every=2)
+    hits = [leak.request(10) for _ in range(6)]
+
+    assert hits == [False, True, False, True, False, True]
+    # 10, then 10 + 10 + 2, then 22 + 10 + 5
+    assert len(leak) == 37
+    assert leak.size_bytes == 37 * ID_BYTES
+
+
+def test_growth_per_request_and_total_are_capped():
+    leak = CacheLeak(max_bytes=250 * ID_BYTES, max_step=100, growth_rate=1.0, miss_every=1)
+    sizes = []
+    for _ in range(5):
+        leak.request(1000)
+        sizes.append(len(leak))
+
+    assert sizes == [100, 200, 250, 250, 250]
+    assert [o.value for o in leak.observe_size(None)] == [250 * ID_BYTES]
+
+
+def test_reset_releases_the_leak():
+    leak = CacheLeak(miss_every=3)
+    leak.request(10)
+    leak.request(10)
+    leak.reset()
+
+    assert len(leak) == 0
+    # The miss cycle restarts, so the next request is a miss again
+    assert leak.request(10) is False
+    assert len(leak) == 10
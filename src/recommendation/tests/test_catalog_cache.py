@@ -0,0 +1,175 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from catalog_cache import CatalogCache
+from circuit_breaker import OPEN, CircuitBreaker, CircuitOpenError
+
+
+class FakeCatalog:
+    def __init__(self, product_ids, delay=0.0):
+        self.product_ids = list(product_ids)
+        self.delay = delay
+        self.calls = 0
+        self.fail = False
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("catalog unavailable")
+        return list(self.product_ids)
+
+
+def wait_for(predicate, timeout=2.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_cold_start_fetches_once(rec_svc_metrics, logger):
+    catalog = FakeCatalog(["A", "B", "C"], delay=0.05)
+    cache = CatalogCache(catalog, rec_svc_metrics, logger, ttl_seconds=60)
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert catalog.calls == 1
+    assert {snapshot.version for snapshot in results} == {1}
+    assert results[0].product_ids == ("A", "B", "C")
+
+
+def test_expired_snapshot_is_served_while_refreshing(rec_svc_metrics, logger):
+    catalog = FakeCatalog(["A"])
+    cache = CatalogCache(catalog, rec_svc_metrics, logger, ttl_seconds=0)
+    first = cache.get()
+
+    catalog.product_ids = ["A", "B"]
+    assert cache.get() is first
+    assert wait_for(lambda: cache.peek().version == 2)
+    assert cache.peek().product_ids == ("A", "B")
+
+
+def test_refresh_error_keeps_stale_snapshot(rec_svc_metrics, logger):
+    catalog = FakeCatalog(["A"])
+    cache = CatalogCache(catalog, rec_svc_metrics, logger, ttl_seconds=0, retry_seconds=60)
+    first = cache.get()
+
+    catalog.fail = True
+    assert cache.get() is first
+    assert wait_for(lambda: catalog.calls == 2)
+    assert wait_for(lambda: not cache._refreshing)
+    # The retry delay applies, so further reads neither block nor refetch
+    assert cache.get() is first
+    assert catalog.calls == 2
+
+
+def test_cold_start_error_propagates(rec_svc_metrics, logger):
+    catalog = FakeCatalog(["A"])
+    catalog.fail = True
+    cache = CatalogCache(catalog, rec_svc_metrics, logger)
+    with pytest.raises(RuntimeError):
+        cache.get()
+    assert cache.peek() is None
+
+
+def test_open_breaker_fails_cold_start_fast(rec_svc_metrics, logger):
+    catalog = FakeCatalog(["A"])
+    catalog.fail = True
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=60)
+    cache = CatalogCache(catalog, rec_svc_metrics, logger, breaker=breaker)
+    for _ in range(2):
+        with pytest.raises(RuntimeError):
+            cache.get()
+
+    assert breaker.state == OPEN
+    with pytest.raises(CircuitOpenError):
+        cache.get()
+    assert catalog.calls == 2
+
+
+def test_open_breaker_postpones_refresh_until_probe(rec_svc_metrics, logger):
+    catalog = FakeCatalog(["A"])
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=60)
+    cache = CatalogCache(catalog, rec_svc_metrics, logger, ttl_seconds=0, retry_seconds=0, breaker=breaker)
+    first = cache.get()
+
+    catalog.fail = True
+    assert cache.get() is first
+    assert wait_for(lambda: breaker.state == OPEN and not cache._refreshing)
+    assert cache._refresh_at - time.monotonic() > 50
+    assert cache.get() is first
+    assert catalog.calls == 2
+
+
+def test_snapshot_is_capped_and_deduplicated(rec_svc_metrics, logger):
+    catalog = FakeCatalog(["A", "B", "A", "C", "D"])
+    cache = CatalogCache(catalog, rec_svc_metrics, logger, max_products=3)
+    assert cache.get().product_ids == ("A", "B", "C")
+
+
+def test_snapshot_with_category_index(rec_svc_metrics, logger):
+    catalog = FakeCatalog([("A", ("x",)), ("B", ("y",)), ("A", ("z",)), ("C", ("x", "y"))])
+    built = []
+
+    def category_index(index, categories):
+        built.append((index.product_ids, categories))
+        return "category index"
+
+    cache = CatalogCache(catalog, rec_svc_metrics, logger, max_products=2, category_index=category_index)
+    snapshot = cache.get()
+    assert snapshot.product_ids == ("A", "B")
+    assert snapshot.categories == "category index"
+    assert built == [(("A", "B"), (("x",), ("y",)))]
+
+
+def test_async_cold_start_fetches_once(rec_svc_metrics, logger):
+    calls = []
+
+    async def fetch_async():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return ["A", "B"]
+
+    cache = CatalogCache(None, rec_svc_metrics, logger, ttl_seconds=0, fetch_async=fetch_async)
+
+    async def run():
+        snapshots = await asyncio.gather(*(cache.get_async() for _ in range(8)))
+        assert len(calls) == 1
+        assert {s.version for s in snapshots} == {1}
+        # The TTL has expired, so this read schedules a refresh task
+        assert (await cache.get_async()).version == 1
+        assert len(cache._refresh_tasks) == 1
+        await asyncio.sleep(0.1)
+        assert cache.peek().version == 2
+        assert not cache._refresh_tasks
+
+    asyncio.run(run())
+
+
+def test_async_refresh_builds_the_snapshot_off_the_event_loop(rec_svc_metrics, logger):
+    threads = []
+
+    async def fetch_async():
+        return [("A", ("x",))]
+
+    def category_index(index, categories):
+        threads.append(threading.current_thread())
+        return "category index"
+
+    cache = CatalogCache(None, rec_svc_metrics, logger, fetch_async=fetch_async, category_index=category_index)
+
+    assert asyncio.run(cache.get_async()).categories == "category index"
+    assert threads[0] is not threading.main_thread()
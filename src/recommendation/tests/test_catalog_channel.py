@@ -0,0 +1,74 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+from collections import Counter
+from concurrent import futures
+
+import grpc
+import pytest
+
+import demo_pb2
+import demo_pb2_grpc
+from catalog_channel import CatalogChannelFactory
+
+
+class Backend(demo_pb2_grpc.ProductCatalogServiceServicer):
+    def __init__(self, name, calls):
+        self.name = name
+        self.calls = calls
+
+    def ListProducts(self, request, context):
+        self.calls[self.name] += 1
+        return demo_pb2.ListProductsResponse(products=[demo_pb2.Product(id=self.name)])
+
+
+@pytest.fixture
+def backends():
+    """Three product-catalog backends on localhost, and the calls each served."""
+    calls = Counter()
+    servers, ports = [], []
+    for i in range(3):
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+        demo_pb2_grpc.add_ProductCatalogServiceServicer_to_server(Backend(f"backend-{i}", calls), server)
+        ports.append(server.add_insecure_port("127.0.0.1:0"))
+        server.start()
+        servers.append(server)
+    yield ports, calls
+    for server in servers:
+        server.stop(None)
+
+
+def fetch_all(stubs, n):
+    for _ in range(n):
+        stubs.next().ListProducts(demo_pb2.Empty(), wait_for_ready=True)
+
+
+@pytest.mark.parametrize("pool_size", [1, 3])
+def test_round_robin_spreads_calls_across_backends(backends, pool_size):
+    ports, calls = backends
+    target = "ipv4:" + ",".join(f"127.0.0.1:{port}" for port in ports)
+    stubs = CatalogChannelFactory(target, pool_size=pool_size).create_stubs()
+    try:
+        # Let every subchannel connect before counting
+        for channel in stubs.channels:
+            grpc.channel_ready_future(channel).result(timeout=5)
+        fetch_all(stubs, 30)
+        calls.clear()
+
+        fetch_all(stubs, 300)
+    finally:
+        stubs.close()
+
+    assert sorted(calls) == ["backend-0", "backend-1", "backend-2"]
+    assert all(80 <= count <= 120 for count in calls.values()), calls
+
+
+def test_service_config():
+    factory = CatalogChannelFactory("product-catalog:3550", deadline_seconds=0.5, max_attempts=1)
+    config = json.loads(factory.service_config())
+
+    assert factory.target == "dns:///product-catalog:3550"
+    assert config["loadBalancingConfig"] == [{"round_robin": {}}]
+    assert config["methodConfig"][0]["timeout"] == "0.500s"
+    assert "retryPolicy" not in config["methodConfig"][0]
@@ -0,0 +1,96 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+
+from category_index import RELATED_WEIGHT, CategoryIndex
+from product_index import ProductIndex
+
+# telescopes and binoculars share a category, "travel" overlaps with
+# "binoculars" only, and "books" is on its own
+CATALOG = {
+    "T1": ("telescopes",),
+    "T2": ("telescopes", "assembly"),
+    "T3": ("assembly", "telescopes"),
+    "B1": ("binoculars", "telescopes"),
+    "B2": ("binoculars", "travel"),
+    "R1": ("travel",),
+    "K1": ("books",),
+    "K2": ("books",),
+    "N1": (),
+}
+
+
+@pytest.fixture
+def categories():
+    index = ProductIndex(CATALOG)
+    return CategoryIndex(index, list(CATALOG.values()))
+
+
+def test_groups_and_inverted_index(categories):
+    # T2 and T3 list the same categories in a different order
+    assert categories.group_of[1] == categories.group_of[2]
+    assert len(categories.member_offsets) - 1 == 7
+
+    telescopes = categories.categories.index("telescopes")
+    start, end = categories.category_offsets[telescopes], categories.category_offsets[telescopes + 1]
+    groups = set(categories.category_groups[start:end].tolist())
+    members = {
+        int(categories.members[i])
+        for g in groups for i in range(categories.member_offsets[g], categories.member_offsets[g + 1])
+    }
+    assert members == {0, 1, 2, 3}
+
+
+def test_similarity_is_cosine_of_co_occurrence(categories):
+    names = categories.categories
+    related = {}
+    for row in range(len(names)):
+        for i in range(categories.related_offsets[row], categories.related_offsets[row + 1]):
+            related[names[row], names[categories.related_categories[i]]] = categories.related_weights[i]
+
+    # 4 telescopes, 2 assembly, 2 of them both
+    assert related["telescopes", "assembly"] == pytest.approx(2 / np.sqrt(4 * 2))
+    assert related["binoculars", "travel"] == related["travel", "binoculars"]
+    assert not any("books" in pair for pair in related)
+    assert not any(a == b for a, b in related)
+
+
+def test_related_products_share_categories(categories):
+    index = categories.index
+    excluded = index.positions_of(["T1"])
+    for _ in range(20):
+        result = categories.related(3, excluded)
+        assert len(result) == 3
+        assert set(result) == {"T2", "T3", "B1"}
+
+
+def test_related_categories_rank_below_shared_ones(categories):
+    excluded = categories.index.positions_of(["R1"])
+    weights = categories.category_weights(excluded)
+    assert weights[categories.categories.index("travel")] == 1
+    assert 0 < weights[categories.categories.index("binoculars")] < RELATED_WEIGHT
+    for _ in range(20):
+        assert categories.related(2, excluded) == ["B2", "B1"]
+
+
+def test_fills_up_at_random_without_related_products(categories):
+    excluded = categories.index.positions_of(["K1"])
+    for _ in range(20):
+        result = categories.related(5, excluded)
+        assert result[0] == "K2"
+        assert len(set(result)) == 5 and "K1" not in result
+
+    assert len(categories.related(5)) == 5
+    assert len(CategoryIndex(ProductIndex([]), []).related(5)) == 0
+
+
+def test_history_biases_towards_earlier_categories(categories):
+    index = categories.index
+    excluded = index.positions_of(["K1"])
+    history = index.positions_of(["R1"])
+    for _ in range(20):
+        result = categories.related(3, excluded, history)
+        assert result[:2] == ["K2", "B2"]
+        assert "R1" not in result
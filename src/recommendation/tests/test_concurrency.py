@@ -0,0 +1,92 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+import time
+from concurrent import futures
+
+import pytest
+from opentelemetry.trace import NoOpTracer
+
+import recommendation_server
+from cache_leak import CacheLeak
+from catalog_cache import CatalogCache
+from logger import RequestLogger
+from span_attributes import SpanAttributePolicy
+
+CATALOG = [f"P{i}" for i in range(20)]
+NUM_THREADS = 32
+REQUESTS_PER_THREAD = 200
+
+
+class SlowCatalog:
+    def __init__(self):
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self):
+        with self._lock:
+            self.calls += 1
+        # Long enough for every thread to pile up on the cold cache
+        time.sleep(0.1)
+        return list(CATALOG)
+
+
+class Flags:
+    def __init__(self, cache_failure):
+        self.cache_failure = cache_failure
+
+    def get_boolean_value(self, flag_name, default):
+        return self.cache_failure
+
+
+@pytest.fixture
+def server(monkeypatch, rec_svc_metrics, logger):
+    catalog = SlowCatalog()
+    for name, value in {
+        'tracer': NoOpTracer(),
+        'rec_svc_metrics': rec_svc_metrics,
+        'catalog_cache': CatalogCache(catalog, rec_svc_metrics, logger, ttl_seconds=60),
+        'cache_leak': CacheLeak(miss_every=2, growth_rate=0, max_step=1_000_000),
+        'span_attributes': SpanAttributePolicy(),
+        'request_logger': RequestLogger(logger),
+        'max_request_product_ids': 1000,
+        'strict_requests': False,
+        'response_cache': None,
+    }.items():
+        monkeypatch.setattr(recommendation_server, name, value, raising=False)
+    return catalog
+
+
+def hammer(requests_product_ids):
+    barrier = threading.Barrier(NUM_THREADS)
+
+    def worker(product_ids):
+        barrier.wait()
+        return [recommendation_server.get_product_list(product_ids) for _ in range(REQUESTS_PER_THREAD)]
+
+    with futures.ThreadPoolExecutor(NUM_THREADS) as pool:
+        return list(pool.map(worker, requests_product_ids))
+
+
+@pytest.mark.parametrize("cache_failure", [False, True])
+def test_concurrent_requests(server, monkeypatch, cache_failure):
+    monkeypatch.setattr(recommendation_server, 'flag_cache', Flags(cache_failure), raising=False)
+    requests_product_ids = [[CATALOG[i % len(CATALOG)]] for i in range(NUM_THREADS)]
+
+    results = hammer(requests_product_ids)
+
+    # A cold cache hit by every thread at once is fetched exactly once
+    assert server.calls == 1
+    for product_ids, prod_lists in zip(requests_product_ids, results):
+        for prod_list in prod_lists:
+            assert len(prod_list) == 5
+            assert len(set(prod_list)) == 5
+            assert set(prod_list) <= set(CATALOG) - set(product_ids)
+
+    if cache_failure:
+        # Every other request is a miss that leaks one catalog copy; a torn
+        # update would lose or duplicate some of them
+        misses = NUM_THREADS * REQUESTS_PER_THREAD // 2
+        assert len(recommendation_server.cache_leak) == misses * len(CATALOG)
+        assert len(recommendation_server.cache_leak._state.chunks) == misses
@@ -0,0 +1,94 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import threading
+
+from openfeature.event import EventDetails, ProviderEvent
+
+from flag_cache import FlagCache
+
+
+class FakeClient:
+    def __init__(self, values):
+        self.values = values
+        self.evaluations = 0
+        self.handlers = {}
+
+    def add_handler(self, event, handler):
+        self.handlers[event] = handler
+
+    def emit(self, event, flags_changed=None):
+        self.handlers[event](EventDetails(flags_changed=flags_changed))
+
+    def get_boolean_value(self, flag_name, default):
+        self.evaluations += 1
+        return self.values.get(flag_name, default)
+
+
+def test_values_are_cached_per_flag(rec_svc_metrics):
+    client = FakeClient({"a": True})
+    cache = FlagCache(client, rec_svc_metrics)
+    client.emit(ProviderEvent.PROVIDER_READY)
+
+    assert cache.get_boolean_value("a", False) is True
+    assert cache.get_boolean_value("b", False) is False
+    assert cache.get_boolean_value("a", False) is True
+    assert client.evaluations == 2
+
+
+def test_configuration_change_evicts_changed_flags(rec_svc_metrics):
+    client = FakeClient({"a": True, "b": True})
+    cache = FlagCache(client, rec_svc_metrics)
+    client.emit(ProviderEvent.PROVIDER_READY)
+    cache.get_boolean_value("a", False)
+    cache.get_boolean_value("b", False)
+
+    client.values["a"] = False
+    client.emit(ProviderEvent.PROVIDER_CONFIGURATION_CHANGED, flags_changed=["a"])
+
+    assert cache.get_boolean_value("a", True) is False
+    assert cache.get_boolean_value("b", False) is True
+    assert client.evaluations == 3
+
+
+def test_ttl_applies_while_stream_is_down(rec_svc_metrics):
+    client = FakeClient({"a": True})
+    cache = FlagCache(client, rec_svc_metrics, ttl_seconds=0)
+    client.emit(ProviderEvent.PROVIDER_READY)
+    cache.get_boolean_value("a", False)
+    cache.get_boolean_value("a", False)
+    assert client.evaluations == 1
+
+    client.emit(ProviderEvent.PROVIDER_ERROR)
+    cache.get_boolean_value("a", False)
+    cache.get_boolean_value("a", False)
+    assert client.evaluations == 3
+    assert [o.attributes["feature_flag.key"] for o in cache.observe_staleness(None)] == ["a"]
+
+
+def test_wait_connected_follows_the_event_stream(rec_svc_metrics):
+    client = FakeClient({})
+    cache = FlagCache(client, rec_svc_metrics)
+    assert cache.wait_connected(0.01) is False
+
+    client.emit(ProviderEvent.PROVIDER_READY)
+    assert cache.wait_connected(0.01) is True
+    client.emit(ProviderEvent.PROVIDER_ERROR)
+    assert cache.wait_connected(0.01) is False
+
+
+def test_async_misses_resolve_off_the_event_loop(rec_svc_metrics):
+    client = FakeClient({"a": True})
+    cache = FlagCache(client, rec_svc_metrics)
+    client.emit(ProviderEvent.PROVIDER_READY)
+    threads = []
+    resolve = client.get_boolean_value
+    client.get_boolean_value = lambda *args: (threads.append(threading.current_thread()), resolve(*args))[1]
+
+    async def run():
+        return [await cache.get_boolean_value_async("a", False) for _ in range(2)]
+
+    assert asyncio.run(run()) == [True, True]
+    assert client.evaluations == 1
+    assert threads[0] is not threading.main_thread()
@@ -0,0 +1,148 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import queue
+import threading
+from concurrent import futures
+
+import grpc
+import pytest
+from grpc_health.v1 import health_pb2
+from grpc_health.v1 import health_pb2_grpc
+
+from health import (
+    NOT_SERVING, SERVICE_UNKNOWN, SERVING,
+    AsyncHealthServicer, HealthMonitor, HealthServicer, InFlightRequests,
+)
+
+SERVICE_NAMES = ("", "oteldemo.RecommendationService")
+
+
+class Checks:
+    def __init__(self):
+        self.catalog = False
+
+    def monitor(self):
+        return HealthMonitor({"catalog": lambda: self.catalog}, interval_seconds=0.01)
+
+
+def test_monitor_pushes_status_changes():
+    checks = Checks()
+    monitor = checks.monitor()
+    statuses = []
+    monitor.add_listener(statuses.append)
+
+    monitor.refresh()
+    assert monitor.failing == ("catalog",)
+    checks.catalog = True
+    monitor.refresh()
+    monitor.refresh()
+    monitor.shutdown()
+    checks.catalog = True
+    monitor.refresh()
+
+    assert statuses == [NOT_SERVING, SERVING, NOT_SERVING]
+
+
+def test_failing_check_that_raises():
+    def broken():
+        raise RuntimeError("boom")
+
+    monitor = HealthMonitor({"broken": broken})
+    monitor.refresh()
+    assert monitor.status == NOT_SERVING
+    assert monitor.failing == ("broken",)
+
+
+def test_in_flight_saturation():
+    in_flight = InFlightRequests(2)
+    with in_flight:
+        assert not in_flight.saturated()
+        with in_flight:
+            assert in_flight.saturated()
+    assert in_flight.count == 0
+
+
+@pytest.fixture
+def health_server():
+    checks = Checks()
+    monitor = checks.monitor()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=1))
+    health_pb2_grpc.add_HealthServicer_to_server(
+        HealthServicer(monitor, SERVICE_NAMES, details=lambda: (("catalog-circuit-state", "closed"),)), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    monitor.start()
+    channel = grpc.insecure_channel(f"127.0.0.1:{port}")
+    yield checks, health_pb2_grpc.HealthStub(channel)
+    channel.close()
+    server.stop(None)
+    monitor.shutdown()
+
+
+def watch_in_background(stub, service=""):
+    statuses = queue.SimpleQueue()
+    call = stub.Watch(health_pb2.HealthCheckRequest(service=service))
+
+    def consume():
+        try:
+            for response in call:
+                statuses.put(response.status)
+        except grpc.RpcError:
+            pass
+    threading.Thread(target=consume, daemon=True).start()
+    return call, statuses
+
+
+def test_watch_streams_changes_without_holding_a_worker(health_server):
+    checks, stub = health_server
+    # The server has a single worker thread: two open Watch streams plus a
+    # Check only work if Watch does not block it.
+    first, first_statuses = watch_in_background(stub)
+    second, second_statuses = watch_in_background(stub, "oteldemo.RecommendationService")
+    assert first_statuses.get(timeout=5) == NOT_SERVING
+    assert second_statuses.get(timeout=5) == NOT_SERVING
+
+    response, call = stub.Check.with_call(health_pb2.HealthCheckRequest(), timeout=5)
+    assert response.status == NOT_SERVING
+    assert dict(call.trailing_metadata()) == {"catalog-circuit-state": "closed", "failing-checks": "catalog"}
+
+    checks.catalog = True
+    assert first_statuses.get(timeout=5) == SERVING
+    assert second_statuses.get(timeout=5) == SERVING
+    first.cancel()
+    second.cancel()
+
+
+def test_unknown_service(health_server):
+    _, stub = health_server
+    with pytest.raises(grpc.RpcError) as err:
+        stub.Check(health_pb2.HealthCheckRequest(service="nope"), timeout=5)
+    assert err.value.code() == grpc.StatusCode.NOT_FOUND
+
+    call, statuses = watch_in_background(stub, "nope")
+    assert statuses.get(timeout=5) == SERVICE_UNKNOWN
+    call.cancel()
+
+
+def test_async_watch_streams_changes():
+    checks = Checks()
+    monitor = checks.monitor()
+
+    async def run():
+        server = grpc.aio.server()
+        health_pb2_grpc.add_HealthServicer_to_server(AsyncHealthServicer(monitor, SERVICE_NAMES), server)
+        port = server.add_insecure_port("127.0.0.1:0")
+        await server.start()
+        monitor.start()
+        async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+            call = health_pb2_grpc.HealthStub(channel).Watch(health_pb2.HealthCheckRequest())
+            assert (await call.read()).status == NOT_SERVING
+            checks.catalog = True
+            assert (await asyncio.wait_for(call.read(), 5)).status == SERVING
+            call.cancel()
+        await server.stop(None)
+        monitor.shutdown()
+
+    asyncio.run(run())
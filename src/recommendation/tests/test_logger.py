@@ -0,0 +1,91 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import logging
+
+import pytest
+
+import logger as logger_module
+from logger import RequestLogger
+
+
+class Recorder(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class Unformattable:
+    """Fails the test if a message argument is ever rendered."""
+
+    def __str__(self):
+        raise AssertionError("argument was formatted")
+
+    __repr__ = __str__
+
+
+@pytest.fixture
+def recorded():
+    log = logging.getLogger("recommendation-test.request")
+    log.propagate = False
+    log.setLevel(logging.INFO)
+    handler = Recorder()
+    log.addHandler(handler)
+    yield log, handler.records
+    log.removeHandler(handler)
+
+
+def test_info_is_emitted_with_caller_location(recorded):
+    log, records = recorded
+    RequestLogger(log).info("got %s", "ids")
+    assert [r.getMessage() for r in records] == ["got ids"]
+    assert records[0].filename == "test_logger.py"
+
+
+def test_info_below_level_is_not_formatted_or_sampled(recorded, monkeypatch):
+    log, records = recorded
+    log.setLevel(logging.WARNING)
+    monkeypatch.setattr(logger_module.random, "random", lambda: pytest.fail("sampled a disabled record"))
+    RequestLogger(log, sample_rate=0.5).info("got %s", Unformattable())
+    assert records == []
+
+
+def test_sample_rate_zero_drops_info(recorded):
+    log, records = recorded
+    request_logger = RequestLogger(log, sample_rate=0.0)
+    for _ in range(100):
+        request_logger.info("got %s", Unformattable())
+    assert records == []
+
+
+def test_sample_rate_one_keeps_info_without_drawing(recorded, monkeypatch):
+    log, records = recorded
+    monkeypatch.setattr(logger_module.random, "random", lambda: pytest.fail("drew a sample"))
+    request_logger = RequestLogger(log, sample_rate=1.0)
+    for _ in range(3):
+        request_logger.info("got ids")
+    assert len(records) == 3
+
+
+def test_partial_sample_rate_keeps_draws_below_it(recorded, monkeypatch):
+    log, records = recorded
+    draws = iter([0.1, 0.25, 0.3, 0.9])
+    monkeypatch.setattr(logger_module.random, "random", lambda: next(draws))
+    request_logger = RequestLogger(log, sample_rate=0.25)
+    for i in range(4):
+        request_logger.info("request %d", i)
+    assert [r.getMessage() for r in records] == ["request 0"]
+
+
+def test_warnings_and_errors_are_never_sampled(recorded):
+    log, records = recorded
+    request_logger = RequestLogger(log, sample_rate=0.0)
+    request_logger.warning("slow %s", "catalog")
+    request_logger.error("failed %s", "catalog")
+    assert [(r.levelno, r.getMessage()) for r in records] == [
+        (logging.WARNING, "slow catalog"),
+        (logging.ERROR, "failed catalog"),
+    ]
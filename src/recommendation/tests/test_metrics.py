@@ -0,0 +1,61 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import grpc
+import pytest
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from opentelemetry.sdk.trace import TracerProvider
+
+from metrics import RPC_BUCKETS, RpcMetrics, init_metrics
+
+
+@pytest.fixture
+def sdk_metrics():
+    reader = InMemoryMetricReader()
+    meter = MeterProvider(metric_readers=[reader]).get_meter("recommendation-test")
+    return reader, init_metrics(meter)
+
+
+def collect(reader):
+    return {
+        metric.name: metric.data.data_points
+        for resource_metrics in reader.get_metrics_data().resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+    }
+
+
+def test_rpc_duration_by_method_and_status(sdk_metrics):
+    reader, rec_svc_metrics = sdk_metrics
+    rpc = RpcMetrics(rec_svc_metrics, "ListRecommendations")
+
+    with rpc.call():
+        assert collect(reader)["app_recommendation_requests_in_flight"][0].value == 1
+    with pytest.raises(RuntimeError):
+        with rpc.call() as call:
+            call.status = grpc.StatusCode.UNAVAILABLE
+            raise RuntimeError("catalog down")
+    with pytest.raises(RuntimeError):
+        with rpc.call():
+            raise RuntimeError("bug")
+
+    points = collect(reader)
+    assert points["app_recommendation_requests_in_flight"][0].value == 0
+    durations = {p.attributes["rpc.grpc.status_code"]: p for p in points["app_recommendation_rpc_duration"]}
+    assert set(durations) == {0, 14, 2}
+    assert all(p.attributes["rpc.method"] == "ListRecommendations" for p in durations.values())
+    assert tuple(durations[0].explicit_bounds) == RPC_BUCKETS
+
+
+def test_exemplars_link_to_the_sampled_span(sdk_metrics):
+    reader, rec_svc_metrics = sdk_metrics
+    tracer = TracerProvider().get_tracer("recommendation-test")
+
+    with tracer.start_as_current_span("ListRecommendations") as span:
+        rec_svc_metrics["app_recommendation_selection_duration"].record(0.0002)
+
+    (point,) = collect(reader)["app_recommendation_selection_duration"]
+    (exemplar,) = point.exemplars
+    assert exemplar.trace_id == span.get_span_context().trace_id
+    assert exemplar.span_id == span.get_span_context().span_id
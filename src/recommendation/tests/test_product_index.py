@@ -0,0 +1,30 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from product_index import ProductIndex
+
+
+@pytest.mark.parametrize("size", [1, 5, 6, 10, 1000])
+def test_sample_excludes_requested_ids(size):
+    index = ProductIndex(f"P{i}" for i in range(size))
+    excluded_ids = ["P0", "P3", "unknown"]
+    excluded = index.positions_of(excluded_ids)
+
+    for _ in range(50):
+        result = index.sample(5, excluded)
+        assert len(result) == min(5, size - len(excluded))
+        assert len(set(result)) == len(result)
+        assert not set(result) & set(excluded_ids)
+
+
+def test_duplicates_are_collapsed():
+    index = ProductIndex(["A", "B", "A", "B", "C"])
+    assert index.product_ids == ("A", "B", "C")
+    assert sorted(index.sample(5)) == ["A", "B", "C"]
+
+
+def test_everything_excluded():
+    index = ProductIndex(["A", "B"])
+    assert index.sample(5, index.positions_of(["A", "B"])) == []
@@ -0,0 +1,59 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from request_parsing import InvalidProductIdsError, normalize_product_ids
+
+
+@pytest.mark.parametrize("product_ids,expected", [
+    ([], []),
+    (["OLJCESPC7Z"], ["OLJCESPC7Z"]),
+    (["OLJCESPC7Z", "66VCHSJNUP"], ["OLJCESPC7Z", "66VCHSJNUP"]),
+    (["OLJCESPC7Z,66VCHSJNUP"], ["OLJCESPC7Z", "66VCHSJNUP"]),
+    (list("OLJCESPC7Z,66VCHSJNUP"), ["OLJCESPC7Z", "66VCHSJNUP"]),
+    ([" OLJCESPC7Z ", "", "66VCHSJNUP,"], ["OLJCESPC7Z", "66VCHSJNUP"]),
+    (["A"], ["A"]),
+    (["A", "B"], ["A", "B"]),
+    (["1", "2", "3"], ["1", "2", "3"]),
+    ([" A"], ["A"]),
+    ([" A", ""], ["A"]),
+    ([" A", "  ", "B "], ["A", "B"]),
+    (["A\t", "B"], ["A", "B"]),
+    (["A B", "C"], ["A B", "C"]),
+    (["A,B", "C"], ["A", "B", "C"]),
+])
+def test_normalize(product_ids, expected):
+    assert normalize_product_ids(product_ids) == expected
+
+
+def test_repeated_ids_are_not_glued_together():
+    # The old ''.join(...).split(',') turned this into ["AB"]
+    assert normalize_product_ids(["A1", "B2"]) == ["A1", "B2"]
+
+
+@pytest.mark.parametrize("product_ids", [
+    [f"P{i}" for i in range(20)],
+    [",".join(f"P{i}" for i in range(20))],
+    list(",".join(f"P{i}" for i in range(20))),
+])
+def test_number_of_ids_is_capped(product_ids):
+    assert normalize_product_ids(product_ids, max_ids=5) == [f"P{i}" for i in range(5)]
+
+
+@pytest.mark.parametrize("product_ids", [
+    ["A", ""],
+    ["A,,B"],
+    [" A"],
+    list("AB,CD"),
+    [f"P{i}" for i in range(6)],
+    [",".join(f"P{i}" for i in range(6))],
+])
+def test_strict_mode_rejects_malformed_input(product_ids):
+    with pytest.raises(InvalidProductIdsError):
+        normalize_product_ids(product_ids, max_ids=5, strict=True)
+
+
+@pytest.mark.parametrize("product_ids", [["A1", "B2"], ["A", "B"], ["1", "2", "3"]])
+def test_strict_mode_accepts_well_formed_input(product_ids):
+    assert normalize_product_ids(product_ids, strict=True) == product_ids
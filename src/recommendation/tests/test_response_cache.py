@@ -0,0 +1,43 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import itertools
+
+from response_cache import ResponseCache
+
+
+def counter():
+    values = itertools.count()
+    return lambda: [f"P{next(values)}"]
+
+
+def test_hits_reuse_the_candidate_pool(rec_svc_metrics):
+    cache = ResponseCache(rec_svc_metrics, pool_size=3)
+    compute = counter()
+    first = cache.get(1, {0}, compute)
+    results = {cache.get(1, {0}, compute) for _ in range(50)}
+
+    assert first in results
+    assert results <= {("P0",), ("P1",), ("P2",)}
+    assert compute() == ["P3"]
+
+
+def test_key_includes_snapshot_version_and_exclusions(rec_svc_metrics):
+    cache = ResponseCache(rec_svc_metrics, pool_size=1)
+    compute = counter()
+    assert cache.get(1, {0}, compute) == ("P0",)
+    assert cache.get(1, {1}, compute) == ("P1",)
+    assert cache.get(2, {0}, compute) == ("P2",)
+    assert cache.get(1, {0}, compute) == ("P0",)
+
+
+def test_expired_and_evicted_entries_are_recomputed(rec_svc_metrics):
+    cache = ResponseCache(rec_svc_metrics, max_entries=1, pool_size=1)
+    compute = counter()
+    cache.get(1, {0}, compute)
+    cache.get(1, {1}, compute)
+    assert cache.get(1, {0}, compute) == ("P2",)
+
+    cache.ttl_seconds = 0
+    cache.get(1, {1}, compute)
+    assert cache.get(1, {1}, compute) == ("P4",)
@@ -0,0 +1,162 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import asyncio
+import time
+
+import grpc
+import pytest
+from opentelemetry.trace import NoOpTracer
+
+import demo_pb2
+import recommendation_server
+from cache_leak import CacheLeak
+from catalog_cache import CatalogSnapshot
+from health import InFlightRequests
+from logger import RequestLogger
+from product_index import ProductIndex
+from span_attributes import SpanAttributePolicy
+from user_history import UserHistory
+
+
+class Aborted(Exception):
+    pass
+
+
+class Context:
+    def __init__(self):
+        self.code = None
+
+    def abort(self, code, details):
+        self.code = code
+        raise Aborted(details)
+
+
+class AsyncContext(Context):
+    async def abort(self, code, details):
+        super().abort(code, details)
+
+
+class Flags:
+    def get_boolean_value(self, flag_name, default):
+        return False
+
+    async def get_boolean_value_async(self, flag_name, default):
+        return False
+
+
+class ChangingCatalog:
+    """A catalog that is replaced by a new one, with new product ids, on every read."""
+
+    def __init__(self, size=6):
+        self.size = size
+        self.reads = 0
+
+    def _next(self):
+        self.reads += 1
+        product_ids = tuple(f"V{self.reads}-P{i}" for i in range(self.size))
+        return CatalogSnapshot(self.reads, product_ids, time.monotonic(), ProductIndex(product_ids))
+
+    def get(self):
+        return self._next()
+
+    async def get_async(self):
+        return self._next()
+
+
+class StableCatalog(ChangingCatalog):
+    def _next(self):
+        self.reads += 1
+        product_ids = tuple(f"P{i}" for i in range(self.size))
+        return CatalogSnapshot(1, product_ids, time.monotonic(), ProductIndex(product_ids))
+
+
+@pytest.fixture
+def server(monkeypatch, rec_svc_metrics, logger):
+    for name, value in {
+        'tracer': NoOpTracer(),
+        'rec_svc_metrics': rec_svc_metrics,
+        'flag_cache': Flags(),
+        'cache_leak': CacheLeak(),
+        'span_attributes': SpanAttributePolicy(),
+        'request_logger': RequestLogger(logger),
+        'max_request_product_ids': 1000,
+        'max_batch_requests': 4,
+        'strict_requests': False,
+        'response_cache': None,
+        'user_history': None,
+    }.items():
+        monkeypatch.setattr(recommendation_server, name, value, raising=False)
+
+    def use_catalog(catalog):
+        monkeypatch.setattr(recommendation_server, 'catalog_cache', catalog, raising=False)
+        return catalog
+    return use_catalog
+
+
+def batch(*requests_product_ids):
+    return demo_pb2.ListRecommendationsBatchRequest(requests=[
+        demo_pb2.ListRecommendationsRequest(user_id=f"user-{i}", product_ids=product_ids)
+        for i, product_ids in enumerate(requests_product_ids)])
+
+
+def call_batch(mode, request, context=None):
+    in_flight = InFlightRequests(10)
+    if mode == "thread":
+        context = context or Context()
+        return recommendation_server.RecommendationService(in_flight).ListRecommendationsBatch(request, context)
+
+    async def call():
+        service = recommendation_server.AsyncRecommendationService(in_flight)
+        return await service.ListRecommendationsBatch(request, context or AsyncContext())
+    return asyncio.run(call())
+
+
+@pytest.mark.parametrize("mode", ["thread", "aio"])
+def test_batch_responses_are_in_request_order(server, mode):
+    server(StableCatalog(size=6))
+
+    # With 6 products and 5 recommendations, each response is the catalog
+    # without that request's product
+    response = call_batch(mode, batch(["P0"], ["P3"], ["P5"], ["P1"]))
+
+    assert [set(r.product_ids) for r in response.responses] == [
+        {f"P{i}" for i in range(6)} - {excluded} for excluded in ("P0", "P3", "P5", "P1")]
+
+
+@pytest.mark.parametrize("mode", ["thread", "aio"])
+def test_batch_reads_one_catalog_snapshot(server, mode):
+    catalog = server(ChangingCatalog())
+
+    response = call_batch(mode, batch(["A"], ["B"], ["C"], ["D"]))
+
+    assert catalog.reads == 1
+    assert {product_id.split("-")[0] for r in response.responses for product_id in r.product_ids} == {"V1"}
+
+
+@pytest.mark.parametrize("mode", ["thread", "aio"])
+def test_batch_over_the_cap_is_invalid_argument(server, mode):
+    catalog = server(StableCatalog())
+    context = Context() if mode == "thread" else AsyncContext()
+
+    with pytest.raises(Aborted, match="at most 4 requests"):
+        call_batch(mode, batch(*[["P0"]] * 5), context)
+
+    assert context.code == grpc.StatusCode.INVALID_ARGUMENT
+    assert catalog.reads == 0
+
+
+def test_empty_batch_returns_no_responses(server):
+    server(StableCatalog())
+
+    assert list(call_batch("thread", batch()).responses) == []
+
+
+def test_history_records_request_products_in_request_order(server, monkeypatch):
+    server(StableCatalog(size=8))
+    history = UserHistory(history_length=4)
+    monkeypatch.setattr(recommendation_server, 'user_history', history)
+
+    recommendation_server.get_product_list(["P6", "P1", "unknown", "P4"], "u1")
+
+    assert history.get("u1") == ["P4", "P1", "P6"]
@@ -0,0 +1,46 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.trace import INVALID_SPAN
+
+from span_attributes import SpanAttributePolicy
+
+
+@pytest.fixture
+def tracer():
+    return TracerProvider().get_tracer("recommendation-test")
+
+
+def test_list_attributes_are_capped(tracer):
+    policy = SpanAttributePolicy(max_list_length=3)
+    with tracer.start_as_current_span("test") as span:
+        policy.set(span, "app.filtered_products.count", 5)
+        policy.set_list(span, "app.filtered_products.list", ["P1", "P2", "P3", "P4", "P5"])
+
+    assert span.attributes["app.filtered_products.count"] == 5
+    assert span.attributes["app.filtered_products.list"] == ("P1", "P2", "P3")
+
+
+def test_lean_mode_keeps_only_scalars(tracer):
+    policy = SpanAttributePolicy(lean=True)
+    with tracer.start_as_current_span("test") as span:
+        policy.set(span, "app.filtered_products.count", 2)
+        policy.set_list(span, "app.filtered_products.list", ["P1", "P2"])
+
+    assert dict(span.attributes) == {"app.filtered_products.count": 2}
+
+
+def test_non_recording_spans_are_left_alone():
+    class Span:
+        def is_recording(self):
+            return False
+
+        def set_attribute(self, key, value):
+            raise AssertionError("attribute set on a non-recording span")
+
+    policy = SpanAttributePolicy()
+    policy.set(Span(), "app.products.count", 1)
+    policy.set_list(Span(), "app.filtered_products.list", ["P1"])
+    policy.set_list(INVALID_SPAN, "app.filtered_products.list", ["P1"])
@@ -0,0 +1,46 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from startup import StartupTimer
+
+
+class Histogram:
+    def __init__(self):
+        self.points = []
+
+    def record(self, amount, attributes=None):
+        self.points.append((amount, attributes))
+
+
+def test_report_phases_as_span_events_and_histogram_points():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    timer = StartupTimer(started_ns=1_000_000_000)
+    timer.mark("imports", 1_000_000_000, 1_200_000_000)
+    timer.mark("catalog", 1_200_000_000, 1_250_000_000)
+    histogram = Histogram()
+
+    timer.report(provider.get_tracer("test"), histogram)
+
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "startup"
+    assert (span.start_time, span.end_time) == (1_000_000_000, 1_250_000_000)
+    assert [(e.name, e.attributes["startup.phase.duration"]) for e in span.events] == [
+        ("startup.imports", 0.2), ("startup.catalog", 0.05)]
+    assert histogram.points == [(0.2, {"startup.phase": "imports"}), (0.05, {"startup.phase": "catalog"})]
+
+
+def test_phase_context_manager_records_even_on_error():
+    timer = StartupTimer(started_ns=0)
+    try:
+        with timer.phase("flagd"):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    ((name, start, end),) = timer.phases
+    assert name == "flagd" and start <= end
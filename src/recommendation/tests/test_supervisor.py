@@ -0,0 +1,133 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import os
+import signal
+import time
+
+import pytest
+
+import supervisor
+from supervisor import Supervisor
+
+# Worker targets run in spawned processes, which import this module again.
+# They keep a marker file per worker index to tell a first start from a
+# restart.
+
+
+def _first_start(index):
+    marker = os.path.join(os.environ['SUPERVISOR_TEST_DIR'], str(index))
+    if os.path.exists(marker):
+        return False
+    open(marker, 'w').close()
+    return True
+
+
+def crash_on_first_start(index, ready):
+    if _first_start(index):
+        os._exit(3)
+    ready[index] = 1
+    time.sleep(60)
+
+
+def ready_on_first_start(index, ready):
+    if _first_start(index):
+        ready[index] = 1
+    time.sleep(60)
+
+
+def ignore_sigterm(index, ready):
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    ready[index] = 1
+    time.sleep(60)
+
+
+def wait_for(predicate, timeout=20.0):
+    end = time.monotonic() + timeout
+    while time.monotonic() < end:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+@pytest.fixture(autouse=True)
+def marker_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv('SUPERVISOR_TEST_DIR', str(tmp_path))
+
+
+@pytest.fixture
+def make_supervisor():
+    supervisors = []
+
+    def make(target, num_workers=2, shutdown_grace_seconds=1.0):
+        sup = Supervisor(num_workers, shutdown_grace_seconds, target=target, restart_backoff_seconds=0)
+        supervisors.append(sup)
+        return sup
+
+    yield make
+    for sup in supervisors:
+        for worker in sup.workers:
+            if worker is not None and worker.is_alive():
+                worker.kill()
+                worker.join()
+
+
+def test_crashed_workers_are_restarted_and_become_ready(make_supervisor):
+    sup = make_supervisor(crash_on_first_start)
+    sup.start()
+    first_pids = [worker.pid for worker in sup.workers]
+
+    restarted = set()
+    assert wait_for(lambda: restarted.update(sup.restart_exited(timeout=0.1)) or restarted == {0, 1})
+
+    assert [worker.pid for worker in sup.workers] != first_pids
+    assert all(worker.is_alive() for worker in sup.workers)
+    assert wait_for(lambda: sup.ready)
+
+
+def test_worker_exit_clears_its_ready_flag(make_supervisor):
+    sup = make_supervisor(ready_on_first_start)
+    sup.start()
+    assert wait_for(lambda: sup.ready)
+
+    os.kill(sup.workers[0].pid, signal.SIGKILL)
+    assert wait_for(lambda: sup.restart_exited(timeout=0.1) == [0])
+
+    # The replacement does not report ready, so neither does the supervisor
+    time.sleep(0.5)
+    assert not sup.ready
+    assert sup.workers[0].is_alive()
+
+
+def test_drain_terminates_workers(make_supervisor):
+    sup = make_supervisor(ready_on_first_start)
+    sup.start()
+    assert wait_for(lambda: sup.ready)
+
+    sup.drain()
+
+    assert [worker.exitcode for worker in sup.workers] == [-signal.SIGTERM, -signal.SIGTERM]
+    assert not sup.ready
+
+
+def test_drain_kills_workers_that_outlive_the_grace_period(make_supervisor, monkeypatch):
+    monkeypatch.setattr(supervisor, 'EXIT_GRACE_SECONDS', 0.0)
+    sup = make_supervisor(ignore_sigterm, num_workers=1, shutdown_grace_seconds=0.2)
+    sup.start()
+    assert wait_for(lambda: sup.ready)
+
+    started = time.monotonic()
+    sup.drain()
+
+    assert sup.workers[0].exitcode == -signal.SIGKILL
+    assert time.monotonic() - started < 5
+
+
+def test_stopped_supervisor_does_not_restart_workers(make_supervisor):
+    sup = make_supervisor(crash_on_first_start, num_workers=1)
+    sup.start()
+    sup.stop()
+    sup.workers[0].join()
+
+    assert sup.restart_exited(timeout=0.1) == []
@@ -0,0 +1,94 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+
+from user_history import PRODUCT_BYTES, USER_BYTES, UserHistory
+
+
+def test_history_is_most_recent_first_and_distinct():
+    history = UserHistory(history_length=3)
+    assert history.visit("u1", ["A"]) == []
+    assert history.visit("u1", ["B", "A"]) == ["A"]
+    # A, viewed again, is the most recent product
+    assert history.visit("u1", ["C", "D"]) == ["A", "B"]
+    # The ring holds the last 3 distinct products
+    assert history.get("u1") == ["D", "C", "A"]
+    assert history.get("u2") == []
+
+
+def test_product_viewed_again_moves_to_the_front():
+    history = UserHistory(history_length=3)
+    history.visit("u1", ["A", "B", "C"])
+    history.visit("u1", ["A"])
+    assert history.get("u1") == ["A", "C", "B"]
+    # Once the ring has wrapped around
+    history.visit("u1", ["D", "C"])
+    assert history.get("u1") == ["C", "D", "A"]
+    history.visit("u1", ["C"])
+    assert history.get("u1") == ["C", "D", "A"]
+
+
+def test_anonymous_requests_are_not_recorded():
+    history = UserHistory()
+    assert history.visit("", ["A"]) == []
+    assert len(history) == 0
+
+
+def test_least_recently_seen_users_are_evicted_within_budget():
+    user_cost = USER_BYTES + len("u0") + 4 * 2
+    history = UserHistory(max_bytes=PRODUCT_BYTES + 1 + 3 * user_cost, history_length=2)
+    for user_id in ("u0", "u1", "u2"):
+        history.visit(user_id, ["A"])
+    history.visit("u0", [])
+    history.visit("u3", ["A"])
+
+    assert len(history) == 3
+    assert history.get("u1") == []
+    assert history.get("u0") == ["A"]
+    assert history.size_bytes <= history.max_bytes
+    # The evicted user's ring is reused
+    assert len(history._rings) == 3 * 2
+
+
+def test_product_ids_are_released_when_no_history_holds_them():
+    user_cost = USER_BYTES + len("u1") + 4 * 2
+    history = UserHistory(max_bytes=2 * user_cost + 4 * (PRODUCT_BYTES + 1), history_length=2)
+    history.visit("u1", ["A", "B"])
+    # A drops out of u1's ring and is released; D reuses its number
+    history.visit("u1", ["C"])
+    assert "A" not in history._numbers
+    history.visit("u2", ["B", "D"])
+    assert len(history._product_ids) == 3
+    # Evicting u1 releases C but not B, which u2 still holds
+    history.visit("u3", ["E"])
+    assert history.get("u1") == []
+    assert sorted(history._numbers) == ["B", "D", "E"]
+    assert len(history._product_ids) == 3
+    assert history.size_bytes == 2 * user_cost + 3 * (PRODUCT_BYTES + 1)
+
+
+def test_budget_too_small_for_a_user():
+    history = UserHistory(max_bytes=10)
+    assert history.visit("u1", ["A"]) == []
+    assert len(history) == 0
+
+
+def test_concurrent_visits():
+    history = UserHistory(max_bytes=50 * (USER_BYTES + 10 + 32) + 100 * PRODUCT_BYTES)
+
+    def worker(n):
+        for i in range(2000):
+            history.visit(f"user-{(n * 7 + i) % 200}", [f"P{i % 20}"])
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert history.size_bytes <= history.max_bytes
+    assert len(history._users) + len(history._free_slots) == len(history._rings) // history.history_length
+    # Every interned id is held by some ring, and every ring entry is counted
+    assert sum(history._refs) == sum(user.count for user in history._users.values())
+    assert all(history._refs[number] > 0 for number in history._numbers.values())
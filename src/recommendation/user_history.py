@@ -0,0 +1,175 @@
+#!/usr/bin/python
+
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Iterable, List
+
+from opentelemetry.metrics import Observation
+
+# Memory a user costs on top of their ring and the characters of their id: the
+# OrderedDict entry and table slack, the id's str header and the _User record.
+# Rounded up from what benchmarks/bench_user_history.py measures.
+USER_BYTES = 220
+# Memory of one interned product id: dict entry, list slots and str
+PRODUCT_BYTES = 128
+
+
+class _User:
+    __slots__ = ("slot", "head", "count")
+
+    def __init__(self, slot: int):
+        self.slot = slot
+        self.head = 0
+        self.count = 0
+
+
+class UserHistory:
+    """Recently viewed and carted products of each user, in a memory budget.
+
+    A ListRecommendations call names the product a user is viewing or the
+    products in their cart, so every call adds those products to its user's
+    history. Each user keeps the last ``history_length`` distinct products in
+    a ring, and a product viewed again moves to the front; the rings of all
+    users are slices of one ``array('i')`` of interned product numbers, so a
+    user costs a small fixed record rather than a list of strings. Interned
+    ids are reference counted and released, their numbers reused, once no
+    ring holds them. Users are kept in LRU order and the least recently seen
+    ones are evicted, their slices reused, whenever the estimated memory use
+    would exceed ``max_bytes``.
+
+    ``visit()`` is O(history_length) and takes one short lock.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20, history_length: int = 8):
+        self.max_bytes = max_bytes
+        self.history_length = history_length
+        self._users = OrderedDict()
+        self._rings = array("i")
+        self._empty_ring = array("i", [0] * history_length)
+        self._free_slots = []
+        self._numbers = {}
+        self._product_ids = []
+        # Number of ring entries holding each product number
+        self._refs = []
+        self._free_numbers = []
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Number of users with a history."""
+        return len(self._users)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def visit(self, user_id: str, product_ids: Iterable[str]) -> List[str]:
+        """Return the user's history, most recent first, then add ``product_ids`` to it.
+
+        ``product_ids`` are added in order, so the last one is the most
+        recent. Callers only pass product ids that are in the catalog, which
+        bounds the number of interned ids.
+        """
+        if not user_id:
+            return []
+        with self._lock:
+            user = self._users.get(user_id)
+            if user is None:
+                history = []
+                user = self._add_user(user_id)
+                if user is None:
+                    return history
+            else:
+                self._users.move_to_end(user_id)
+                history = self._history(user)
+            for product_id in product_ids:
+                self._push(user, self._intern(product_id))
+            return history
+
+    def get(self, user_id: str) -> List[str]:
+        with self._lock:
+            user = self._users.get(user_id)
+            return [] if user is None else self._history(user)
+
+    def observe_size(self, options):
+        """Observable gauge callback: estimated bytes held by the store."""
+        yield Observation(self._bytes)
+
+    def _history(self, user: _User) -> List[str]:
+        rings, product_ids, length = self._rings, self._product_ids, self.history_length
+        base = user.slot * length
+        return [product_ids[rings[base + (user.head - i - 1) % length]] for i in range(user.count)]
+
+    def _entries(self, user: _User) -> List[int]:
+        """The user's product numbers, oldest first."""
+        rings, length = self._rings, self.history_length
+        base = user.slot * length
+        return [rings[base + (user.head - user.count + i) % length] for i in range(user.count)]
+
+    def _push(self, user: _User, number: int):
+        rings, length = self._rings, self.history_length
+        base, head, count = user.slot * length, user.head, user.count
+        for i in range(1, count + 1):
+            pos = base + (head - i) % length
+            if rings[pos] == number:
+                # Viewed again: shift the newer products back and put it in front
+                for j in range(i - 1, 0, -1):
+                    newer = base + (head - j) % length
+                    rings[pos] = rings[newer]
+                    pos = newer
+                rings[pos] = number
+                return
+        self._refs[number] += 1
+        pos = base + head
+        if count == length:
+            self._release(rings[pos])
+        else:
+            user.count = count + 1
+        rings[pos] = number
+        user.head = (head + 1) % length
+
+    def _intern(self, product_id: str) -> int:
+        number = self._numbers.get(product_id)
+        if number is None:
+            if self._free_numbers:
+                number = self._free_numbers.pop()
+                self._product_ids[number] = product_id
+            else:
+                number = len(self._product_ids)
+                self._product_ids.append(product_id)
+                self._refs.append(0)
+            self._numbers[product_id] = number
+            self._bytes += PRODUCT_BYTES + len(product_id)
+        return number
+
+    def _release(self, number: int):
+        self._refs[number] -= 1
+        if self._refs[number] == 0:
+            product_id = self._product_ids[number]
+            del self._numbers[product_id]
+            self._product_ids[number] = None
+            self._free_numbers.append(number)
+            self._bytes -= PRODUCT_BYTES + len(product_id)
+
+    def _add_user(self, user_id: str):
+        cost = USER_BYTES + len(user_id) + 4 * self.history_length
+        while self._users and self._bytes + cost > self.max_bytes:
+            evicted_id, evicted = self._users.popitem(last=False)
+            self._bytes -= USER_BYTES + len(evicted_id) + 4 * self.history_length
+            for number in self._entries(evicted):
+                self._release(number)
+            self._free_slots.append(evicted.slot)
+        if self._bytes + cost > self.max_bytes:
+            return None
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = len(self._rings) // self.history_length
+            self._rings.extend(self._empty_ring)
+        self._bytes += cost
+        user = self._users[user_id] = _User(slot)
+        return user
@@ -1,6 +1,9 @@
+import os
 import time
+import grpc
 import requests
 import pytest
+from grpc_health.v1 import health_pb2, health_pb2_grpc
 
 # Service → health‑check URL
 SERVICES = {
@@ -26,3 +29,25 @@ def wait_until_healthy(url, timeout_s=60, interval_s=3):
 def test_service_health(service, url):
     res = wait_until_healthy(url)
     assert 200 <= res.status_code < 400, f"{service} unhealthy: {res.status_code}"
+
+# gRPC services that implement the streaming health Watch: instead of polling,
+# wait on one stream until the service reports SERVING.
+GRPC_SERVICES = {
+    "recommendation": os.getenv("RECOMMENDATION_ADDR", "recommendation:9001"),
+}
+
+def wait_until_serving(address, timeout_s=60):
+    """Block on a health Watch stream until *address* reports SERVING."""
+    with grpc.insecure_channel(address) as channel:
+        stub = health_pb2_grpc.HealthStub(channel)
+        try:
+            for response in stub.Watch(health_pb2.HealthCheckRequest(), timeout=timeout_s, wait_for_ready=True):
+                if response.status == health_pb2.HealthCheckResponse.SERVING:
+                    return
+        except grpc.RpcError as err:
+            raise RuntimeError(f"{address} never reported SERVING within {timeout_s}s: {err.code()}") from err
+    raise RuntimeError(f"{address} closed the health stream before reporting SERVING")
+
+@pytest.mark.parametrize("service,address", GRPC_SERVICES.items())
+def test_grpc_service_serving(service, address):
+    wait_until_serving(address)